@@ -9,6 +9,8 @@ from .dataset.interferometer import (
 )
 
 from autoarray import Grid2DIterate
+from .iterate import Grid2DIterateAdaptive
+from .iterate import Grid2DPixelIntegration
 from autoarray import Grid2DInterpolate
 from autoarray import Mask2D
 from autoarray import Grid2DIrregular
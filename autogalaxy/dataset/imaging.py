@@ -1,10 +1,13 @@
 import copy
 
 import numpy as np
+from autoconf import conf
 from autoarray.structures import arrays
 from autoarray.structures import grids
 from autoarray.structures import kernel
 from autoarray.dataset import imaging
+from autogalaxy import exc
+from autogalaxy import iterate
 from autogalaxy.plane import plane as pl
 
 
@@ -22,6 +25,8 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
         signal_to_noise_limit=None,
         psf_shape_2d=None,
         renormalize_psf=True,
+        pixel_integration=False,
+        precision="float64",
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -34,7 +39,10 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
         ----------
         grid_class : ag.Grid2D
             The type of grid used to create the image from the `Galaxy` and `Plane`. The options are `Grid2D`,
-            `Grid2DIterate` and `Grid2DInterpolate` (see the `Grid2D` documentation for a description of these options).
+            `Grid2DIterate`, `Grid2DIterateAdaptive` and `Grid2DInterpolate` (see the `Grid2D` documentation for a
+            description of these options). A `Grid2DIterateAdaptive` chooses the sub-size of every pixel from the
+            curvature of the image and evaluates the pixels at the centre of every light profile at the highest
+            sub-size, refining only the pixels which need it to meet the fractional accuracy.
         grid_inversion_class : ag.Grid2D
             The type of grid used to create the grid that maps the `Inversion` source pixels to the data's image-pixels.
             The options are `Grid2D`, `Grid2DIterate` and `Grid2DInterpolate` (see the `Grid2D` documentation for a
@@ -42,19 +50,33 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
         sub_size : int
             If the grid and / or grid_inversion use a `Grid2D`, this sets the sub-size used by the `Grid2D`.
         fractional_accuracy : float
-            If the grid and / or grid_inversion use a `Grid2DIterate`, this sets the fractional accuracy it
-            uses when evaluating functions.
+            If the grid and / or grid_inversion use a `Grid2DIterate` or `Grid2DIterateAdaptive`, this sets the
+            fractional accuracy it uses when evaluating functions.
         sub_steps : [int]
-            If the grid and / or grid_inversion use a `Grid2DIterate`, this sets the steps the sub-size is increased by
-            to meet the fractional accuracy when evaluating functions.
+            If the grid and / or grid_inversion use a `Grid2DIterate` or `Grid2DIterateAdaptive`, this sets the steps
+            the sub-size is increased by to meet the fractional accuracy when evaluating functions.
         pixel_scales_interp : float or (float, float)
             If the grid and / or grid_inversion use a `Grid2DInterpolate`, this sets the resolution of the interpolation
             grid.
         signal_to_noise_limit : float
             If input, the dataset's noise-map is rescaled such that no pixel has a signal-to-noise above the
             signa to noise limit.
+        pixel_integration : bool
+            If `True` and the grid uses a `Grid2D`, it is a `Grid2DPixelIntegration` on which the images of Gaussian
+            light profiles are integrated analytically over every (sub-)pixel, such that they are exact without
+            sub-gridding.
+        precision : str
+            The precision the grid and blurring grid are stored in, either "float64" or "float32". If "float32" and
+            the grid is a `Grid2D`, the images and deflection angles of profiles evaluated on these grids are computed
+            and stored in single precision (e.g. for early, low precision stages of a non-linear search), whereas
+            the residuals, chi-squared and likelihood of a fit are still computed in double precision.
         """
 
+        if precision not in ("float32", "float64"):
+            raise exc.DatasetException(
+                "The precision of SettingsMaskedImaging must be float32 or float64"
+            )
+
         super().__init__(
             grid_class=grid_class,
             grid_inversion_class=grid_inversion_class,
@@ -69,6 +91,47 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
             renormalize_psf=renormalize_psf,
         )
 
+        self.pixel_integration = pixel_integration
+        self.precision = precision
+
+    def grid_from_mask(self, mask):
+
+        if self.pixel_integration and self.grid_class is grids.Grid2D:
+            return iterate.Grid2DPixelIntegration.from_mask(mask=mask)
+
+        if self.grid_class is iterate.Grid2DIterateAdaptive:
+            return iterate.Grid2DIterateAdaptive.from_mask(
+                mask=mask,
+                fractional_accuracy=self.fractional_accuracy,
+                sub_steps=self.sub_steps,
+            )
+
+        return super().grid_from_mask(mask=mask)
+
+    @property
+    def grid_sub_size_tag(self):
+
+        grid_sub_size_tag = super().grid_sub_size_tag
+
+        if self.pixel_integration and self.grid_class is grids.Grid2D:
+            grid_sub_size_tag = f"{grid_sub_size_tag}_pixel_integration"
+
+        if self.precision == "float32" and self.grid_class is grids.Grid2D:
+            grid_sub_size_tag = f"{grid_sub_size_tag}_float32"
+
+        return grid_sub_size_tag
+
+    @property
+    def grid_fractional_accuracy_tag(self):
+
+        if self.grid_class is iterate.Grid2DIterateAdaptive:
+            return (
+                f"{conf.instance['notation']['settings_tags']['dataset']['fractional_accuracy']}_"
+                f"adaptive_{str(self.fractional_accuracy)}"
+            )
+
+        return super().grid_fractional_accuracy_tag
+
 
 class MaskedImaging(imaging.MaskedImaging):
     def __init__(self, imaging, mask, settings=SettingsMaskedImaging()):
@@ -103,6 +166,13 @@ class MaskedImaging(imaging.MaskedImaging):
             imaging=imaging, mask=mask, settings=settings
         )
 
+        if settings.precision == "float32" and isinstance(self.grid, grids.Grid2D):
+
+            self.grid = self.grid.astype("float32")
+
+            if self.psf is not None:
+                self.blurring_grid = self.blurring_grid.astype("float32")
+
 
 class SimulatorImaging(imaging.SimulatorImaging):
     def __init__(
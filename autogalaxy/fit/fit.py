@@ -3,6 +3,7 @@ import numpy as np
 from autoconf import conf
 from autoarray.fit import fit as aa_fit
 from autoarray.inversion import pixelizations as pix, inversions as inv
+from autoarray.structures import grids
 from autogalaxy.galaxy import galaxy as g
 
 
@@ -30,6 +31,10 @@ class FitImaging(aa_fit.FitImaging):
 
         self.plane = plane
 
+        self._images_of_galaxies = None
+        self._blurring_images_of_galaxies = None
+        self._blurred_images_of_galaxies = None
+
         if use_hyper_scalings:
 
             image = hyper_image_from_image_and_hyper_image_sky(
@@ -57,11 +62,28 @@ class FitImaging(aa_fit.FitImaging):
             image = masked_imaging.image
             noise_map = masked_imaging.noise_map
 
-        self.blurred_image = plane.blurred_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
-        )
+        if plane.galaxies and not isinstance(masked_imaging.grid, grids.Grid2DIterate):
+
+            self._images_of_galaxies = plane.images_of_galaxies_from_grid(
+                grid=masked_imaging.grid
+            )
+            self._blurring_images_of_galaxies = plane.images_of_galaxies_from_grid(
+                grid=masked_imaging.blurring_grid
+            )
+
+            self.blurred_image = plane.blurred_image_from_images_of_galaxies_and_convolver(
+                images_of_galaxies=self._images_of_galaxies,
+                blurring_images_of_galaxies=self._blurring_images_of_galaxies,
+                convolver=masked_imaging.convolver,
+            )
+
+        else:
+
+            self.blurred_image = plane.blurred_image_from_grid_and_convolver(
+                grid=masked_imaging.grid,
+                convolver=masked_imaging.convolver,
+                blurring_grid=masked_imaging.blurring_grid,
+            )
 
         self.profile_subtracted_image = image - self.blurred_image
 
@@ -98,16 +120,58 @@ class FitImaging(aa_fit.FitImaging):
     def grid(self):
         return self.masked_imaging.grid
 
+    @property
+    def images_of_galaxies(self):
+        """
+        The image of every galaxy of the plane on the masked grid, which is computed once per fit and shared by the
+        blurred image and every quantity derived from the images of the galaxies.
+
+        For a `Grid2DIterate` the blurred image iterates the summed image of the plane, so the images of the
+        galaxies are only computed when first used.
+        """
+        if self._images_of_galaxies is None:
+            self._images_of_galaxies = self.plane.images_of_galaxies_from_grid(
+                grid=self.grid
+            )
+
+        return self._images_of_galaxies
+
+    @property
+    def blurring_images_of_galaxies(self):
+        """
+        The image of every galaxy of the plane on the blurring grid, which is computed once per fit (see
+        `images_of_galaxies`).
+        """
+        if self._blurring_images_of_galaxies is None:
+            self._blurring_images_of_galaxies = self.plane.images_of_galaxies_from_grid(
+                grid=self.masked_imaging.blurring_grid
+            )
+
+        return self._blurring_images_of_galaxies
+
+    @property
+    def blurred_images_of_galaxies(self):
+        """
+        The blurred image of every galaxy of the plane, which is computed once per fit from `images_of_galaxies` and
+        `blurring_images_of_galaxies` and shared by `galaxy_model_image_dict` and `model_images_of_galaxies`.
+        """
+        if self._blurred_images_of_galaxies is None:
+            self._blurred_images_of_galaxies = self.plane.blurred_images_of_galaxies_from_images_and_convolver(
+                images_of_galaxies=self.images_of_galaxies,
+                blurring_images_of_galaxies=self.blurring_images_of_galaxies,
+                convolver=self.masked_imaging.convolver,
+            )
+
+        return self._blurred_images_of_galaxies
+
     @property
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
         """
 
-        galaxy_model_image_dict = self.plane.galaxy_blurred_image_dict_from_grid_and_convolver(
-            grid=self.grid,
-            convolver=self.masked_imaging.convolver,
-            blurring_grid=self.masked_imaging.blurring_grid,
+        galaxy_model_image_dict = dict(
+            zip(self.galaxies, self.blurred_images_of_galaxies)
         )
 
         for galaxy in self.galaxies:
@@ -123,19 +187,16 @@ class FitImaging(aa_fit.FitImaging):
     @property
     def model_images_of_galaxies(self):
 
-        model_images_of_galaxies = self.plane.blurred_images_of_galaxies_from_grid_and_psf(
-            grid=self.grid,
-            psf=self.masked_imaging.psf,
-            blurring_grid=self.masked_imaging.blurring_grid,
-        )
+        model_images_of_galaxies = list(self.blurred_images_of_galaxies)
 
         for galaxy_index, galaxy in enumerate(self.galaxies):
 
             if galaxy.has_pixelization:
 
-                model_images_of_galaxies[
-                    galaxy_index
-                ] += self.inversion.mapped_reconstructed_image
+                model_images_of_galaxies[galaxy_index] = (
+                    model_images_of_galaxies[galaxy_index]
+                    + self.inversion.mapped_reconstructed_image
+                )
 
         return model_images_of_galaxies
 
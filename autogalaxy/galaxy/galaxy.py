@@ -6,9 +6,11 @@ from autoarray.structures import arrays, grids
 from autofit.mapper.model_object import ModelObject
 from autogalaxy import exc
 from autogalaxy import lensing
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy.profiles import point_sources as ps
 from autogalaxy.profiles import light_profiles as lp
 from autogalaxy.profiles import mass_profiles as mp
+from autogalaxy.util import interpolation_util
 from autogalaxy.profiles.mass_profiles import (
     dark_mass_profiles as dmp,
     stellar_mass_profiles as smp,
@@ -27,6 +29,10 @@ def is_mass_profile(obj):
     return isinstance(obj, mp.MassProfile)
 
 
+def is_profile(obj):
+    return is_point_source(obj) or is_light_profile(obj) or is_mass_profile(obj)
+
+
 class Galaxy(ModelObject, lensing.LensingObject):
     """
     @DynamicAttrs
@@ -89,19 +95,76 @@ class Galaxy(ModelObject, lensing.LensingObject):
     def __hash__(self):
         return self.id
 
+    def __setattr__(self, name, value):
+        """
+        Sets an attribute of the galaxy, removing its `profile_registry` if the attribute is or was a profile, or is
+        its pixelization, regularization or hyper galaxy, such that the registry is rebuilt when next used.
+        """
+        if (
+            name in ("pixelization", "regularization", "hyper_galaxy")
+            or is_profile(value)
+            or is_profile(self.__dict__.get(name))
+        ):
+            self.__dict__.pop("_profile_registry", None)
+
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+
+        self.__dict__.pop("_profile_registry", None)
+
+        super().__delattr__(name)
+
+    @property
+    def profile_registry(self) -> {str: (str,)}:
+        """
+        A dictionary of the names of the galaxy's attributes which are point sources, light profiles, mass profiles,
+        stellar mass profiles and dark mass profiles, in the order they were set.
+
+        The registry is built by scanning the galaxy's attributes once when first used, and is reused by every
+        property listing the galaxy's profiles until a profile attribute is set or deleted (see `__setattr__`). It
+        stores the names of the attributes rather than the profiles, such that copies of the galaxy whose attributes
+        are replaced (e.g. by autofit) never return the profiles of the original galaxy.
+        """
+        try:
+            return self.__dict__["_profile_registry"]
+        except KeyError:
+            pass
+
+        items = list(self.__dict__.items())
+
+        profile_registry = {
+            "point_source": tuple(
+                name for name, value in items if is_point_source(value)
+            ),
+            "light": tuple(name for name, value in items if is_light_profile(value)),
+            "mass": tuple(name for name, value in items if is_mass_profile(value)),
+            "stellar": tuple(
+                name for name, value in items if isinstance(value, smp.StellarProfile)
+            ),
+            "dark": tuple(
+                name for name, value in items if isinstance(value, dmp.DarkProfile)
+            ),
+        }
+
+        self.__dict__["_profile_registry"] = profile_registry
+
+        return profile_registry
+
     @property
     def point_source_dict(self):
         return {
-            key: value for key, value in self.__dict__.items() if is_point_source(value)
+            name: self.__dict__[name]
+            for name in self.profile_registry["point_source"]
         }
 
     @property
     def light_profiles(self):
-        return [value for value in self.__dict__.values() if is_light_profile(value)]
+        return [self.__dict__[name] for name in self.profile_registry["light"]]
 
     @property
     def mass_profiles(self):
-        return [value for value in self.__dict__.values() if is_mass_profile(value)]
+        return [self.__dict__[name] for name in self.profile_registry["mass"]]
 
     @property
     def has_redshift(self):
@@ -121,15 +184,15 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
     @property
     def has_light_profile(self):
-        return len(self.light_profiles) > 0
+        return len(self.profile_registry["light"]) > 0
 
     @property
     def has_mass_profile(self):
-        return len(self.mass_profiles) > 0
+        return len(self.profile_registry["mass"]) > 0
 
     @property
     def has_profile(self):
-        return len(self.mass_profiles) + len(self.light_profiles) > 0
+        return self.has_mass_profile or self.has_light_profile
 
     def extract_attribute(self, cls, name):
         """
@@ -183,27 +246,19 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
     @property
     def has_stellar_profile(self):
-        return len(self.stellar_profiles) > 0
+        return len(self.profile_registry["stellar"]) > 0
 
     @property
     def has_dark_profile(self):
-        return len(self.dark_profiles) > 0
+        return len(self.profile_registry["dark"]) > 0
 
     @property
     def stellar_profiles(self):
-        return [
-            profile
-            for profile in self.mass_profiles
-            if isinstance(profile, smp.StellarProfile)
-        ]
+        return [self.__dict__[name] for name in self.profile_registry["stellar"]]
 
     @property
     def dark_profiles(self):
-        return [
-            profile
-            for profile in self.mass_profiles
-            if isinstance(profile, dmp.DarkProfile)
-        ]
+        return [self.__dict__[name] for name in self.profile_registry["dark"]]
 
     def stellar_mass_angular_within_circle(self, radius: float):
         if self.has_stellar_profile:
@@ -231,6 +286,32 @@ class Galaxy(ModelObject, lensing.LensingObject):
                 "You cannot perform a dark mass-based calculation on a galaxy which does not have a dark mass-profile"
             )
 
+    def stellar_mass_angular_within_circles(self, radii):
+        if self.has_stellar_profile:
+            return sum(
+                [
+                    profile.mass_angular_within_circles(radii=radii)
+                    for profile in self.stellar_profiles
+                ]
+            )
+        else:
+            raise exc.GalaxyException(
+                "You cannot perform a stellar mass-based calculation on a galaxy which does not have a stellar mass-profile"
+            )
+
+    def dark_mass_angular_within_circles(self, radii):
+        if self.has_dark_profile:
+            return sum(
+                [
+                    profile.mass_angular_within_circles(radii=radii)
+                    for profile in self.dark_profiles
+                ]
+            )
+        else:
+            raise exc.GalaxyException(
+                "You cannot perform a dark mass-based calculation on a galaxy which does not have a dark mass-profile"
+            )
+
     def stellar_fraction_at_radius(self, radius):
         return 1.0 - self.dark_fraction_at_radius(radius=radius)
 
@@ -241,6 +322,19 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
         return dark_mass / (stellar_mass + dark_mass)
 
+    def stellar_fraction_at_radii(self, radii):
+        return 1.0 - self.dark_fraction_at_radii(radii=radii)
+
+    def dark_fraction_at_radii(self, radii):
+        """
+        Returns the fraction of the galaxy's mass that is dark matter within circles of many radii, where the masses
+        of every radius are computed together (see `mass_angular_within_circles`).
+        """
+        stellar_mass = self.stellar_mass_angular_within_circles(radii=radii)
+        dark_mass = self.dark_mass_angular_within_circles(radii=radii)
+
+        return dark_mass / (stellar_mass + dark_mass)
+
     def __repr__(self):
         string = "Redshift: {}".format(self.redshift)
         if self.pixelization:
@@ -278,7 +372,9 @@ class Galaxy(ModelObject, lensing.LensingObject):
         
         If the galaxy has no light profiles, a grid of zeros is returned.
         
-        See *profiles.light_profiles* for a description of how light profile image are computed.
+        See *profiles.light_profiles* for a description of how light profile image are computed. The light profiles \
+        are evaluated together in one pass over the grid by `light_profiles.image_from_grid_via_batch`, unless the grid \
+        is a `Grid2DInterpolate`.
 
         Parameters
         ----------
@@ -287,9 +383,38 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
         """
         if self.has_light_profile:
-            return sum(map(lambda p: p.image_from_grid(grid=grid), self.light_profiles))
+
+            if isinstance(grid, grids.Grid2DInterpolate):
+                return sum(
+                    map(lambda p: p.image_from_grid(grid=grid), self.light_profiles)
+                )
+
+            return lp.image_from_grid_via_batch(
+                light_profiles=self.light_profiles, grid=grid
+            )
         return np.zeros((grid.shape[0],))
 
+    def image_from_array(self, array):
+        """
+        Returns the summed image of all of the galaxy's light profiles on a plain ndarray of (y,x) coordinates of
+        shape [total_coordinates, 2] as an ndarray, which avoids the per-call overhead of the grid decorators and
+        structures of `image_from_grid` when evaluating many small grids (e.g. of point sources).
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.has_light_profile:
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(
+                        lambda p: p.image_from_array(array=array),
+                        self.light_profiles,
+                    )
+                )
+        return np.zeros((array.shape[0],))
+
     def blurred_image_from_grid_and_psf(self, grid, psf, blurring_grid=None):
 
         image = self.image_from_grid(grid=grid)
@@ -339,6 +464,26 @@ class Galaxy(ModelObject, lensing.LensingObject):
                 )
             )
 
+    def luminosity_within_circles(self, radii):
+        """
+        Returns the total luminosity of the galaxy's light profiles within circles of many radii, which are computed
+        together for every light profile.
+
+            See *light_profiles.luminosity_within_circles* for details of how this is performed.
+
+            Parameters
+            ----------
+            radii : np.ndarray
+                The radii of the circles to compute the luminosity within.
+        """
+        if self.has_light_profile:
+            return sum(
+                map(
+                    lambda p: p.luminosity_within_circles(radii=radii),
+                    self.light_profiles,
+                )
+            )
+
     @grids.grid_like_to_structure
     def convergence_from_grid(self, grid):
         """
@@ -358,9 +503,13 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
         """
         if self.has_mass_profile:
-            return sum(
-                map(lambda p: p.convergence_from_grid(grid=grid), self.mass_profiles)
-            )
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(
+                        lambda p: p.convergence_from_grid(grid=grid),
+                        self.mass_profiles,
+                    )
+                )
         return np.zeros((grid.shape[0],))
 
     @grids.grid_like_to_structure
@@ -383,9 +532,13 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
         """
         if self.has_mass_profile:
-            return sum(
-                map(lambda p: p.potential_from_grid(grid=grid), self.mass_profiles)
-            )
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(
+                        lambda p: p.potential_from_grid(grid=grid),
+                        self.mass_profiles,
+                    )
+                )
         return np.zeros((grid.shape[0],))
 
     @grids.grid_like_to_structure
@@ -396,18 +549,133 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
         If the galaxy has no mass profiles, two grid of zeros are returned.
 
-        See *profiles.mass_profiles* module for details of how this is performed.
+        See *profiles.mass_profiles* module for details of how this is performed. If adaptive interpolation is \
+        turned on in the general config, mass profiles flagged in the 'interpolate.ini' config are evaluated via \
+        *util.interpolation_util* (see `deflections_via_adaptive_interpolation_from`).
+
+        The deflection angles of the mass profiles are added into one ndarray in the precision of the grid (see \
+        `add_deflections_from_grid`).
 
         Parameters
         ----------
         grid : grid_like
             The (y, x) coordinates in the original reference frame of the grid.
         """
+        deflections = np.zeros(
+            (grid.shape[0], 2), dtype=np.result_type(np.asarray(grid).dtype, np.float32)
+        )
+
+        return self._add_mass_profile_deflections_from_grid(
+            grid=grid, deflections=deflections
+        )
+
+    def add_deflections_from_grid(self, grid, deflections):
+        """
+        Adds the summed (y,x) deflection angles of the galaxy's mass profiles to a preallocated ndarray of shape
+        [total_coordinates, 2] in place, and returns it.
+
+        Each mass profile's deflection angles are added directly into the ndarray, such that no intermediate sums are
+        created. A `Grid2DIterate` or `Grid2DInterpolate` is instead evaluated via `deflections_from_grid`, so that the
+        galaxy's iteration and interpolation are applied to the summed deflection angles.
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        deflections : np.ndarray
+            The deflection angles which the galaxy's deflection angles are added to.
+        """
+        if isinstance(grid, (grids.Grid2DIterate, grids.Grid2DInterpolate)):
+            return super().add_deflections_from_grid(grid=grid, deflections=deflections)
+
+        return self._add_mass_profile_deflections_from_grid(
+            grid=grid, deflections=deflections
+        )
+
+    def _add_mass_profile_deflections_from_grid(self, grid, deflections):
+
+        with geometry_profiles.transform_cache:
+            for mass_profile in self.mass_profiles:
+                np.add(
+                    deflections,
+                    np.asarray(
+                        interpolation_util.deflections_from_profile_and_grid(
+                            profile=mass_profile, grid=grid
+                        )
+                    ),
+                    out=deflections,
+                )
+
+        return deflections
+
+    def convergence_from_array(self, array):
+        """
+        Returns the summed convergence of the galaxy's mass profiles on a plain ndarray of (y,x) coordinates of shape
+        [total_coordinates, 2] as an ndarray, which avoids the per-call overhead of the grid decorators and
+        structures of `convergence_from_grid`.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
         if self.has_mass_profile:
-            return sum(
-                map(lambda p: p.deflections_from_grid(grid=grid), self.mass_profiles)
-            )
-        return np.zeros((grid.shape[0], 2))
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(
+                        lambda p: p.convergence_from_array(array=array),
+                        self.mass_profiles,
+                    )
+                )
+        return np.zeros((array.shape[0],))
+
+    def potential_from_array(self, array):
+        """
+        Returns the summed gravitational potential of the galaxy's mass profiles on a plain ndarray of (y,x)
+        coordinates of shape [total_coordinates, 2] as an ndarray, which avoids the per-call overhead of the grid
+        decorators and structures of `potential_from_grid`.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.has_mass_profile:
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(
+                        lambda p: p.potential_from_array(array=array),
+                        self.mass_profiles,
+                    )
+                )
+        return np.zeros((array.shape[0],))
+
+    def deflections_from_array(self, array):
+        """
+        Returns the summed (y,x) deflection angles of the galaxy's mass profiles on a plain ndarray of (y,x)
+        coordinates of shape [total_coordinates, 2] as an ndarray, which avoids the per-call overhead of the grid
+        decorators and structures of `deflections_from_grid`.
+
+        Adaptive interpolation of the deflection angles is not used, as it only applies to uniform grids.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        deflections = np.zeros(
+            (array.shape[0], 2), dtype=np.result_type(array.dtype, np.float32)
+        )
+
+        with geometry_profiles.transform_cache:
+            for mass_profile in self.mass_profiles:
+                np.add(
+                    deflections,
+                    mass_profile.deflections_from_array(array=array),
+                    out=deflections,
+                )
+
+        return deflections
 
     def mass_angular_within_circle(self, radius: float):
         """ Integrate the mass profiles's convergence profile to compute the total mass within a circle of \
@@ -440,6 +708,30 @@ class Galaxy(ModelObject, lensing.LensingObject):
                 "You cannot perform a mass-based calculation on a galaxy which does not have a mass-profile"
             )
 
+    def mass_angular_within_circles(self, radii):
+        """
+        Returns the total angular mass of the galaxy's mass profiles within circles of many radii, which are computed
+        together for every mass profile.
+
+        See *mass_profiles.mass_angular_within_circles* for details of how this is performed.
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the dimensionless mass within.
+        """
+        if self.has_mass_profile:
+            return sum(
+                map(
+                    lambda p: p.mass_angular_within_circles(radii=radii),
+                    self.mass_profiles,
+                )
+            )
+        else:
+            raise exc.GalaxyException(
+                "You cannot perform a mass-based calculation on a galaxy which does not have a mass-profile"
+            )
+
     @property
     def contribution_map(self):
         """
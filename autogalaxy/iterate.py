@@ -0,0 +1,246 @@
+import numpy as np
+from autoarray import decorator_util
+from autoarray.structures import grids
+from autoarray.mask import mask_2d as msk
+
+
+def centres_from(obj):
+    """
+    Returns the (y,x) centres of the profiles which an object evaluated on a `Grid2DIterateAdaptive` is made up of,
+    which are:
+
+    - For a `Plane`, the centres of the light profiles of all of its galaxies.
+    - For a `Galaxy`, the centres of its light profiles.
+    - For a profile, its centre.
+
+    Parameters
+    ----------
+    obj : Plane or Galaxy or GeometryProfile
+        The object whose function is evaluated on the grid.
+    """
+    if hasattr(obj, "galaxies"):
+        return [centre for galaxy in obj.galaxies for centre in centres_from(galaxy)]
+    if hasattr(obj, "light_profiles"):
+        return [light_profile.centre for light_profile in obj.light_profiles]
+    if hasattr(obj, "centre"):
+        return [obj.centre]
+    return []
+
+
+@decorator_util.jit()
+def sub_size_index_jit_from(array_2d, mask_2d, centre_mask_2d, sub_steps, tolerance):
+    """
+    Returns the index of the sub-size in sub_steps that every unmasked pixel of an array evaluated at a sub-size
+    of 1 is evaluated at to meet a fractional accuracy, where:
+
+    - -1 signifies the value evaluated at a sub-size of 1 already meets the fractional accuracy.
+    - len(sub_steps) - 1 (the highest sub-size) is used for pixels unmasked in the centre mask.
+
+    The fractional error of evaluating a function at the centre of a pixel, as opposed to averaging it over the
+    pixel, is estimated as |laplacian| / (24 * |value|), where the laplacian is computed from the values of the
+    pixel's unmasked neighbours. This error falls with the square of the sub-size, which gives the lowest sub-size
+    whose error is below the tolerance (1.0 - fractional_accuracy).
+    """
+    sub_size_index = np.full(array_2d.shape, -1)
+
+    for y in range(array_2d.shape[0]):
+        for x in range(array_2d.shape[1]):
+
+            if mask_2d[y, x]:
+                continue
+
+            if not centre_mask_2d[y, x]:
+                sub_size_index[y, x] = len(sub_steps) - 1
+                continue
+
+            laplacian = 0.0
+
+            for neighbour_y, neighbour_x in (
+                (y - 1, x),
+                (y + 1, x),
+                (y, x - 1),
+                (y, x + 1),
+            ):
+                if (
+                    0 <= neighbour_y < array_2d.shape[0]
+                    and 0 <= neighbour_x < array_2d.shape[1]
+                    and not mask_2d[neighbour_y, neighbour_x]
+                ):
+                    laplacian += (
+                        array_2d[neighbour_y, neighbour_x] - array_2d[y, x]
+                    )
+
+            if array_2d[y, x] == 0.0:
+                fractional_error = np.inf if laplacian != 0.0 else 0.0
+            else:
+                fractional_error = np.abs(laplacian) / (24.0 * np.abs(array_2d[y, x]))
+
+            if fractional_error <= tolerance:
+                continue
+
+            sub_size_index[y, x] = len(sub_steps) - 1
+
+            for index in range(len(sub_steps)):
+                if fractional_error / sub_steps[index] ** 2 <= tolerance:
+                    sub_size_index[y, x] = index
+                    break
+
+    return sub_size_index
+
+
+class Grid2DIterateAdaptive(grids.Grid2DIterate):
+    """
+    A `Grid2DIterate` which chooses the sub-size of every pixel from one evaluation of a function at a sub-size of 1,
+    instead of evaluating every pixel that does not meet the fractional accuracy at every sub-size in its sub_steps.
+
+    The sub-size of each pixel is the lowest in the sub_steps that meets the fractional accuracy, based on the
+    estimate of its error from the curvature of the function across neighbouring pixels (see
+    `sub_size_index_jit_from`). Pixels containing or neighbouring the centre of a profile, where the curvature of a
+    light profile with a steep centre (e.g. a Sersic profile with a high sersic_index) is not resolved by the
+    pixels, are evaluated at the highest sub-size. Every pixel is then evaluated once, at its sub-size, such that
+    only pixels near the centres of profiles and where the profiles change steeply are refined.
+
+    The centres are those of the object whose function the grid is input into (see `centres_from`). Grids of (y,x)
+    coordinates returned by a function (e.g. deflection angles) are iterated as a `Grid2DIterate`.
+    """
+
+    @classmethod
+    def from_mask(
+        cls, mask, fractional_accuracy=0.9999, sub_steps=None, store_slim=True
+    ):
+        """
+        Create a Grid2DIterateAdaptive from a mask (see `Grid2DIterate.from_mask`).
+        """
+        return (
+            super()
+            .from_mask(
+                mask=mask,
+                fractional_accuracy=fractional_accuracy,
+                sub_steps=sub_steps,
+                store_slim=store_slim,
+            )
+            .view(cls)
+        )
+
+    def _new_structure(self, grid, mask, store_slim):
+        return (
+            super()
+            ._new_structure(grid=grid, mask=mask, store_slim=store_slim)
+            .view(Grid2DIterateAdaptive)
+        )
+
+    def centre_mask_from(self, centres):
+        """
+        Returns a 2D ndarray of booleans which are only `False` for the pixels of the grid which contain, or
+        neighbour, one of the input (y,x) centres.
+
+        Parameters
+        ----------
+        centres : [(float, float)]
+            The (y,x) centres of the profiles the grid is evaluated for.
+        """
+        centre_mask = np.full(fill_value=True, shape=self.mask.shape_native)
+
+        for centre in centres:
+
+            pixel_y, pixel_x = self.mask.pixel_coordinates_2d_from(
+                scaled_coordinates_2d=centre
+            )
+
+            centre_mask[
+                max(pixel_y - 1, 0) : max(pixel_y + 2, 0),
+                max(pixel_x - 1, 0) : max(pixel_x + 2, 0),
+            ] = False
+
+        return centre_mask
+
+    def iterated_array_from_func(self, func, cls, array_lower_sub_2d):
+        """
+        Evaluate a function that returns an array of values to the fractional accuracy, where every pixel is evaluated
+        once at the sub-size given by `sub_size_index_jit_from`.
+
+        If the function returns all zeros, the array is returned as zeros.
+
+        Parameters
+        ----------
+        func : func
+            The function which is evaluated at the adapted sub-size of every pixel.
+        cls : cls
+            The class the function belongs to, whose centres are found using `centres_from`.
+        array_lower_sub_2d : arrays.Array2D
+            The results computed by the function using a sub-grid size of 1.
+        """
+        if not np.any(array_lower_sub_2d):
+            return array_lower_sub_2d.slim
+
+        sub_size_index = sub_size_index_jit_from(
+            array_2d=np.asarray(array_lower_sub_2d),
+            mask_2d=np.asarray(self.mask),
+            centre_mask_2d=self.centre_mask_from(centres=centres_from(obj=cls)),
+            sub_steps=np.asarray(self.sub_steps),
+            tolerance=1.0 - self.fractional_accuracy,
+        )
+
+        iterated_array = np.array(array_lower_sub_2d)
+
+        for index, sub_size in enumerate(self.sub_steps):
+
+            if not np.any(sub_size_index == index):
+                continue
+
+            array_higher_sub = self.array_at_sub_size_from_func_and_mask(
+                func=func,
+                cls=cls,
+                mask=msk.Mask2D(
+                    mask=sub_size_index != index,
+                    pixel_scales=self.mask.pixel_scales,
+                    origin=self.mask.origin,
+                ),
+                sub_size=sub_size,
+            )
+
+            iterated_array[sub_size_index == index] = np.asarray(array_higher_sub)[
+                sub_size_index == index
+            ]
+
+        return self.return_iterated_array_result(iterated_array=iterated_array)
+
+
+class Grid2DPixelIntegration(grids.Grid2D):
+    """
+    A `Grid2D` on which Gaussian light profiles (`EllipticalGaussian` and `SphericalGaussian`) are integrated
+    analytically over the (sub-)pixel of every (y,x) coordinate (see
+    `EllipticalGaussian.image_from_grid_via_pixel_integration`), instead of being evaluated at the coordinate. Every
+    other light profile is evaluated as on a `Grid2D`.
+
+    The image of a Gaussian light profile is therefore exact on a grid with a sub_size of 1, however narrow the
+    Gaussian is compared to the pixels.
+    """
+
+    @classmethod
+    def from_mask(cls, mask, store_slim=True):
+        """
+        Create a Grid2DPixelIntegration from a mask (see `Grid2D.from_mask`).
+        """
+        return super().from_mask(mask=mask, store_slim=store_slim).view(cls)
+
+    def _new_structure(self, grid, mask, store_slim):
+        return (
+            super()
+            ._new_structure(grid=grid, mask=mask, store_slim=store_slim)
+            .view(Grid2DPixelIntegration)
+        )
+
+    def blurring_grid_from_kernel_shape(self, kernel_shape_native):
+        return (
+            super()
+            .blurring_grid_from_kernel_shape(kernel_shape_native=kernel_shape_native)
+            .view(Grid2DPixelIntegration)
+        )
+
+    def padded_grid_from_kernel_shape(self, kernel_shape_native):
+        return (
+            super()
+            .padded_grid_from_kernel_shape(kernel_shape_native=kernel_shape_native)
+            .view(Grid2DPixelIntegration)
+        )
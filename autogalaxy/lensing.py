@@ -64,6 +64,48 @@ class LensingObject:
     def deflections_from_grid(self, grid):
         raise NotImplementedError("deflections_from_grid should be overridden")
 
+    def convergence_from_array(self, array):
+        """
+        Returns the convergence on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2] as an
+        ndarray, which profiles and galaxies override to avoid the per-call overhead of `convergence_from_grid`.
+        """
+        return np.asarray(self.convergence_from_grid(grid=array))
+
+    def potential_from_array(self, array):
+        """
+        Returns the potential on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2] as an ndarray,
+        which profiles and galaxies override to avoid the per-call overhead of `potential_from_grid`.
+        """
+        return np.asarray(self.potential_from_grid(grid=array))
+
+    def deflections_from_array(self, array):
+        """
+        Returns the (y,x) deflection angles on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2]
+        as an ndarray, which profiles and galaxies override to avoid the per-call overhead of
+        `deflections_from_grid`.
+        """
+        return np.asarray(self.deflections_from_grid(grid=array))
+
+    def add_deflections_from_grid(self, grid, deflections):
+        """
+        Adds the (y,x) deflection angles computed on a grid to a preallocated ndarray of shape
+        [total_coordinates, 2] in place, and returns it. Galaxies and planes override this to add the deflection
+        angles of each of their mass profiles into the same ndarray, instead of summing a chain of intermediate
+        structures.
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        deflections : np.ndarray
+            The deflection angles which this object's deflection angles are added to.
+        """
+        return np.add(
+            deflections,
+            np.asarray(self.deflections_from_grid(grid=grid)),
+            out=deflections,
+        )
+
     def mass_integral(self, x):
         """Routine to integrate an elliptical light profiles - set axis ratio to 1 to compute the luminosity within a \
         circle"""
@@ -179,10 +221,10 @@ class LensingObject:
         grid_shift_x_right[:, 0] = grid[:, 0]
         grid_shift_x_right[:, 1] = grid[:, 1] + buffer
 
-        deflections_up = self.deflections_from_grid(grid=grid_shift_y_up)
-        deflections_down = self.deflections_from_grid(grid=grid_shift_y_down)
-        deflections_left = self.deflections_from_grid(grid=grid_shift_x_left)
-        deflections_right = self.deflections_from_grid(grid=grid_shift_x_right)
+        deflections_up = self.deflections_from_array(array=grid_shift_y_up)
+        deflections_down = self.deflections_from_array(array=grid_shift_y_down)
+        deflections_left = self.deflections_from_array(array=grid_shift_x_left)
+        deflections_right = self.deflections_from_array(array=grid_shift_x_right)
 
         hessian_yy = 0.5 * (deflections_up[:, 0] - deflections_down[:, 0]) / buffer
         hessian_xy = 0.5 * (deflections_up[:, 1] - deflections_down[:, 1]) / buffer
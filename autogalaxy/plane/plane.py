@@ -1,3 +1,5 @@
+import operator
+
 import numpy as np
 
 from autoarray.inversion import inversions as inv
@@ -6,6 +8,7 @@ from autoarray.structures import arrays, grids, visibilities as vis
 from autogalaxy import exc
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy.util import plane_util
 
 
@@ -42,41 +45,90 @@ class AbstractPlane(lensing.LensingObject):
     def galaxy_redshifts(self):
         return [galaxy.redshift for galaxy in self.galaxies]
 
+    @property
+    def galaxy_registry(self) -> {str: list}:
+        """
+        A dictionary of the plane's galaxies which have light profiles, mass profiles, pixelizations, regularizations
+        and hyper galaxies, and of the mass profiles of every galaxy with mass profiles.
+
+        The registry is built from the `profile_registry` of every galaxy once when first used, and is reused by every
+        property aggregating the plane's galaxies while the list of galaxies and the registries of its galaxies are
+        unchanged, which is checked by the identity of each galaxy's `profile_registry` (a galaxy builds a new
+        registry when a profile, pixelization, regularization or hyper galaxy is set).
+        """
+        profile_registries = [galaxy.profile_registry for galaxy in self.galaxies]
+
+        cache = self.__dict__.get("_galaxy_registry")
+
+        if (
+            cache is not None
+            and cache[0] is self.galaxies
+            and len(cache[1]) == len(profile_registries)
+            and all(map(operator.is_, cache[1], profile_registries))
+        ):
+            return cache[2]
+
+        galaxy_registry = {
+            "light": [
+                galaxy for galaxy in self.galaxies if galaxy.has_light_profile
+            ],
+            "mass": [galaxy for galaxy in self.galaxies if galaxy.has_mass_profile],
+            "pixelization": [
+                galaxy for galaxy in self.galaxies if galaxy.has_pixelization
+            ],
+            "regularization": [
+                galaxy for galaxy in self.galaxies if galaxy.has_regularization
+            ],
+            "hyper_galaxy": [
+                galaxy for galaxy in self.galaxies if galaxy.has_hyper_galaxy
+            ],
+        }
+
+        galaxy_registry["mass_profiles_of_galaxies"] = [
+            galaxy.mass_profiles for galaxy in galaxy_registry["mass"]
+        ]
+
+        self.__dict__["_galaxy_registry"] = (
+            self.galaxies,
+            profile_registries,
+            galaxy_registry,
+        )
+
+        return galaxy_registry
+
     @property
     def has_light_profile(self):
         if self.galaxies is not None:
-            return any(
-                list(map(lambda galaxy: galaxy.has_light_profile, self.galaxies))
-            )
+            return len(self.galaxy_registry["light"]) > 0
 
     @property
     def has_mass_profile(self):
         if self.galaxies is not None:
-            return any(list(map(lambda galaxy: galaxy.has_mass_profile, self.galaxies)))
+            return len(self.galaxy_registry["mass"]) > 0
 
     @property
     def has_pixelization(self):
-        return any([galaxy.pixelization for galaxy in self.galaxies])
+        return len(self.galaxy_registry["pixelization"]) > 0
 
     @property
     def has_regularization(self):
-        return any([galaxy.regularization for galaxy in self.galaxies])
+        return len(self.galaxy_registry["regularization"]) > 0
 
     @property
     def galaxies_with_light_profile(self):
-        return list(filter(lambda galaxy: galaxy.has_light_profile, self.galaxies))
+        return list(self.galaxy_registry["light"])
 
     @property
     def galaxies_with_mass_profile(self):
-        return list(filter(lambda galaxy: galaxy.has_mass_profile, self.galaxies))
+        return list(self.galaxy_registry["mass"])
 
     @property
     def galaxies_with_pixelization(self):
-        return list(filter(lambda galaxy: galaxy.has_pixelization, self.galaxies))
+        return list(self.galaxy_registry["pixelization"])
 
     @property
     def galaxies_with_regularization(self):
-        return list(filter(lambda galaxy: galaxy.has_regularization, self.galaxies))
+        return list(self.galaxy_registry["regularization"])
 
     @property
     def pixelization(self):
@@ -110,7 +162,7 @@ class AbstractPlane(lensing.LensingObject):
 
     @property
     def has_hyper_galaxy(self):
-        return any(list(map(lambda galaxy: galaxy.has_hyper_galaxy, self.galaxies)))
+        return len(self.galaxy_registry["hyper_galaxy"]) > 0
 
     @property
     def point_source_dict(self):
@@ -134,7 +186,8 @@ class AbstractPlane(lensing.LensingObject):
     @property
     def mass_profiles_of_galaxies(self):
         return [
-            galaxy.mass_profiles for galaxy in self.galaxies if galaxy.has_mass_profile
+            list(mass_profiles)
+            for mass_profiles in self.galaxy_registry["mass_profiles_of_galaxies"]
         ]
 
     def extract_attribute(self, cls, name):
@@ -284,7 +337,10 @@ class AbstractPlaneLensing(AbstractPlane):
             The galaxies whose mass profiles are used to compute the surface densities.
         """
         if self.galaxies:
-            return sum(map(lambda g: g.convergence_from_grid(grid=grid), self.galaxies))
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(lambda g: g.convergence_from_grid(grid=grid), self.galaxies)
+                )
         return np.zeros(shape=(grid.shape[0],))
 
     @grids.grid_like_to_structure
@@ -308,19 +364,81 @@ class AbstractPlaneLensing(AbstractPlane):
             The galaxies whose mass profiles are used to compute the surface densities.
         """
         if self.galaxies:
-            return sum(map(lambda g: g.potential_from_grid(grid=grid), self.galaxies))
+            with geometry_profiles.transform_cache:
+                return sum(
+                    map(lambda g: g.potential_from_grid(grid=grid), self.galaxies)
+                )
         return np.zeros((grid.shape[0]))
 
     @grids.grid_like_to_structure
     def deflections_from_grid(self, grid):
-        if self.galaxies:
-            return sum(map(lambda g: g.deflections_from_grid(grid=grid), self.galaxies))
-        return np.zeros(shape=(grid.shape[0], 2))
+        """
+        Returns the deflection angles of the list of galaxies of the plane's sub-grid, by adding the deflection
+        angles of every galaxy's mass profiles into one ndarray in the precision of the grid (see
+        `add_deflections_from_grid`).
+
+        If the plane has no galaxies (or no galaxies have mass profiles) a grid of all zeros is returned.
+
+        Parameters
+        -----------
+        grid : Grid2D
+            The grid (or sub) of (y,x) arc-second coordinates at the centre of every unmasked pixel which the \
+            deflection angles are calculated on.
+        """
+        deflections = np.zeros(
+            (grid.shape[0], 2), dtype=np.result_type(np.asarray(grid).dtype, np.float32)
+        )
+
+        return self._add_galaxy_deflections_from_grid(
+            grid=grid, deflections=deflections
+        )
+
+    def add_deflections_from_grid(self, grid, deflections):
+        """
+        Adds the summed deflection angles of the plane's galaxies to a preallocated ndarray of shape
+        [total_coordinates, 2] in place, and returns it (see `Galaxy.add_deflections_from_grid`).
+
+        A `Grid2DIterate` or `Grid2DInterpolate` is instead evaluated via `deflections_from_grid`, so that the
+        plane's iteration and interpolation are applied to the summed deflection angles.
+
+        Parameters
+        -----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        deflections : np.ndarray
+            The deflection angles which the plane's deflection angles are added to.
+        """
+        if isinstance(grid, (grids.Grid2DIterate, grids.Grid2DInterpolate)):
+            return super().add_deflections_from_grid(grid=grid, deflections=deflections)
+
+        return self._add_galaxy_deflections_from_grid(
+            grid=grid, deflections=deflections
+        )
+
+    def _add_galaxy_deflections_from_grid(self, grid, deflections):
+
+        with geometry_profiles.transform_cache:
+            for galaxy in self.galaxies:
+                galaxy.add_deflections_from_grid(grid=grid, deflections=deflections)
+
+        return deflections
 
     @grids.grid_like_to_structure
     def traced_grid_from_grid(self, grid):
-        """Trace this plane's grid_stacks to the next plane, using its deflection angles."""
-        return grid - self.deflections_from_grid(grid=grid)
+        """
+        Trace this plane's grid_stacks to the next plane, using its deflection angles.
+
+        The deflection angles are added into one ndarray, which the traced grid is then computed in place of.
+        """
+        deflections = np.zeros(
+            (grid.shape[0], 2), dtype=np.result_type(np.asarray(grid).dtype, np.float32)
+        )
+
+        deflections = self.add_deflections_from_grid(
+            grid=grid, deflections=deflections
+        )
+
+        return np.subtract(np.asarray(grid), deflections, out=deflections)
 
 
 class AbstractPlaneData(AbstractPlaneLensing):
@@ -366,6 +484,55 @@ class AbstractPlaneData(AbstractPlaneLensing):
             for galaxy in self.galaxies
         ]
 
+    def blurred_image_from_images_of_galaxies_and_convolver(
+        self, images_of_galaxies, blurring_images_of_galaxies, convolver
+    ):
+        """
+        Returns the blurred image of the plane from the images of its galaxies on a grid and blurring grid which are
+        already computed (e.g. via `images_of_galaxies_from_grid`), such that they can be reused for the blurred image
+        of every galaxy (see `blurred_images_of_galaxies_from_images_and_convolver`).
+
+        The images are summed in the order of the galaxies, giving the same blurred image as
+        `blurred_image_from_grid_and_convolver` for every grid other than a `Grid2DIterate`.
+
+        Parameters
+        ----------
+        images_of_galaxies : [Array2D]
+            The image of every galaxy of the plane on the grid.
+        blurring_images_of_galaxies : [Array2D]
+            The image of every galaxy of the plane on the blurring grid.
+        convolver : Convolver
+            The convolver which blurs the image with the PSF.
+        """
+        return convolver.convolved_image_from_image_and_blurring_image(
+            image=sum(images_of_galaxies), blurring_image=sum(blurring_images_of_galaxies)
+        )
+
+    def blurred_images_of_galaxies_from_images_and_convolver(
+        self, images_of_galaxies, blurring_images_of_galaxies, convolver
+    ):
+        """
+        Returns the blurred image of every galaxy of the plane from the images of the galaxies on a grid and blurring
+        grid which are already computed (see `blurred_image_from_images_of_galaxies_and_convolver`).
+
+        Parameters
+        ----------
+        images_of_galaxies : [Array2D]
+            The image of every galaxy of the plane on the grid.
+        blurring_images_of_galaxies : [Array2D]
+            The image of every galaxy of the plane on the blurring grid.
+        convolver : Convolver
+            The convolver which blurs the images with the PSF.
+        """
+        return [
+            convolver.convolved_image_from_image_and_blurring_image(
+                image=image, blurring_image=blurring_image
+            )
+            for image, blurring_image in zip(
+                images_of_galaxies, blurring_images_of_galaxies
+            )
+        ]
+
     def unmasked_blurred_image_from_grid_and_psf(self, grid, psf):
 
         padded_grid = grid.padded_grid_from_kernel_shape(
@@ -1,9 +1,281 @@
+from functools import wraps
+import threading
+
+import numba
 import numpy as np
+from autoarray import decorator_util
 from autoarray.structures import grids
+from autoconf import conf
 from autogalaxy import convert
 import typing
 
 
+class RadialMinimumConfig:
+    def __init__(self):
+        """
+        The radial minimum of every profile class in the 'radial_minimum.ini' config of the grids, which is read from
+        the config the first time it is used for a class and cached, such that evaluating a profile does not look
+        its radial minimum up through the config system.
+
+        The cache is reloaded when a new config path is pushed (which changes the configs of `conf.instance`), or
+        explicitly via `reload` (e.g. after editing the config).
+        """
+        self.configs = None
+        self.radial_minimum_dict = {}
+
+    def radial_minimum_from(self, cls):
+        """
+        Returns the radial minimum of a profile class from the 'radial_minimum.ini' config.
+
+        Parameters
+        ----------
+        cls : type
+            The class of the profile, whose name is its entry in the config.
+        """
+        if conf.instance.configs is not self.configs:
+            self.reload()
+
+        try:
+            return self.radial_minimum_dict[cls]
+        except KeyError:
+            radial_minimum = conf.instance["grids"]["radial_minimum"][
+                "radial_minimum"
+            ][cls.__name__]
+            self.radial_minimum_dict[cls] = radial_minimum
+            return radial_minimum
+
+    def reload(self):
+        """
+        Clear the cached radial minima, such that they are read from the current config when next used.
+        """
+        self.configs = conf.instance.configs
+        self.radial_minimum_dict = {}
+
+
+radial_minimum_config = RadialMinimumConfig()
+
+
+class TransformCache(threading.local):
+    def __init__(self):
+        """
+        A cache of grids transformed to the reference frame of elliptical profiles and their radii, which is active
+        within a `with transform_cache:` block (e.g. the evaluation of the deflection angles of a galaxy or plane).
+
+        Profiles which share a centre and elliptical components (e.g. a bulge, disk and dark matter halo aligned with
+        one another) then transform a grid once, with every other aligned profile reusing the result. Results are
+        keyed on the identity of the input grid, which is held by the cache such that its identity cannot be reused
+        by another grid, alongside the centre, elliptical components and any other inputs of the calculation.
+
+        The cache is cleared when the outermost block exits, and is local to each thread.
+        """
+        self.depth = 0
+        self.grid_dict = {}
+        self.result_dict = {}
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth == 0:
+            self.grid_dict = {}
+            self.result_dict = {}
+
+    def result_from(self, grid, key, func):
+        """
+        Returns the result of a function which transforms a grid, which is computed and cached the first time it
+        is called for the grid and key within a `with transform_cache:` block, or always computed outside of one.
+
+        Parameters
+        ----------
+        grid : grid_like
+            The grid the function transforms, whose identity is part of the cache key.
+        key : tuple
+            The hashable inputs of the function other than the grid (e.g. the centre of the profile).
+        func : func
+            The function computing the result, which takes no arguments.
+        """
+        if self.depth == 0:
+            return func()
+
+        key = (id(grid),) + key
+
+        try:
+            return self.result_dict[key]
+        except KeyError:
+            pass
+
+        result = func()
+
+        self.grid_dict[id(grid)] = grid
+        self.result_dict[key] = result
+
+        return result
+
+
+transform_cache = TransformCache()
+
+
+def relocate_to_radial_minimum(func):
+    """
+    Checks whether any coordinates in the grid are radially near (0.0, 0.0), which can lead to numerical faults in
+    the evaluation of a function (e.g. numerical integration reaching a singularity at (0.0, 0.0)). If any coordinates
+    are radially within the the radial minimum threshold, their (y,x) coordinates are shifted to that value to ensure
+    they are evaluated at that coordinate.
+
+    This is the `relocate_to_radial_minimum` decorator of autoarray, with the radial minimum of the profile's class
+    taken from the cache of the 'radial_minimum.ini' config in `radial_minimum_config`. If no coordinate is within
+    the radial minimum the grid is passed on unchanged, such that aligned profiles reuse its cached transforms (see
+    `TransformCache`).
+
+    Parameters
+    ----------
+    func : (profile, *args, **kwargs) -> Object
+        A function that takes a grid of coordinates which may have a singularity as (0.0, 0.0)
+
+    Returns
+    -------
+        A function that can except cartesian or transformed coordinates
+    """
+
+    @wraps(func)
+    def wrapper(profile, grid, *args, **kwargs):
+
+        grid_radial_minimum = radial_minimum_config.radial_minimum_from(
+            cls=profile.__class__
+        )
+
+        with np.errstate(all="ignore"):  # Division by zero fixed via isnan
+
+            grid_radii = profile.grid_to_grid_radii(grid=grid)
+
+            if not np.all(grid_radii >= grid_radial_minimum):
+
+                grid_radial_scale = np.where(
+                    grid_radii < grid_radial_minimum,
+                    grid_radial_minimum / grid_radii,
+                    1.0,
+                )
+                grid = np.multiply(grid, grid_radial_scale[:, None])
+                grid[np.isnan(grid)] = grid_radial_minimum
+
+        return func(profile, grid, *args, **kwargs)
+
+    return wrapper
+
+
+@decorator_util.jit()
+def transformed_grid_and_radii_jit(
+    grid,
+    centre_y,
+    centre_x,
+    cos_phi,
+    sin_phi,
+    radial_minimum,
+    axis_ratio,
+    transformed_grid,
+    elliptical_radii,
+    eccentric_radii,
+):
+    """
+    Transform every (y,x) coordinate of a grid to the reference frame of an elliptical profile, move it to the radial
+    minimum of the profile and compute its elliptical and eccentric radii, writing the results into preallocated
+    arrays in one pass over the grid.
+
+    The rotation to the profile's orientation uses the cosine and sine of its angle phi, such that no trigonometric
+    function is evaluated per coordinate. Coordinates whose circular radius is below the radial minimum are scaled
+    radially to it, with coordinates at (0.0, 0.0) moved to (radial_minimum, radial_minimum), as performed by the
+    `relocate_to_radial_minimum` decorator.
+    """
+    sqrt_axis_ratio = np.sqrt(axis_ratio)
+
+    for i in numba.prange(grid.shape[0]):
+
+        shifted_y = grid[i, 0] - centre_y
+        shifted_x = grid[i, 1] - centre_x
+
+        y = shifted_y * cos_phi - shifted_x * sin_phi
+        x = shifted_x * cos_phi + shifted_y * sin_phi
+
+        radius = np.sqrt(y ** 2 + x ** 2)
+
+        if radius < radial_minimum:
+            if radius == 0.0:
+                y = radial_minimum
+                x = radial_minimum
+            else:
+                y *= radial_minimum / radius
+                x *= radial_minimum / radius
+
+        transformed_grid[i, 0] = y
+        transformed_grid[i, 1] = x
+
+        elliptical_radii[i] = np.sqrt(x ** 2 + (y / axis_ratio) ** 2)
+        eccentric_radii[i] = sqrt_axis_ratio * elliptical_radii[i]
+
+    return transformed_grid, elliptical_radii, eccentric_radii
+
+
+grid_like_to_structure_code = grids.grid_like_to_structure(
+    lambda obj, grid: grid
+).__code__
+transform_code = grids.transform(lambda obj, grid: grid).__code__
+relocate_to_radial_minimum_code = relocate_to_radial_minimum(
+    lambda obj, grid: grid
+).__code__
+
+
+def result_from_func_and_array(profile, func, array):
+    """
+    Returns the result of a method of a profile evaluated on a plain ndarray of (y,x) coordinates of shape
+    [total_coordinates, 2] as an ndarray, without the per-call overhead of its grid decorators.
+
+    The `grid_like_to_structure`, `transform` and `relocate_to_radial_minimum` decorators of the method are
+    identified via the code objects of their wrappers and are applied directly to the ndarray: no structure is
+    created, the coordinates are transformed to the profile's reference frame once and only moved to its radial
+    minimum if a coordinate is within it. Any other decorator (e.g. `pixel_integrate`) is called as normal, with
+    the decorators beneath it.
+
+    Parameters
+    ----------
+    profile : GeometryProfile
+        The profile whose method is evaluated.
+    func : func
+        The (decorated) method of the profile's class, e.g. `type(profile).deflections_from_grid`.
+    array : np.ndarray
+        The (y, x) coordinates in the original reference frame of the grid.
+    """
+    grid = np.asarray(array)
+
+    while hasattr(func, "__wrapped__"):
+
+        code = func.__code__
+
+        if code is transform_code:
+            grid = profile.transform_grid_to_reference_frame(grid)
+        elif code is relocate_to_radial_minimum_code:
+            grid_radial_minimum = radial_minimum_config.radial_minimum_from(
+                cls=profile.__class__
+            )
+            grid_radii = np.sqrt(np.add(np.square(grid[:, 0]), np.square(grid[:, 1])))
+            if np.any(grid_radii < grid_radial_minimum):
+                with np.errstate(all="ignore"):
+                    grid_radial_scale = np.where(
+                        grid_radii < grid_radial_minimum,
+                        grid_radial_minimum / grid_radii,
+                        1.0,
+                    )
+                    grid = np.multiply(grid, grid_radial_scale[:, None])
+                grid[np.isnan(grid)] = grid_radial_minimum
+        elif code is not grid_like_to_structure_code:
+            break
+
+        func = func.__wrapped__
+
+    return np.asarray(func(profile, grid))
+
+
 class GeometryProfile:
     def __init__(self, centre: typing.Tuple[float, float] = (0.0, 0.0)):
         """An abstract geometry profile, which describes profiles with y and x centre Cartesian coordinates
@@ -16,6 +288,15 @@ class GeometryProfile:
 
         self.centre = centre
 
+    def centre_from_grid(self, grid):
+        """
+        Returns the (y,x) centre of the profile as an ndarray in the precision of a grid, such that shifting a float32
+        grid to the centre of the profile does not promote it to float64.
+        """
+        return np.asarray(
+            self.centre, dtype=np.result_type(np.asarray(grid).dtype, np.float32)
+        )
+
     def transform_grid_to_reference_frame(self, grid):
         raise NotImplemented()
 
@@ -94,7 +375,7 @@ class SphericalProfile(GeometryProfile):
         grid : grid_like
             The (y, x) coordinates in the original reference frame of the grid.
         """
-        transformed = np.subtract(grid, self.centre)
+        transformed = np.subtract(grid, self.centre_from_grid(grid=grid))
         return grids.Grid2DTransformedNumpy(grid=transformed)
 
     @grids.grid_like_to_structure
@@ -199,19 +480,82 @@ class EllipticalProfile(SphericalProfile):
         grid_elliptical : grid_like
             The (y, x) coordinates in the reference frame of an elliptical profile.
         """
-        y = np.add(
-            np.multiply(grid_elliptical[:, 1], self.sin_phi),
-            np.multiply(grid_elliptical[:, 0], self.cos_phi),
+        grid_elliptical = np.asarray(grid_elliptical)
+        cos_phi, sin_phi = self.cos_and_sin_from_x_axis()
+        rotation_matrix = np.array(
+            [[cos_phi, -sin_phi], [sin_phi, cos_phi]],
+            dtype=np.result_type(grid_elliptical.dtype, np.float32),
         )
-        x = np.add(
-            np.multiply(grid_elliptical[:, 1], self.cos_phi),
-            -np.multiply(grid_elliptical[:, 0], self.sin_phi),
+        return np.dot(grid_elliptical, rotation_matrix)
+
+    def transformed_grid_and_radii_from(self, grid):
+        """
+        Returns a grid of (y,x) coordinates transformed to the reference frame of the profile and moved to its
+        radial minimum, alongside their elliptical and eccentric radii, which are all computed in one pass over the
+        grid by `transformed_grid_and_radii_jit`.
+
+        If the coordinates have already been transformed to the profile's geometry, they are only moved to its
+        radial minimum. Within a `with transform_cache:` block the results are shared by every profile with the same
+        centre, elliptical components and radial minimum (see `TransformCache`).
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid, or the reference frame of the profile.
+        """
+        grid_radial_minimum = radial_minimum_config.radial_minimum_from(
+            cls=self.__class__
+        )
+
+        return transform_cache.result_from(
+            grid=grid,
+            key=(
+                "radii",
+                tuple(self.centre),
+                tuple(self.elliptical_comps),
+                grid_radial_minimum,
+            ),
+            func=lambda: self._transformed_grid_and_radii_from(
+                grid=grid, grid_radial_minimum=grid_radial_minimum
+            ),
+        )
+
+    def _transformed_grid_and_radii_from(self, grid, grid_radial_minimum):
+
+        if isinstance(grid, (grids.Grid2DTransformed, grids.Grid2DTransformedNumpy)):
+            centre = np.zeros(2)
+            cos_phi, sin_phi = 1.0, 0.0
+        else:
+            centre = self.centre
+            cos_phi, sin_phi = self.cos_and_sin_from_x_axis()
+
+        grid = np.asarray(grid)
+
+        if grid.dtype != np.float32:
+            grid = grid.astype("float64")
+
+        dtype = grid.dtype.type
+
+        transformed_grid, elliptical_radii, eccentric_radii = transformed_grid_and_radii_jit(
+            grid=grid,
+            centre_y=dtype(centre[0]),
+            centre_x=dtype(centre[1]),
+            cos_phi=dtype(cos_phi),
+            sin_phi=dtype(sin_phi),
+            radial_minimum=dtype(grid_radial_minimum),
+            axis_ratio=dtype(self.axis_ratio),
+            transformed_grid=np.empty(grid.shape, dtype=grid.dtype),
+            elliptical_radii=np.empty(grid.shape[0], dtype=grid.dtype),
+            eccentric_radii=np.empty(grid.shape[0], dtype=grid.dtype),
+        )
+
+        return (
+            grids.Grid2DTransformedNumpy(grid=transformed_grid),
+            elliptical_radii,
+            eccentric_radii,
         )
-        return np.vstack((y, x)).T
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def grid_to_elliptical_radii(self, grid):
         """
         Convert a grid of (y,x) coordinates to an elliptical radius.
@@ -223,15 +567,9 @@ class EllipticalProfile(SphericalProfile):
             grid : grid_like
                 The (y, x) coordinates in the reference frame of the elliptical profile.
         """
-        return np.sqrt(
-            np.add(
-                np.square(grid[:, 1]), np.square(np.divide(grid[:, 0], self.axis_ratio))
-            )
-        )
+        return self.transformed_grid_and_radii_from(grid=grid)[1]
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def grid_to_eccentric_radii(self, grid):
         """Convert a grid of (y,x) coordinates to an eccentric radius, which is (1.0/axis_ratio) * elliptical radius \
         and used to define light profile half-light radii using circular radii.
@@ -243,15 +581,17 @@ class EllipticalProfile(SphericalProfile):
         grid : grid_like
             The (y, x) coordinates in the reference frame of the elliptical profile.
         """
-        return np.multiply(
-            np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii(grid)
-        ).view(np.ndarray)
+        return self.transformed_grid_and_radii_from(grid=grid)[2]
 
     @grids.grid_like_to_structure
     def transform_grid_to_reference_frame(self, grid):
         """Transform a grid of (y,x) coordinates to the reference frame of the profile, including a translation to \
         its centre and a rotation to it orientation.
 
+        The rotation multiplies the coordinates by the rotation matrix of the profile's angle phi. Within a
+        `with transform_cache:` block the transformed grid is shared by every profile with the same centre and
+        elliptical components (see `TransformCache`).
+
         Parameters
         ----------
         grid : grid_like
@@ -261,18 +601,20 @@ class EllipticalProfile(SphericalProfile):
             return super().transform_grid_to_reference_frame(
                 grid=grids.Grid2DTransformedNumpy(grid=grid)
             )
-        shifted_coordinates = np.subtract(grid, self.centre)
-        radius = np.sqrt(np.sum(shifted_coordinates ** 2.0, 1))
-        theta_coordinate_to_profile = (
-            np.arctan2(shifted_coordinates[:, 0], shifted_coordinates[:, 1])
-            - self.phi_radians
+
+        return transform_cache.result_from(
+            grid=grid,
+            key=("transform", tuple(self.centre), tuple(self.elliptical_comps)),
+            func=lambda: self._transform_grid_to_reference_frame(grid=grid),
         )
-        transformed = np.vstack(
-            (
-                radius * np.sin(theta_coordinate_to_profile),
-                radius * np.cos(theta_coordinate_to_profile),
-            )
-        ).T
+
+    def _transform_grid_to_reference_frame(self, grid):
+        centre = self.centre_from_grid(grid=grid)
+        cos_phi, sin_phi = self.cos_and_sin_from_x_axis()
+        rotation_matrix = np.array(
+            [[cos_phi, sin_phi], [-sin_phi, cos_phi]], dtype=centre.dtype
+        )
+        transformed = np.dot(np.subtract(grid, centre), rotation_matrix)
         return grids.Grid2DTransformedNumpy(grid=transformed)
 
     @grids.grid_like_to_structure
@@ -1,6 +1,14 @@
+import functools
+
+import numba
 import numpy as np
+from autoarray import decorator_util
 from autoarray.structures import grids
+from autogalaxy import exc
+from autogalaxy.iterate import Grid2DPixelIntegration
 from autogalaxy.profiles import geometry_profiles
+from autogalaxy.util import quad_util
+from scipy import special
 from scipy.integrate import quad
 import typing
 
@@ -36,9 +44,26 @@ class LightProfile:
         """
         raise NotImplementedError("image_from_grid should be overridden")
 
+    def image_from_array(self, array):
+        """
+        Returns the intensity on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2] as an ndarray,
+        bypassing the grid decorators of `image_from_grid` (see `geometry_profiles.result_from_func_and_array`).
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return geometry_profiles.result_from_func_and_array(
+            profile=self, func=type(self).image_from_grid, array=array
+        )
+
     def luminosity_within_circle(self, radius: float):
         raise NotImplementedError()
 
+    def luminosity_within_circles(self, radii):
+        raise NotImplementedError()
+
 
 # noinspection PyAbstractClass
 class EllipticalLightProfile(geometry_profiles.EllipticalProfile, LightProfile):
@@ -149,6 +174,24 @@ class EllipticalLightProfile(geometry_profiles.EllipticalProfile, LightProfile):
 
         return quad(func=self.luminosity_integral, a=0.0, b=radius)[0]
 
+    def luminosity_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the total luminosity of the light profile within circles of many radii, centred on the light
+        profile's centre (see `luminosity_within_circle`).
+
+        The luminosity within every radius is computed from one cumulative integral of the light profile over the
+        radii (see `quad_util.integral_within_circles_from`), as opposed to integrating the light profile from zero
+        to every radius.
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the luminosity within, which is returned in the same shape.
+        """
+        return quad_util.integral_within_circles_from(
+            func=self.image_from_grid_radii, radii=radii
+        )
+
     def luminosity_integral(self, x):
         """Routine to integrate the luminosity of an elliptical light profile.
 
@@ -156,6 +199,57 @@ class EllipticalLightProfile(geometry_profiles.EllipticalProfile, LightProfile):
         return 2 * np.pi * x * self.image_from_grid_radii(x)
 
 
+def pixel_integrate(func):
+    """
+    Evaluates the image of a light profile on a `Grid2DPixelIntegration` using its
+    `image_from_grid_via_pixel_integration` method, and on every other grid using the decorated function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(profile, grid, *args, **kwargs):
+
+        if isinstance(grid, Grid2DPixelIntegration):
+            return profile.image_from_grid_via_pixel_integration(grid=grid)
+
+        return func(profile, grid, *args, **kwargs)
+
+    return wrapper
+
+
+def bivariate_normal_cdf_from(h, k, rho):
+    """
+    Returns the cumulative distribution function of the standard bivariate normal distribution with correlation rho
+    at every (h, k), computed using Owen's T function:
+
+    Phi_2(h, k, rho) = Phi(h) / 2 + Phi(k) / 2 - T(h, a_h) - T(k, a_k) - beta
+
+    where a_h = (k - rho * h) / (h * sqrt(1 - rho^2)), a_k = (h - rho * k) / (k * sqrt(1 - rho^2)) and beta is 0.5 if
+    h and k have opposite signs (or one is zero and the other negative) and 0 otherwise.
+    """
+    root = np.sqrt(1.0 - rho ** 2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+
+        owens_t_h = np.where(
+            h == 0.0,
+            0.25 * np.sign(k),
+            special.owens_t(h, (k - rho * h) / (h * root)),
+        )
+        owens_t_k = np.where(
+            k == 0.0,
+            0.25 * np.sign(h),
+            special.owens_t(k, (h - rho * k) / (k * root)),
+        )
+
+    beta = np.where((h * k < 0.0) | ((h * k == 0.0) & (h + k < 0.0)), 0.5, 0.0)
+
+    return np.where(
+        (h == 0.0) & (k == 0.0),
+        0.25 + np.arcsin(rho) / (2.0 * np.pi),
+        0.5 * special.ndtr(h) + 0.5 * special.ndtr(k) - owens_t_h - owens_t_k - beta,
+    )
+
+
 class EllipticalGaussian(EllipticalLightProfile):
     def __init__(
         self,
@@ -184,6 +278,26 @@ class EllipticalGaussian(EllipticalLightProfile):
         )
         self.sigma = sigma
 
+    def luminosity_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the total luminosity of the Gaussian light profile within circles of many radii, which is computed
+        analytically as 2 * pi * intensity * s^2 * (1 - exp(-radii^2 / (2 * s^2))), where s = sigma / sqrt(q).
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the luminosity within, which is returned in the same shape.
+        """
+        sigma_squared = self.sigma ** 2 / self.axis_ratio
+
+        return (
+            -2.0
+            * np.pi
+            * self.intensity
+            * sigma_squared
+            * np.expm1(-0.5 * np.square(np.asarray(radii, dtype="float64")) / sigma_squared)
+        )
+
     def image_from_grid_radii(self, grid_radii):
         """Calculate the intensity of the Gaussian light profile on a grid of radial coordinates.
 
@@ -193,26 +307,35 @@ class EllipticalGaussian(EllipticalLightProfile):
             The radial distance from the centre of the profile. for each coordinate on the grid.
 
         Note: sigma is divided by sqrt(q) here.
+
+        The intensity is computed in the precision of the radii (float32 or float64), with the profile's parameters
+        cast to it so that NumPy scalars do not promote float32 radii to float64.
         """
+        grid_radii = np.asarray(grid_radii)
+
+        dtype = np.result_type(grid_radii.dtype, np.float32).type
+
         return np.multiply(
-            self.intensity,
+            dtype(self.intensity),
             np.exp(
                 -0.5
                 * np.square(
-                    np.divide(grid_radii, self.sigma / np.sqrt(self.axis_ratio))
+                    np.divide(grid_radii, dtype(self.sigma / np.sqrt(self.axis_ratio)))
                 )
             ),
         )
 
+    @pixel_integrate
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def image_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
 
         If the coordinates have not been transformed to the profile's geometry, this is performed automatically.
 
+        If the grid is a `Grid2DPixelIntegration` the intensity is integrated over every (sub-)pixel of the grid (see
+        `image_from_grid_via_pixel_integration`).
+
         Parameters
         ----------
         grid : grid_like
@@ -221,6 +344,94 @@ class EllipticalGaussian(EllipticalLightProfile):
 
         return self.image_from_grid_radii(self.grid_to_eccentric_radii(grid))
 
+    @grids.grid_like_to_structure
+    def image_from_grid_via_pixel_integration(self, grid):
+        """
+        Calculate the mean intensity of the light profile over the (sub-)pixel of every (y,x) coordinate of a `Grid2D`,
+        which is exact irrespective of the sub-size of the grid.
+
+        In the profile's reference frame the Gaussian is the product of two independent Gaussians of standard
+        deviation sigma / axis_ratio (along its major axis) and sigma. Rotated to the (y,x) frame of the grid, it is a
+        bivariate normal distribution whose integral over every rectangular (sub-)pixel is given by its cumulative
+        distribution function at the pixel's corners (see `bivariate_normal_cdf_from`). Pixels are reflected to the
+        negative side of the profile's centre along both axes (changing the sign of the correlation for each
+        reflection) so that the corners' values are small far from the centre and their differences are precise.
+
+        If the Gaussian is spherical or aligned with the grid its (y,x) components are uncorrelated and the integral is
+        the product of the differences of the normal cumulative distribution function along y and x.
+
+        Parameters
+        ----------
+        grid : Grid2D
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if not isinstance(grid, grids.Grid2D):
+            raise exc.ProfileException(
+                "The image of a light profile can only be integrated over the pixels of a Grid2D"
+            )
+
+        pixel_scales = grid.mask.pixel_scales
+        sub_size = grid.mask.sub_size
+
+        half_pixel_y = 0.5 * pixel_scales[0] / sub_size
+        half_pixel_x = 0.5 * pixel_scales[1] / sub_size
+
+        variance_major = (self.sigma / self.axis_ratio) ** 2
+        variance_minor = self.sigma ** 2
+
+        sigma_x = np.sqrt(
+            variance_major * self.cos_phi ** 2 + variance_minor * self.sin_phi ** 2
+        )
+        sigma_y = np.sqrt(
+            variance_major * self.sin_phi ** 2 + variance_minor * self.cos_phi ** 2
+        )
+        correlation = (
+            (variance_major - variance_minor)
+            * self.cos_phi
+            * self.sin_phi
+            / (sigma_x * sigma_y)
+        )
+
+        grid = np.asarray(grid)
+
+        offset_y = grid[:, 0] - self.centre[0]
+        offset_x = grid[:, 1] - self.centre[1]
+
+        reflect_y = np.where(offset_y > 0.0, -1.0, 1.0)
+        reflect_x = np.where(offset_x > 0.0, -1.0, 1.0)
+
+        lower_y = (reflect_y * offset_y - half_pixel_y) / sigma_y
+        upper_y = (reflect_y * offset_y + half_pixel_y) / sigma_y
+        lower_x = (reflect_x * offset_x - half_pixel_x) / sigma_x
+        upper_x = (reflect_x * offset_x + half_pixel_x) / sigma_x
+
+        if correlation == 0.0:
+
+            probability = (special.ndtr(upper_x) - special.ndtr(lower_x)) * (
+                special.ndtr(upper_y) - special.ndtr(lower_y)
+            )
+
+        else:
+
+            rho = correlation * reflect_y * reflect_x
+
+            probability = (
+                bivariate_normal_cdf_from(h=upper_x, k=upper_y, rho=rho)
+                - bivariate_normal_cdf_from(h=lower_x, k=upper_y, rho=rho)
+                - bivariate_normal_cdf_from(h=upper_x, k=lower_y, rho=rho)
+                + bivariate_normal_cdf_from(h=lower_x, k=lower_y, rho=rho)
+            )
+
+        return np.multiply(
+            self.intensity
+            * 2.0
+            * np.pi
+            * self.sigma ** 2
+            / self.axis_ratio
+            / (4.0 * half_pixel_y * half_pixel_x),
+            np.maximum(probability, 0.0),
+        )
+
 
 class SphericalGaussian(EllipticalGaussian):
     def __init__(
@@ -245,6 +456,182 @@ class SphericalGaussian(EllipticalGaussian):
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def sersic_constant_from(sersic_index):
+    """
+    Returns the Sersic constant of a Sersic index, which ensures that the effective radius contains 50% of the
+    profile's total integrated light (see `AbstractEllipticalSersic.sersic_constant`).
+
+    The constant depends only on the Sersic index, thus it is memoized rather than recomputed on every access.
+    """
+    return (
+        (2 * sersic_index)
+        - (1.0 / 3.0)
+        + (4.0 / (405.0 * sersic_index))
+        + (46.0 / (25515.0 * sersic_index ** 2))
+        + (131.0 / (1148175.0 * sersic_index ** 3))
+        - (2194697.0 / (30690717750.0 * sersic_index ** 4))
+    )
+
+
+def sersic_luminosity_within_circles_from(
+    radii, intensity, effective_radius, sersic_index, sersic_constant
+):
+    """
+    Returns the luminosity of a Sersic profile within circles of many radii, which is computed analytically using
+    the regularized lower incomplete gamma function P as:
+
+    2 * pi * n * intensity * effective_radius^2 * exp(k) * k^(-2n) * gamma(2n) * P(2n, k * (radii / effective_radius)^(1/n))
+
+    where n is the sersic_index and k the sersic_constant.
+
+    Parameters
+    ----------
+    radii : np.ndarray
+        The radii of the circles to compute the luminosity within, which is returned in the same shape.
+    """
+    radii = np.asarray(radii, dtype="float64")
+
+    total_luminosity = (
+        2.0
+        * np.pi
+        * sersic_index
+        * intensity
+        * effective_radius ** 2
+        * np.exp(
+            sersic_constant
+            + special.gammaln(2.0 * sersic_index)
+            - 2.0 * sersic_index * np.log(sersic_constant)
+        )
+    )
+
+    return total_luminosity * special.gammainc(
+        2.0 * sersic_index,
+        sersic_constant
+        * (np.maximum(radii, 0.0) / effective_radius) ** (1.0 / sersic_index),
+    )
+
+
+@decorator_util.jit()
+def sersic_intensity_jit(
+    radius, intensity, log_effective_radius, sersic_index_inverse, sersic_constant
+):
+    """
+    Returns the intensity of a Sersic profile at a radius, evaluating (radius / effective_radius) ** (1 / sersic_index)
+    via exp and log rather than a power.
+    """
+    return intensity * np.exp(
+        -sersic_constant
+        * (np.exp(sersic_index_inverse * (np.log(radius) - log_effective_radius)) - 1.0)
+    )
+
+
+@decorator_util.jit()
+def core_sersic_intensity_jit(
+    radius,
+    intensity_prime,
+    radius_break,
+    alpha,
+    gamma,
+    effective_radius,
+    sersic_index,
+    sersic_constant,
+):
+    """
+    Returns the intensity of a cored-Sersic profile at a radius.
+
+    The powers are evaluated in the same order as `EllipticalCoreSersic.intensity_prime`, such that the profile is
+    normalized to exactly intensity_break at radius_break.
+    """
+    return (
+        intensity_prime
+        * (1.0 + (radius_break / radius) ** alpha) ** (gamma / alpha)
+        * np.exp(
+            -sersic_constant
+            * (
+                ((radius ** alpha + radius_break ** alpha) / effective_radius ** alpha)
+                ** (1.0 / (alpha * sersic_index))
+            )
+        )
+    )
+
+
+@decorator_util.jit()
+def sersic_image_from_grid_radii_jit(
+    grid_radii, intensity, log_effective_radius, sersic_index_inverse, sersic_constant
+):
+    """
+    Returns the intensity of a Sersic profile at every radial coordinate in one pass over the radii (see
+    `sersic_intensity_jit`), in their dtype (float32 or float64).
+    """
+    image = np.zeros(grid_radii.shape[0], dtype=grid_radii.dtype)
+
+    for i in numba.prange(grid_radii.shape[0]):
+        image[i] = sersic_intensity_jit(
+            grid_radii[i],
+            intensity,
+            log_effective_radius,
+            sersic_index_inverse,
+            sersic_constant,
+        )
+
+    return image
+
+
+@decorator_util.jit()
+def core_sersic_image_from_grid_radii_jit(
+    grid_radii,
+    intensity_prime,
+    radius_break,
+    alpha,
+    gamma,
+    effective_radius,
+    sersic_index,
+    sersic_constant,
+):
+    """
+    Returns the intensity of a cored-Sersic profile at every radial coordinate in one pass over the radii (see
+    `core_sersic_intensity_jit`), in their dtype (float32 or float64).
+    """
+    image = np.zeros(grid_radii.shape[0], dtype=grid_radii.dtype)
+
+    for i in numba.prange(grid_radii.shape[0]):
+        image[i] = core_sersic_intensity_jit(
+            grid_radii[i],
+            intensity_prime,
+            radius_break,
+            alpha,
+            gamma,
+            effective_radius,
+            sersic_index,
+            sersic_constant,
+        )
+
+    return image
+
+
+@decorator_util.jit()
+def chameleon_image_from_grid_radii_jit(
+    grid_radii, factor, core_radius_0_squared, core_radius_1_squared
+):
+    """
+    Returns the intensity of a Chameleon profile at every radial coordinate, in one pass over the radii and in their
+    dtype (float32 or float64).
+    """
+    image = np.zeros(grid_radii.shape[0], dtype=grid_radii.dtype)
+
+    for i in numba.prange(grid_radii.shape[0]):
+
+        radius_squared = grid_radii[i] * grid_radii[i]
+
+        image[i] = factor * (
+            1 / np.sqrt(radius_squared + core_radius_0_squared)
+            - 1 / np.sqrt(radius_squared + core_radius_1_squared)
+        )
+
+    return image
+
+
 class AbstractEllipticalSersic(EllipticalLightProfile):
     def __init__(
         self,
@@ -295,14 +682,7 @@ class AbstractEllipticalSersic(EllipticalLightProfile):
         """A parameter derived from Sersic index which ensures that effective radius contains 50% of the profile's
         total integrated light.
         """
-        return (
-            (2 * self.sersic_index)
-            - (1.0 / 3.0)
-            + (4.0 / (405.0 * self.sersic_index))
-            + (46.0 / (25515.0 * self.sersic_index ** 2))
-            + (131.0 / (1148175.0 * self.sersic_index ** 3))
-            - (2194697.0 / (30690717750.0 * self.sersic_index ** 4))
-        )
+        return sersic_constant_from(sersic_index=self.sersic_index)
 
     def image_from_grid_radii(self, radius):
         """
@@ -362,26 +742,42 @@ class EllipticalSersic(AbstractEllipticalSersic, EllipticalLightProfile):
         grid_radii : float
             The radial distance from the centre of the profile. for each coordinate on the grid.
         """
-        np.seterr(all="ignore")
-        return np.multiply(
-            self.intensity,
-            np.exp(
-                np.multiply(
-                    -self.sersic_constant,
-                    np.add(
-                        np.power(
-                            np.divide(grid_radii, self.effective_radius),
-                            1.0 / self.sersic_index,
-                        ),
-                        -1,
-                    ),
-                )
-            ),
+        grid_radii = np.asarray(grid_radii)
+
+        if grid_radii.dtype != np.float32:
+            grid_radii = grid_radii.astype("float64")
+
+        dtype = grid_radii.dtype.type
+
+        image = sersic_image_from_grid_radii_jit(
+            grid_radii=grid_radii.reshape(-1),
+            intensity=dtype(self.intensity),
+            log_effective_radius=dtype(np.log(self.effective_radius)),
+            sersic_index_inverse=dtype(1.0 / self.sersic_index),
+            sersic_constant=dtype(self.sersic_constant),
+        )
+
+        return image.reshape(grid_radii.shape)
+
+    def luminosity_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the total luminosity of the Sersic light profile within circles of many radii, which is computed
+        analytically using the incomplete gamma function (see `sersic_luminosity_within_circles_from`).
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the luminosity within, which is returned in the same shape.
+        """
+        return sersic_luminosity_within_circles_from(
+            radii=radii,
+            intensity=self.intensity,
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def image_from_grid(self, grid, grid_radial_minimum=None):
         """Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
 
@@ -621,36 +1017,33 @@ class EllipticalCoreSersic(EllipticalSersic):
         grid_radii : float
             The radial distance from the centre of the profile. for each coordinate on the grid.
         """
-        return np.multiply(
-            np.multiply(
-                self.intensity_prime,
-                np.power(
-                    np.add(
-                        1,
-                        np.power(np.divide(self.radius_break, grid_radii), self.alpha),
-                    ),
-                    (self.gamma / self.alpha),
-                ),
-            ),
-            np.exp(
-                np.multiply(
-                    -self.sersic_constant,
-                    (
-                        np.power(
-                            np.divide(
-                                np.add(
-                                    np.power(grid_radii, self.alpha),
-                                    (self.radius_break ** self.alpha),
-                                ),
-                                (self.effective_radius ** self.alpha),
-                            ),
-                            (1.0 / (self.alpha * self.sersic_index)),
-                        )
-                    ),
-                )
-            ),
+        grid_radii = np.asarray(grid_radii)
+
+        if grid_radii.dtype != np.float32:
+            grid_radii = grid_radii.astype("float64")
+
+        dtype = grid_radii.dtype.type
+
+        image = core_sersic_image_from_grid_radii_jit(
+            grid_radii=grid_radii.reshape(-1),
+            intensity_prime=dtype(self.intensity_prime),
+            radius_break=dtype(self.radius_break),
+            alpha=dtype(self.alpha),
+            gamma=dtype(self.gamma),
+            effective_radius=dtype(self.effective_radius),
+            sersic_index=dtype(self.sersic_index),
+            sersic_constant=dtype(self.sersic_constant),
         )
 
+        return image.reshape(grid_radii.shape)
+
+    def luminosity_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the total luminosity of the cored-Sersic light profile within circles of many radii, which is
+        integrated numerically as the analytic form of the Sersic profile does not apply within its core.
+        """
+        return EllipticalLightProfile.luminosity_within_circles(self, radii=radii)
+
 
 class SphericalCoreSersic(EllipticalCoreSersic):
     def __init__(
@@ -751,33 +1144,27 @@ class EllipticalChameleon(EllipticalLightProfile):
 
         axis_ratio_factor = (1.0 + self.axis_ratio) ** 2.0
 
-        return np.multiply(
-            self.intensity / (1 + self.axis_ratio),
-            np.add(
-                np.divide(
-                    1.0,
-                    np.sqrt(
-                        np.add(
-                            np.square(grid_radii),
-                            (4.0 * self.core_radius_0 ** 2.0) / axis_ratio_factor,
-                        )
-                    ),
-                ),
-                -np.divide(
-                    1.0,
-                    np.sqrt(
-                        np.add(
-                            np.square(grid_radii),
-                            (4.0 * self.core_radius_1 ** 2.0) / axis_ratio_factor,
-                        )
-                    ),
-                ),
+        grid_radii = np.asarray(grid_radii)
+
+        if grid_radii.dtype != np.float32:
+            grid_radii = grid_radii.astype("float64")
+
+        dtype = grid_radii.dtype.type
+
+        image = chameleon_image_from_grid_radii_jit(
+            grid_radii=grid_radii.reshape(-1),
+            factor=dtype(self.intensity / (1 + self.axis_ratio)),
+            core_radius_0_squared=dtype(
+                (4.0 * self.core_radius_0 ** 2.0) / axis_ratio_factor
+            ),
+            core_radius_1_squared=dtype(
+                (4.0 * self.core_radius_1 ** 2.0) / axis_ratio_factor
             ),
         )
 
+        return image.reshape(grid_radii.shape)
+
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def image_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
@@ -825,3 +1212,259 @@ class SphericalChameleon(EllipticalChameleon):
             core_radius_0=core_radius_0,
             core_radius_1=core_radius_1,
         )
+
+
+"""
+The identifiers of the light profile families evaluated by `image_from_grid_via_batch_jit`, and the number of columns
+of its parameter array. The first 6 columns of every row are the profile's centre (y,x), the cosine and sine of its
+rotation angle phi, its radial minimum and axis ratio, which are followed by the parameters of its family.
+"""
+batch_gaussian = 0
+batch_sersic = 1
+batch_core_sersic = 2
+batch_chameleon = 3
+batch_parameters_size = 13
+
+
+@decorator_util.jit()
+def image_from_grid_via_batch_jit(
+    grid, profile_families, parameters, shares_geometry, image
+):
+    """
+    Add the summed image of a set of light profiles, described by their family identifiers and parameter array (see
+    `batch_parameters_from`), to a preallocated image at every (y,x) coordinate of a grid.
+
+    Each coordinate is transformed to the reference frame of every profile (and moved to its radial minimum) and its
+    intensity evaluated in one pass, without creating a transformed copy of the grid or an image per profile. A
+    profile flagged in shares_geometry has the same centre, rotation angle, radial minimum and axis ratio as the
+    profile before it, and reuses its radii rather than transforming the coordinate again. The loop over coordinates
+    is parallelized if `parallel=True` in the numba section of the general config.
+    """
+    for i in numba.prange(grid.shape[0]):
+
+        value = 0.0
+
+        elliptical_radius = 0.0
+        eccentric_radius = 0.0
+
+        for p in range(profile_families.shape[0]):
+
+            if not shares_geometry[p]:
+
+                shifted_y = grid[i, 0] - parameters[p, 0]
+                shifted_x = grid[i, 1] - parameters[p, 1]
+
+                y = shifted_y * parameters[p, 2] - shifted_x * parameters[p, 3]
+                x = shifted_x * parameters[p, 2] + shifted_y * parameters[p, 3]
+
+                radius = np.sqrt(y ** 2 + x ** 2)
+
+                if radius < parameters[p, 4]:
+                    if radius == 0.0:
+                        y = parameters[p, 4]
+                        x = parameters[p, 4]
+                    else:
+                        y *= parameters[p, 4] / radius
+                        x *= parameters[p, 4] / radius
+
+                axis_ratio = parameters[p, 5]
+
+                elliptical_radius = np.sqrt(x ** 2 + (y / axis_ratio) ** 2)
+                eccentric_radius = np.sqrt(axis_ratio) * elliptical_radius
+
+            if profile_families[p] == batch_gaussian:
+
+                value += parameters[p, 6] * np.exp(
+                    -0.5 * (eccentric_radius / parameters[p, 7]) ** 2
+                )
+
+            elif profile_families[p] == batch_sersic:
+
+                value += sersic_intensity_jit(
+                    eccentric_radius,
+                    parameters[p, 6],
+                    parameters[p, 7],
+                    parameters[p, 8],
+                    parameters[p, 9],
+                )
+
+            elif profile_families[p] == batch_core_sersic:
+
+                value += core_sersic_intensity_jit(
+                    eccentric_radius,
+                    parameters[p, 6],
+                    parameters[p, 7],
+                    parameters[p, 8],
+                    parameters[p, 9],
+                    parameters[p, 10],
+                    parameters[p, 11],
+                    parameters[p, 12],
+                )
+
+            elif profile_families[p] == batch_chameleon:
+
+                value += parameters[p, 6] * (
+                    1.0 / np.sqrt(elliptical_radius ** 2 + parameters[p, 7])
+                    - 1.0 / np.sqrt(elliptical_radius ** 2 + parameters[p, 8])
+                )
+
+        image[i] += value
+
+    return image
+
+
+def batch_parameters_from(light_profile):
+    """
+    Returns the family identifier and row of the parameter array of a light profile evaluated by
+    `image_from_grid_via_batch_jit`, or `None` if the profile cannot be evaluated by it (e.g. because it overrides
+    how its image is computed, or it has no radial minimum in the 'radial_minimum.ini' config).
+    """
+    cls = type(light_profile)
+
+    for family, base in (
+        (batch_gaussian, EllipticalGaussian),
+        (batch_sersic, EllipticalSersic),
+        (batch_core_sersic, EllipticalCoreSersic),
+        (batch_chameleon, EllipticalChameleon),
+    ):
+        if (
+            isinstance(light_profile, base)
+            and cls.image_from_grid is base.image_from_grid
+            and cls.image_from_grid_radii is base.image_from_grid_radii
+        ):
+            break
+    else:
+        return None
+
+    if family in (batch_sersic, batch_core_sersic) and (
+        cls.sersic_constant is not AbstractEllipticalSersic.sersic_constant
+    ):
+        return None
+
+    try:
+        radial_minimum = geometry_profiles.radial_minimum_config.radial_minimum_from(
+            cls=cls
+        )
+    except KeyError:
+        return None
+
+    axis_ratio = light_profile.axis_ratio
+
+    parameters = np.zeros(batch_parameters_size)
+
+    parameters[0:6] = (
+        light_profile.centre[0],
+        light_profile.centre[1],
+        light_profile.cos_phi,
+        light_profile.sin_phi,
+        radial_minimum,
+        axis_ratio,
+    )
+
+    if family == batch_gaussian:
+
+        parameters[6:8] = (
+            light_profile.intensity,
+            light_profile.sigma / np.sqrt(axis_ratio),
+        )
+
+    elif family == batch_sersic:
+
+        parameters[6:10] = (
+            light_profile.intensity,
+            np.log(light_profile.effective_radius),
+            1.0 / light_profile.sersic_index,
+            light_profile.sersic_constant,
+        )
+
+    elif family == batch_core_sersic:
+
+        parameters[6:13] = (
+            light_profile.intensity_prime,
+            light_profile.radius_break,
+            light_profile.alpha,
+            light_profile.gamma,
+            light_profile.effective_radius,
+            light_profile.sersic_index,
+            light_profile.sersic_constant,
+        )
+
+    else:
+
+        axis_ratio_factor = (1.0 + axis_ratio) ** 2.0
+
+        parameters[6:9] = (
+            light_profile.intensity / (1 + axis_ratio),
+            (4.0 * light_profile.core_radius_0 ** 2.0) / axis_ratio_factor,
+            (4.0 * light_profile.core_radius_1 ** 2.0) / axis_ratio_factor,
+        )
+
+    return family, parameters
+
+
+def image_from_grid_via_batch(light_profiles, grid, image=None):
+    """
+    Returns the summed image of a list of light profiles (e.g. all light profiles of a galaxy or plane) on a grid of
+    (y,x) coordinates, which is added to the input image if one is supplied (e.g. a buffer shared by many calls).
+
+    Every profile supported by `image_from_grid_via_batch_jit` is evaluated by it in one pass over the grid, with the
+    remaining profiles (and Gaussian profiles on a `Grid2DPixelIntegration`) added via their `image_from_grid` method.
+    The image is computed in the precision of the grid, such that a float32 grid gives a float32 image.
+    Profiles which share the same geometry (e.g. the components of a multi-component Chameleon model with the same
+    centre and elliptical components) are evaluated one after another from one transform of every coordinate.
+
+    Parameters
+    ----------
+    light_profiles : [LightProfile]
+        The light profiles whose summed image is computed.
+    grid : grid_like
+        The (y, x) coordinates in the original reference frame of the grid.
+    image : np.ndarray or None
+        A preallocated array of shape [total_coordinates] the image is added to.
+    """
+    batch_parameters = [
+        None
+        if isinstance(grid, Grid2DPixelIntegration)
+        and isinstance(light_profile, EllipticalGaussian)
+        else batch_parameters_from(light_profile=light_profile)
+        for light_profile in light_profiles
+    ]
+
+    batched = [parameters for parameters in batch_parameters if parameters is not None]
+
+    unbatched = [
+        light_profile
+        for light_profile, parameters in zip(light_profiles, batch_parameters)
+        if parameters is None
+    ]
+
+    if not batched and image is None:
+        return sum(map(lambda p: p.image_from_grid(grid=grid), unbatched))
+
+    dtype = np.result_type(np.asarray(grid).dtype, np.float32)
+
+    if image is None:
+        image = np.zeros(grid.shape[0], dtype=dtype)
+
+    if batched:
+
+        batched = sorted(batched, key=lambda batch: tuple(batch[1][0:6]))
+
+        parameters = np.array([parameters for _, parameters in batched])
+
+        shares_geometry = np.zeros(parameters.shape[0], dtype="bool")
+        shares_geometry[1:] = np.all(parameters[1:, 0:6] == parameters[:-1, 0:6], axis=1)
+
+        image_from_grid_via_batch_jit(
+            grid=np.ascontiguousarray(grid, dtype=dtype),
+            profile_families=np.array([family for family, _ in batched]),
+            parameters=parameters.astype(dtype),
+            shares_geometry=shares_geometry,
+            image=image,
+        )
+
+    for light_profile in unbatched:
+        image += light_profile.image_from_grid(grid=grid)
+
+    return image
+
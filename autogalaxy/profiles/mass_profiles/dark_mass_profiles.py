@@ -1,3 +1,4 @@
+import functools
 import inspect
 import typing
 
@@ -7,6 +8,7 @@ from astropy import units
 from autoarray import decorator_util
 from autoarray.structures import arrays, grids
 from autogalaxy import exc
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy.util import cosmology_util
 from colossus.cosmology import cosmology as col_cosmology
@@ -14,8 +16,9 @@ from colossus.halo.concentration import concentration as col_concentration
 from numba import cfunc
 from numba.types import intc, CPointer, float64
 
-from pyquad import quad_grid
+from autogalaxy.util import quad_util
 from scipy import LowLevelCallable
+from scipy import interpolate
 from scipy import special
 from scipy.integrate import quad
 from scipy.optimize import fsolve
@@ -94,6 +97,400 @@ def jit_integrand(integrand_function):
     return LowLevelCallable(cf(wrapped).ctypes)
 
 
+def gauss_legendre_u_nodes_and_weights_from(order):
+    """
+    Returns the nodes and weights of a fixed-order Gauss-Legendre quadrature over the elliptical integration
+    variable u, which runs from 0.0 to 1.0.
+
+    The integrands of the elliptical mass profiles scale as a power of u near u = 0.0, which a polynomial rule
+    integrates poorly. The quadrature is therefore performed over t = sqrt(u), such that u = t^2 and du = 2t dt, with
+    the Jacobian of this substitution folded into the returned weights.
+
+    Parameters
+    ----------
+    order : int
+        The number of nodes of the Gauss-Legendre quadrature.
+    """
+    t, weights = np.polynomial.legendre.leggauss(order)
+
+    t = 0.5 * (t + 1.0)
+    weights = 0.5 * weights
+
+    return t ** 2, 2.0 * t * weights
+
+
+@decorator_util.jit()
+def tabulated_integral_at_eta_from(
+    eta, minimum_log_eta, bin_size, tabulate_bins, tabulated_integral
+):
+    """
+    Linearly interpolate a tabulated inner integral of the generalized NFW profile (see
+    `EllipticalGeneralizedNFW.potential_func`) at the radial coordinate eta.
+    """
+    i = 1 + int((np.log10(eta) - minimum_log_eta) / bin_size)
+
+    if i < 0:
+        i = 0
+    elif i > tabulate_bins - 2:
+        i = tabulate_bins - 2
+
+    r1 = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
+    r2 = r1 * 10.0 ** bin_size
+
+    return tabulated_integral[i] + (
+        tabulated_integral[i + 1] - tabulated_integral[i]
+    ) * (eta - r1) / (r2 - r1)
+
+
+@decorator_util.jit()
+def gnfw_potential_via_gauss_legendre_from(
+    grid,
+    axis_ratio,
+    minimum_log_eta,
+    maximum_log_eta,
+    tabulate_bins,
+    potential_integral,
+    u_nodes,
+    u_weights,
+):
+    """
+    Integrate `EllipticalGeneralizedNFW.potential_func` over u for every (y,x) coordinate of a grid in one pass,
+    using the quadrature returned by `gauss_legendre_u_nodes_and_weights_from`.
+    """
+    bin_size = (maximum_log_eta - minimum_log_eta) / (tabulate_bins - 1)
+
+    potential = np.zeros(grid.shape[0])
+
+    for i in range(grid.shape[0]):
+
+        y = grid[i, 0]
+        x = grid[i, 1]
+
+        for j in range(u_nodes.shape[0]):
+
+            u = u_nodes[j]
+            factor = 1.0 - (1.0 - axis_ratio ** 2) * u
+
+            eta_u = np.sqrt(u * ((x ** 2) + (y ** 2 / factor)))
+
+            phi = tabulated_integral_at_eta_from(
+                eta=eta_u,
+                minimum_log_eta=minimum_log_eta,
+                bin_size=bin_size,
+                tabulate_bins=tabulate_bins,
+                tabulated_integral=potential_integral,
+            )
+
+            potential[i] += u_weights[j] * eta_u * (phi / u) / factor ** 0.5
+
+    return potential
+
+
+@decorator_util.jit()
+def gnfw_deflections_via_gauss_legendre_from(
+    grid,
+    axis_ratio,
+    minimum_log_eta,
+    maximum_log_eta,
+    tabulate_bins,
+    surface_density_integral,
+    u_nodes,
+    u_weights,
+):
+    """
+    Integrate `EllipticalGeneralizedNFW.deflection_func` over u for every (y,x) coordinate of a grid in one pass,
+    using the quadrature returned by `gauss_legendre_u_nodes_and_weights_from`.
+
+    The y (npow=1) and x (npow=0) integrals share the interpolated surface density at every node, so both are
+    computed together and returned as an array of shape [total_coordinates, 2].
+    """
+    bin_size = (maximum_log_eta - minimum_log_eta) / (tabulate_bins - 1)
+
+    deflections = np.zeros((grid.shape[0], 2))
+
+    for i in range(grid.shape[0]):
+
+        y = grid[i, 0]
+        x = grid[i, 1]
+
+        for j in range(u_nodes.shape[0]):
+
+            u = u_nodes[j]
+            factor = 1.0 - (1.0 - axis_ratio ** 2) * u
+
+            eta_u = np.sqrt(u * ((x ** 2) + (y ** 2 / factor)))
+
+            kap = tabulated_integral_at_eta_from(
+                eta=eta_u,
+                minimum_log_eta=minimum_log_eta,
+                bin_size=bin_size,
+                tabulate_bins=tabulate_bins,
+                tabulated_integral=surface_density_integral,
+            )
+
+            deflections[i, 1] += u_weights[j] * kap / factor ** 0.5
+            deflections[i, 0] += u_weights[j] * kap / factor ** 1.5
+
+    return deflections
+
+
+def check_integration_mode(integration_mode):
+
+    if integration_mode not in ("quad", "gauss_legendre"):
+        raise exc.ProfileException(
+            "The integration_mode of a generalized NFW profile must be either quad or gauss_legendre, not "
+            f"{integration_mode}"
+        )
+
+
+@jit_integrand
+def gnfw_potential_integrand(x, kappa_radius, scale_radius, inner_slope):
+    return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
+        (1 - np.sqrt(1 - x ** 2)) / x
+    )
+
+
+@jit_integrand
+def gnfw_surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
+    return (
+        (3 - inner_slope)
+        * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
+        * (1 - np.sqrt(1 - x * x))
+    )
+
+
+def gnfw_potential_integral_at_etas_from(etas, scale_radius, inner_slope):
+    """
+    Integrate the inner integral of the generalized NFW potential (see `EllipticalGeneralizedNFW.potential_func`)
+    at every radial coordinate eta.
+    """
+    potential_integral = np.zeros(etas.shape[0])
+
+    for i in range(etas.shape[0]):
+
+        integral = quad(
+            gnfw_potential_integrand,
+            a=0.0,
+            b=1.0,
+            args=(etas[i], scale_radius, inner_slope),
+            epsrel=AbstractEllipticalGeneralizedNFW.epsrel,
+        )[0]
+
+        potential_integral[i] = ((etas[i] / scale_radius) ** (2 - inner_slope)) * (
+            (1.0 / (3 - inner_slope))
+            * special.hyp2f1(
+                3 - inner_slope,
+                3 - inner_slope,
+                4 - inner_slope,
+                -(etas[i] / scale_radius),
+            )
+            + integral
+        )
+
+    return potential_integral
+
+
+def gnfw_surface_density_integral_at_etas_from(etas, scale_radius, inner_slope):
+    """
+    Integrate the inner integral of the generalized NFW surface density (see
+    `EllipticalGeneralizedNFW.deflection_func`) at every radial coordinate eta.
+    """
+    surface_density_integral = np.zeros(etas.shape[0])
+
+    for i in range(etas.shape[0]):
+
+        integral = quad(
+            gnfw_surface_density_integrand,
+            a=0.0,
+            b=1.0,
+            args=(etas[i], scale_radius, inner_slope),
+            epsrel=AbstractEllipticalGeneralizedNFW.epsrel,
+        )[0]
+
+        surface_density_integral[i] = (
+            (etas[i] / scale_radius) ** (1 - inner_slope)
+        ) * (((1 + etas[i] / scale_radius) ** (inner_slope - 3)) + integral)
+
+    return surface_density_integral
+
+
+gnfw_integral_at_etas_func_dict = {
+    "potential": gnfw_potential_integral_at_etas_from,
+    "surface_density": gnfw_surface_density_integral_at_etas_from,
+}
+
+"""
+The 2D master tables of the generalized NFW inner integrals span log10(eta / scale_radius) and inner_slope over the
+ranges below. Both integrals depend on eta and scale_radius only via their ratio, thus a single table serves every
+scale_radius.
+"""
+master_table_minimum_log_eta_scaled = -5.5
+master_table_maximum_log_eta_scaled = 4.0
+master_table_log_eta_scaled_bins = 476
+master_table_minimum_inner_slope = 0.0
+master_table_maximum_inner_slope = 2.5
+master_table_inner_slope_bins = 51
+
+
+@functools.lru_cache(maxsize=None)
+def gnfw_master_table_spline_from(integral):
+    """
+    Returns a bicubic spline of log10 of a generalized NFW inner integral (either "potential" or "surface_density")
+    over (log10(eta / scale_radius), inner_slope).
+
+    The table is integrated once, the first time it is requested, and is held in memory thereafter.
+    """
+    log_eta_scaled = np.linspace(
+        master_table_minimum_log_eta_scaled,
+        master_table_maximum_log_eta_scaled,
+        master_table_log_eta_scaled_bins,
+    )
+    inner_slopes = np.linspace(
+        master_table_minimum_inner_slope,
+        master_table_maximum_inner_slope,
+        master_table_inner_slope_bins,
+    )
+
+    table = np.zeros((log_eta_scaled.shape[0], inner_slopes.shape[0]))
+
+    for j, inner_slope in enumerate(inner_slopes):
+        table[:, j] = gnfw_integral_at_etas_func_dict[integral](
+            etas=10.0 ** log_eta_scaled, scale_radius=1.0, inner_slope=inner_slope
+        )
+
+    return interpolate.RectBivariateSpline(
+        log_eta_scaled, inner_slopes, np.log10(table), kx=3, ky=3
+    )
+
+
+def gnfw_master_table_covers(minimum_log_eta, maximum_log_eta, scale_radius, inner_slope):
+    """
+    Returns whether the generalized NFW master tables span the tabulation range and inner slope of a profile.
+    """
+    log_scale_radius = np.log10(scale_radius)
+
+    return (
+        master_table_minimum_log_eta_scaled <= minimum_log_eta - log_scale_radius
+        and maximum_log_eta - log_scale_radius <= master_table_maximum_log_eta_scaled
+        and master_table_minimum_inner_slope
+        <= inner_slope
+        <= master_table_maximum_inner_slope
+    )
+
+
+"""
+The maximum number of generalized NFW tables held by the LRU cache of `gnfw_tabulated_integral_from`, where each
+table of the default 1000 bins uses 8kB of memory.
+"""
+tabulated_integral_cache_size = 256
+
+
+@functools.lru_cache(maxsize=tabulated_integral_cache_size)
+def gnfw_tabulated_integral_from(
+    integral,
+    minimum_log_eta,
+    maximum_log_eta,
+    tabulate_bins,
+    scale_radius,
+    inner_slope,
+    tabulate_mode="quad",
+):
+    """
+    Returns the tabulated inner integral (either "potential" or "surface_density") of the generalized NFW profile,
+    whose values are interpolated in `potential_func` and `deflection_func`.
+
+    The tabulation depends only on the input parameters, thus it is memoized in a bounded LRU cache, such that
+    repeated evaluations of the same profile (e.g. on the image and blurring grids of a fit, or a profile revisited
+    during a non-linear search) perform a lookup rather than thousands of integrals. The returned array is read-only
+    as it is shared by every caller.
+
+    Parameters
+    ----------
+    integral : str
+        Which inner integral is tabulated, "potential" or "surface_density".
+    minimum_log_eta : float
+        The log10 of the minimum radial coordinate eta of the table.
+    maximum_log_eta : float
+        The log10 of the maximum radial coordinate eta of the table.
+    tabulate_bins : int
+        The number of bins to tabulate the inner integral of this profile.
+    scale_radius : float
+        The arc-second scale radius of the profile.
+    inner_slope : float
+        The inner slope of the profile.
+    tabulate_mode : str
+        Whether the table is integrated with quad ("quad") or interpolated from the 2D master table of the integral
+        ("master_table"), where the latter falls back to "quad" if the profile is outside the master table's range.
+    """
+    if tabulate_mode not in ("quad", "master_table"):
+        raise exc.ProfileException(
+            "The tabulate_mode of a generalized NFW profile must be either quad or master_table, not "
+            f"{tabulate_mode}"
+        )
+
+    bin_size = (maximum_log_eta - minimum_log_eta) / (tabulate_bins - 1)
+
+    log_etas = minimum_log_eta + (np.arange(tabulate_bins) - 1) * bin_size
+
+    if tabulate_mode == "master_table" and gnfw_master_table_covers(
+        minimum_log_eta=minimum_log_eta - bin_size,
+        maximum_log_eta=maximum_log_eta,
+        scale_radius=scale_radius,
+        inner_slope=inner_slope,
+    ):
+
+        spline = gnfw_master_table_spline_from(integral=integral)
+
+        tabulated_integral = 10.0 ** spline.ev(
+            log_etas - np.log10(scale_radius), np.full(tabulate_bins, inner_slope)
+        )
+
+    else:
+
+        tabulated_integral = gnfw_integral_at_etas_func_dict[integral](
+            etas=10.0 ** log_etas, scale_radius=scale_radius, inner_slope=inner_slope
+        )
+
+    tabulated_integral.setflags(write=False)
+
+    return tabulated_integral
+
+
+
+"""
+The 1D convergence tables of the generalized NFW profile span log10(eta / scale_radius) over the range below, with
+one table per inner_slope held in an LRU cache of the size given.
+"""
+convergence_table_minimum_log_eta_scaled = -5.5
+convergence_table_maximum_log_eta_scaled = 4.0
+convergence_table_log_eta_scaled_bins = 951
+convergence_table_cache_size = 64
+
+
+@functools.lru_cache(maxsize=convergence_table_cache_size)
+def gnfw_convergence_spline_from(inner_slope):
+    """
+    Returns a cubic spline of log10 of the generalized NFW surface density inner integral over
+    log10(eta / scale_radius), which is the convergence of the profile divided by 2 * kappa_s.
+
+    The integral depends on eta and scale_radius only via their ratio, thus one table serves every scale_radius and
+    kappa_s of a given inner_slope. It is integrated the first time the inner_slope is requested.
+    """
+    log_eta_scaled = np.linspace(
+        convergence_table_minimum_log_eta_scaled,
+        convergence_table_maximum_log_eta_scaled,
+        convergence_table_log_eta_scaled_bins,
+    )
+
+    table = gnfw_surface_density_integral_at_etas_from(
+        etas=10.0 ** log_eta_scaled, scale_radius=1.0, inner_slope=inner_slope
+    )
+
+    return interpolate.InterpolatedUnivariateSpline(
+        log_eta_scaled, np.log10(table), k=3
+    )
+
+
 class DarkProfile:
 
     pass
@@ -104,6 +501,7 @@ class AbstractEllipticalGeneralizedNFW(
     mp.EllipticalMassProfile, mp.MassProfile, DarkProfile, MassProfileMGE
 ):
     epsrel = 1.49e-5
+    gauss_legendre_order = 64
 
     def __init__(
         self,
@@ -165,7 +563,7 @@ class AbstractEllipticalGeneralizedNFW(
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -182,7 +580,7 @@ class AbstractEllipticalGeneralizedNFW(
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def convergence_from_grid_via_gaussians(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -456,8 +854,15 @@ class AbstractEllipticalGeneralizedNFW(
 class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
-    def potential_from_grid(self, grid, tabulate_bins=1000):
+    @geometry_profiles.relocate_to_radial_minimum
+    def potential_from_grid(
+        self,
+        grid,
+        tabulate_bins=1000,
+        integration_mode="quad",
+        gauss_legendre_order=None,
+        tabulate_mode="quad",
+    ):
         """
         Calculate the potential at a given set of arc-second gridded coordinates.
 
@@ -467,14 +872,18 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         tabulate_bins : int
             The number of bins to tabulate the inner integral of this profile.
-
+        integration_mode : str
+            How the integral over u is performed for every coordinate, either "quad" (an adaptive scipy quad call
+            per coordinate) or "gauss_legendre" (a fixed-order quadrature evaluated for all coordinates at once).
+        gauss_legendre_order : int or None
+            The number of nodes used by the "gauss_legendre" integration mode, where `None` uses the class attribute
+            `gauss_legendre_order`.
+        tabulate_mode : str
+            Whether the inner integral is tabulated via quad ("quad") or interpolated from a precomputed 2D master
+            table over (eta / scale_radius, inner_slope) ("master_table"). Tables are cached, see
+            `gnfw_tabulated_integral_from`.
         """
-
-        @jit_integrand
-        def deflection_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
-                (1 - np.sqrt(1 - x ** 2)) / x
-            )
+        check_integration_mode(integration_mode=integration_mode)
 
         (
             eta_min,
@@ -486,30 +895,33 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
 
         potential_grid = np.zeros(grid.shape[0])
 
-        deflection_integral = np.zeros((tabulate_bins,))
+        deflection_integral = gnfw_tabulated_integral_from(
+            integral="potential",
+            minimum_log_eta=float(minimum_log_eta),
+            maximum_log_eta=float(maximum_log_eta),
+            tabulate_bins=tabulate_bins,
+            scale_radius=float(self.scale_radius),
+            inner_slope=float(self.inner_slope),
+            tabulate_mode=tabulate_mode,
+        )
 
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
+        if integration_mode == "gauss_legendre":
 
-            integral = quad(
-                deflection_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=EllipticalGeneralizedNFW.epsrel,
-            )[0]
+            u_nodes, u_weights = gauss_legendre_u_nodes_and_weights_from(
+                order=gauss_legendre_order or self.gauss_legendre_order
+            )
 
-            deflection_integral[i] = (
-                (eta / self.scale_radius) ** (2 - self.inner_slope)
-            ) * (
-                (1.0 / (3 - self.inner_slope))
-                * special.hyp2f1(
-                    3 - self.inner_slope,
-                    3 - self.inner_slope,
-                    4 - self.inner_slope,
-                    -(eta / self.scale_radius),
+            return (2.0 * self.kappa_s * self.axis_ratio) * (
+                gnfw_potential_via_gauss_legendre_from(
+                    grid=np.asarray(grid),
+                    axis_ratio=self.axis_ratio,
+                    minimum_log_eta=minimum_log_eta,
+                    maximum_log_eta=maximum_log_eta,
+                    tabulate_bins=tabulate_bins,
+                    potential_integral=deflection_integral,
+                    u_nodes=u_nodes,
+                    u_weights=u_weights,
                 )
-                + integral
             )
 
         for i in range(grid.shape[0]):
@@ -534,7 +946,7 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
 
         return self._deflections_from_grid_via_gaussians(
@@ -543,8 +955,15 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
-    def deflections_from_grid_via_integrator(self, grid, tabulate_bins=1000):
+    @geometry_profiles.relocate_to_radial_minimum
+    def deflections_from_grid_via_integrator(
+        self,
+        grid,
+        tabulate_bins=1000,
+        integration_mode="quad",
+        gauss_legendre_order=None,
+        tabulate_mode="quad",
+    ):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
 
@@ -554,16 +973,18 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         tabulate_bins : int
             The number of bins to tabulate the inner integral of this profile.
-
+        integration_mode : str
+            How the integral over u is performed for every coordinate, either "quad" (an adaptive scipy quad call
+            per coordinate) or "gauss_legendre" (a fixed-order quadrature evaluated for all coordinates at once).
+        gauss_legendre_order : int or None
+            The number of nodes used by the "gauss_legendre" integration mode, where `None` uses the class attribute
+            `gauss_legendre_order`.
+        tabulate_mode : str
+            Whether the inner integral is tabulated via quad ("quad") or interpolated from a precomputed 2D master
+            table over (eta / scale_radius, inner_slope) ("master_table"). Tables are cached, see
+            `gnfw_tabulated_integral_from`.
         """
-
-        @jit_integrand
-        def surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (
-                (3 - inner_slope)
-                * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
-                * (1 - np.sqrt(1 - x * x))
-            )
+        check_integration_mode(integration_mode=integration_mode)
 
         def calculate_deflection_component(npow, yx_index):
 
@@ -594,7 +1015,7 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
                     )[0]
                 )
 
-                return deflection_grid
+            return deflection_grid
 
         (
             eta_min,
@@ -604,22 +1025,36 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
             bin_size,
         ) = self.tabulate_integral(grid, tabulate_bins)
 
-        surface_density_integral = np.zeros((tabulate_bins,))
+        surface_density_integral = gnfw_tabulated_integral_from(
+            integral="surface_density",
+            minimum_log_eta=float(minimum_log_eta),
+            maximum_log_eta=float(maximum_log_eta),
+            tabulate_bins=tabulate_bins,
+            scale_radius=float(self.scale_radius),
+            inner_slope=float(self.inner_slope),
+            tabulate_mode=tabulate_mode,
+        )
 
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
+        if integration_mode == "gauss_legendre":
 
-            integral = quad(
-                surface_density_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=EllipticalGeneralizedNFW.epsrel,
-            )[0]
+            u_nodes, u_weights = gauss_legendre_u_nodes_and_weights_from(
+                order=gauss_legendre_order or self.gauss_legendre_order
+            )
 
-            surface_density_integral[i] = (
-                (eta / self.scale_radius) ** (1 - self.inner_slope)
-            ) * (((1 + eta / self.scale_radius) ** (self.inner_slope - 3)) + integral)
+            deflections = gnfw_deflections_via_gauss_legendre_from(
+                grid=np.asarray(grid),
+                axis_ratio=self.axis_ratio,
+                minimum_log_eta=minimum_log_eta,
+                maximum_log_eta=maximum_log_eta,
+                tabulate_bins=tabulate_bins,
+                surface_density_integral=surface_density_integral,
+                u_nodes=u_nodes,
+                u_weights=u_weights,
+            )
+
+            return self.rotate_grid_from_profile(
+                2.0 * self.kappa_s * self.axis_ratio * np.multiply(grid, deflections)
+            )
 
         deflection_y = calculate_deflection_component(npow=1.0, yx_index=0)
         deflection_x = calculate_deflection_component(npow=0.0, yx_index=1)
@@ -629,10 +1064,40 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
         )
 
     def convergence_func(self, grid_radius):
+        """
+        Returns the convergence at every elliptical radius, by evaluating a spline of the tabulated surface density
+        inner integral (see `gnfw_convergence_spline_from`) at log10(radius / scale_radius).
+
+        Radii outside the range of the table are integrated directly, as in `convergence_func_via_integrator`.
+        """
+        grid_radius = np.asarray(grid_radius, dtype="float64")
+
+        log_eta_scaled = np.log10(np.atleast_1d(grid_radius) / self.scale_radius)
+
+        in_table = (log_eta_scaled >= convergence_table_minimum_log_eta_scaled) & (
+            log_eta_scaled <= convergence_table_maximum_log_eta_scaled
+        )
+
+        convergence = np.zeros(log_eta_scaled.shape[0])
+
+        spline = gnfw_convergence_spline_from(inner_slope=float(self.inner_slope))
+
+        convergence[in_table] = (
+            2.0 * self.kappa_s * 10.0 ** spline(log_eta_scaled[in_table])
+        )
+
+        if not np.all(in_table):
+            convergence[~in_table] = self.convergence_func_via_integrator(
+                grid_radius=np.atleast_1d(grid_radius)[~in_table]
+            )
+
+        return convergence.reshape(grid_radius.shape)
+
+    def convergence_func_via_integrator(self, grid_radius):
         def integral_y(y, eta):
             return (y + eta) ** (self.inner_slope - 4) * (1 - np.sqrt(1 - y ** 2))
 
-        grid_radius = (1.0 / self.scale_radius) * grid_radius
+        grid_radius = (1.0 / self.scale_radius) * np.array(grid_radius)
 
         for index in range(grid_radius.shape[0]):
 
@@ -736,7 +1201,7 @@ class SphericalGeneralizedNFW(EllipticalGeneralizedNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid_via_integrator(self, grid, **kwargs):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -853,7 +1318,7 @@ class SphericalTruncatedNFW(AbstractEllipticalGeneralizedNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid, **kwargs):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1096,7 +1561,7 @@ class EllipticalNFW(EllipticalGeneralizedNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def potential_from_grid(self, grid):
         """
         Calculate the potential at a given set of arc-second gridded coordinates.
@@ -1107,7 +1572,7 @@ class EllipticalNFW(EllipticalGeneralizedNFW):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-        potential_grid = quad_grid(
+        potential_grid = quad_util.quad_grid_from(
             self.potential_func,
             0.0,
             1.0,
@@ -1120,7 +1585,7 @@ class EllipticalNFW(EllipticalGeneralizedNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid_via_integrator(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1136,7 +1601,7 @@ class EllipticalNFW(EllipticalGeneralizedNFW):
             deflection_grid = self.axis_ratio * grid[:, index]
             deflection_grid *= (
                 self.kappa_s
-                * quad_grid(
+                * quad_util.quad_grid_from(
                     self.deflection_func,
                     0.0,
                     1.0,
@@ -1241,7 +1706,7 @@ class SphericalNFW(EllipticalNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def potential_from_grid(self, grid):
         """
         Calculate the potential at a given set of arc-second gridded coordinates.
@@ -1267,7 +1732,7 @@ class SphericalNFW(EllipticalNFW):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid, **kwargs):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1,13 +1,19 @@
+import collections
+import functools
+import numbers
 import typing
 
+import numba
 import numpy as np
 from scipy.integrate import quad
 from scipy.optimize import root_scalar
 from scipy.special import wofz, comb
+from autoarray import decorator_util
 from autoarray.structures import arrays, grids
 from autogalaxy import lensing
 from autogalaxy.profiles import geometry_profiles
 from autogalaxy import exc
+from autogalaxy.util import quad_util
 
 
 class MassProfile(lensing.LensingObject):
@@ -26,6 +32,35 @@ class MassProfile(lensing.LensingObject):
     def with_new_normalization(self, normalization):
         raise NotImplementedError()
 
+    def convergence_from_array(self, array):
+        """
+        Returns the convergence on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2] as an
+        ndarray, bypassing the grid decorators of `convergence_from_grid` (see
+        `geometry_profiles.result_from_func_and_array`).
+        """
+        return geometry_profiles.result_from_func_and_array(
+            profile=self, func=type(self).convergence_from_grid, array=array
+        )
+
+    def potential_from_array(self, array):
+        """
+        Returns the potential on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2] as an ndarray,
+        bypassing the grid decorators of `potential_from_grid` (see `geometry_profiles.result_from_func_and_array`).
+        """
+        return geometry_profiles.result_from_func_and_array(
+            profile=self, func=type(self).potential_from_grid, array=array
+        )
+
+    def deflections_from_array(self, array):
+        """
+        Returns the (y,x) deflection angles on a plain ndarray of (y,x) coordinates of shape [total_coordinates, 2]
+        as an ndarray, bypassing the grid decorators of `deflections_from_grid` (see
+        `geometry_profiles.result_from_func_and_array`).
+        """
+        return geometry_profiles.result_from_func_and_array(
+            profile=self, func=type(self).deflections_from_grid, array=array
+        )
+
     def extract_attribute(self, cls, name):
         """
         Returns an attribute of a class and its children profiles in the the galaxy as a `ValueIrregular`
@@ -105,6 +140,24 @@ class EllipticalMassProfile(geometry_profiles.EllipticalProfile, MassProfile):
 
         return quad(self.mass_integral, a=0.0, b=radius)[0]
 
+    def mass_angular_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the angular mass of the mass profile within circles of many radii, centred on the mass profile (see
+        `mass_angular_within_circle`).
+
+        The mass within every radius is computed from one cumulative integral of the convergence over the radii (see
+        `quad_util.integral_within_circles_from`), as opposed to integrating the convergence from zero to every
+        radius.
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the angular mass within, which is returned in the same shape.
+        """
+        return quad_util.integral_within_circles_from(
+            func=self.convergence_func, radii=radii
+        )
+
     def density_between_circular_annuli(
         self, inner_annuli_radius: float, outer_annuli_radius: float
     ):
@@ -268,72 +321,96 @@ class EllipticalMassProfile(geometry_profiles.EllipticalProfile, MassProfile):
         ).root
 
 
-class MassProfileMGE:
-    def __init__(self):
-
-        self.count = 0
-        self.sigma_calc = 0
-        self.z = 0
-        self.zq = 0
-        self.expv = 0
-
-    @staticmethod
-    #  @decorator_util.jit()
-    def zeta_from_grid(grid, amps, sigmas, axis_ratio):
+"""
+The maximum number of (amps, sigmas) decompositions held by the LRU cache of
+`MassProfileMGE._decompose_convergence_into_gaussians_via_cache`.
+"""
+mge_decomposition_cache_size = 256
 
-        """
-        The key part to compute the deflection angle of each Gaussian.
-        Because of my optimization, there are blocks looking weird and indirect. What I'm doing here
-        is trying to avoid big matrix operation to save time.
-        I think there are still spaces we can optimize.
+mge_decomposition_cache = collections.OrderedDict()
 
-        It seems when using w_f_approx, it gives some errors if y < 0. So when computing for places
-        where y < 0, we first compute the value at - y, and then change its sign.
-        """
 
-        output_grid_final = np.zeros(grid.shape[0], dtype="complex128")
+def mge_parameter_key_from(value):
+    """
+    Returns a hashable key of the value of one attribute of a profile, which may be a number, string, None, ndarray
+    or a tuple / list of these. Any other value raises a `TypeError`.
+    """
+    if value is None or isinstance(value, (numbers.Number, str)):
+        return value
 
-        q2 = axis_ratio ** 2.0
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
 
-        scale_factor = axis_ratio / (sigmas[0] * np.sqrt(2.0 * (1.0 - q2)))
+    if isinstance(value, (tuple, list)):
+        return tuple(mge_parameter_key_from(value=entry) for entry in value)
 
-        xs = (grid[:, 1] * scale_factor).copy()
-        ys = (grid[:, 0] * scale_factor).copy()
+    raise TypeError(f"A value of type {type(value).__name__} cannot be keyed")
 
-        ys_minus = ys < 0.0
-        ys[ys_minus] *= -1
-        z = xs + 1j * ys
-        zq = axis_ratio * xs + 1j * ys / axis_ratio
 
-        expv = -(xs ** 2.0) * (1.0 - q2) - ys ** 2.0 * (1.0 / q2 - 1.0)
+def mge_parameters_key_from(profile):
+    """
+    Returns a hashable key of the parameters of a profile, which are all of its (non-private) attributes (e.g. its
+    centre, elliptical components and normalization, or the kappa_s and scale radius a profile computes from the
+    arguments of its constructor), as these are the values its decomposition is computed from.
 
-        for i in range(len(sigmas)):
+    Returns None if an attribute cannot be used in a key (see `mge_parameter_key_from`), in which case the
+    decomposition of the profile is not cached.
+    """
+    try:
+        return tuple(
+            (name, mge_parameter_key_from(value=value))
+            for name, value in sorted(vars(profile).items())
+            if not name.startswith("_")
+        )
+    except TypeError:
+        return None
 
-            if i > 0:
-                z /= sigmas[i] / sigmas[i - 1]
-                zq /= sigmas[i] / sigmas[i - 1]
-                expv /= (sigmas[i] / sigmas[i - 1]) ** 2.0
 
-            output_grid = -1j * (w_f_approx(z) - np.exp(expv) * w_f_approx(zq))
+class MassProfileMGE:
+    def __init__(self):
 
-            output_grid[ys_minus] = np.conj(output_grid[ys_minus])
+        self.count = 0
+        self.sigma_calc = 0
+        self.z = 0
+        self.zq = 0
+        self.expv = 0
 
-            output_grid_final += (amps[i] * sigmas[i]) * output_grid
+    @staticmethod
+    def zeta_from_grid(grid, amps, sigmas, axis_ratio):
+        """
+        The key part to compute the deflection angle of each Gaussian, which sums the complex deflection of every
+        Gaussian at every (y,x) coordinate of the grid.
 
-        return output_grid_final
+        The sum is performed by the numba kernel `zeta_from_grid_jit`, which loops over coordinates and Gaussians in
+        one pass without allocating intermediate arrays.
+        """
+        return zeta_from_grid_jit(
+            grid=np.asarray(grid, dtype="float64"),
+            amps=np.asarray(amps, dtype="float64"),
+            sigmas=np.asarray(sigmas, dtype="float64"),
+            axis_ratio=axis_ratio,
+        )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def kesi(p):
         """
         see Eq.(6) of 1906.08263
+
+        The coefficients depend only on p, thus they are computed once per p and shared (read-only) thereafter.
         """
         n_list = np.arange(0, 2 * p + 1, 1)
-        return (2.0 * p * np.log(10) / 3.0 + 2.0 * np.pi * n_list * 1j) ** (0.5)
+        kesi_list = (2.0 * p * np.log(10) / 3.0 + 2.0 * np.pi * n_list * 1j) ** (0.5)
+        kesi_list.setflags(write=False)
+        return kesi_list
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def eta(p):
         """
         see Eq.(6) of 1906.00263
+
+        The coefficients depend only on p, thus they are computed once per p and shared (read-only) thereafter.
         """
         eta_list = np.zeros(int(2 * p + 1))
         kesi_list = np.zeros(int(2 * p + 1))
@@ -349,11 +426,52 @@ class MassProfileMGE:
                 (-1) ** i * 2.0 * np.sqrt(2.0 * np.pi) * 10 ** (p / 3.0) * kesi_list[i]
             )
 
+        eta_list.setflags(write=False)
         return eta_list
 
     def decompose_convergence_into_gaussians(self):
         raise NotImplementedError()
 
+    def _decompose_convergence_into_gaussians_via_cache(self):
+        """
+        Returns the (amps, sigmas) of `decompose_convergence_into_gaussians`, which are memoized in a bounded LRU
+        cache keyed on the profile's class and parameters (see `mge_parameters_key_from`).
+
+        The decomposition is reused for every grid a profile is evaluated on (e.g. the image and blurring grids of a
+        fit) and by its convergence. Copies of a profile with different parameters, for example those returned by
+        `with_new_normalization`, produce a different key and are therefore decomposed afresh. The returned arrays
+        are read-only as they are shared by every caller. Profiles with an attribute that cannot be keyed are
+        decomposed on every call.
+        """
+        parameters_key = mge_parameters_key_from(profile=self)
+
+        key = (self.__class__, parameters_key)
+
+        if parameters_key is not None:
+            try:
+                amps_and_sigmas = mge_decomposition_cache[key]
+                mge_decomposition_cache.move_to_end(key)
+                return amps_and_sigmas
+            except KeyError:
+                pass
+
+        amps, sigmas = self.decompose_convergence_into_gaussians()
+
+        amps = np.array(amps, dtype="float64")
+        sigmas = np.array(sigmas, dtype="float64")
+        amps.setflags(write=False)
+        sigmas.setflags(write=False)
+
+        if parameters_key is None:
+            return amps, sigmas
+
+        mge_decomposition_cache[key] = (amps, sigmas)
+
+        if len(mge_decomposition_cache) > mge_decomposition_cache_size:
+            mge_decomposition_cache.popitem(last=False)
+
+        return amps, sigmas
+
     def _decompose_convergence_into_gaussians(
         self, func, radii_min, radii_max, func_terms=28, func_gaussians=20
     ):
@@ -387,14 +505,10 @@ class MassProfileMGE:
         d_log_sigma = log_sigmas[1] - log_sigmas[0]
         sigmas = np.exp(log_sigmas)
 
-        amps = np.zeros(func_gaussians)
+        f_sigmas = np.sum(etas * np.real(func(np.outer(sigmas, kesis))), axis=1)
 
-        for i in range(func_gaussians):
-            f_sigma = np.sum(etas * np.real(func(sigmas[i] * kesis)))
-            if (i == -1) or (i == (func_gaussians - 1)):
-                amps[i] = 0.5 * f_sigma * d_log_sigma / np.sqrt(2.0 * np.pi)
-            else:
-                amps[i] = f_sigma * d_log_sigma / np.sqrt(2.0 * np.pi)
+        amps = f_sigmas * d_log_sigma / np.sqrt(2.0 * np.pi)
+        amps[-1] *= 0.5
 
         return amps, sigmas
 
@@ -417,7 +531,7 @@ class MassProfileMGE:
         self.zq = 0
         self.expv = 0
 
-        amps, sigmas = self.decompose_convergence_into_gaussians()
+        amps, sigmas = self._decompose_convergence_into_gaussians_via_cache()
 
         if self.axis_ratio > 0.9999:
             self.axis_ratio = 0.9999
@@ -442,8 +556,8 @@ class MassProfileMGE:
         if self.axis_ratio > 0.9999:
             axis_ratio = 0.9999
 
-        amps, sigmas = self.decompose_convergence_into_gaussians()
-        sigmas *= sigmas_factor
+        amps, sigmas = self._decompose_convergence_into_gaussians_via_cache()
+        sigmas = sigmas * sigmas_factor
 
         angle = self.zeta_from_grid(
             grid=grid, amps=amps, sigmas=sigmas, axis_ratio=axis_ratio
@@ -544,6 +658,118 @@ def w_f_approx(z):
     return wz
 
 
+@decorator_util.jit()
+def w_f_approx_jit(z):
+    """
+    Compute the Faddeeva function :math:`w_{\mathrm F}(z)` of a single complex number using the approximation
+    given in Zaghloul (2017), with the same regions and coefficients as `w_f_approx`.
+    """
+    if z.imag < 0.0:
+        z = np.conj(z)
+
+    sqrt_pi = 1.0 / np.sqrt(np.pi)
+    i_sqrt_pi = 1j * sqrt_pi
+
+    z_imag2 = z.imag ** 2
+    abs_z2 = z.real ** 2 + z_imag2
+
+    if abs_z2 >= 38000.0:
+        return i_sqrt_pi / z
+
+    if abs_z2 >= 256.0:
+        return i_sqrt_pi * z / (z * z - 0.5)
+
+    if abs_z2 >= 62.0:
+        return (i_sqrt_pi / z) * (1 + 0.5 / (z * z - 1.5))
+
+    if abs_z2 >= 30.0 and z_imag2 >= 1e-13:
+        zz = z * z
+        return (i_sqrt_pi * z) * (zz - 2.5) / (zz * (zz - 3.0) + 0.75)
+
+    if abs_z2 > 2.5 and z_imag2 < 0.072:
+        u = -z * z
+        f1 = sqrt_pi + 0j
+        f1 = 1.320522 - f1 * u
+        f1 = 35.7668 - f1 * u
+        f1 = 219.031 - f1 * u
+        f1 = 1540.787 - f1 * u
+        f1 = 3321.99 - f1 * u
+        f1 = 36183.31 - f1 * u
+        f2 = 1.0 + 0j
+        f2 = 1.841439 - f2 * u
+        f2 = 61.57037 - f2 * u
+        f2 = 364.2191 - f2 * u
+        f2 = 2186.181 - f2 * u
+        f2 = 9022.228 - f2 * u
+        f2 = 24322.84 - f2 * u
+        f2 = 32066.6 - f2 * u
+        return np.exp(u) + 1j * z * f1 / f2
+
+    t3 = -1j * z
+    f1 = sqrt_pi + 0j
+    f1 = f1 * t3 + 5.9126262
+    f1 = f1 * t3 + 30.180142
+    f1 = f1 * t3 + 93.15558
+    f1 = f1 * t3 + 181.92853
+    f1 = f1 * t3 + 214.38239
+    f1 = f1 * t3 + 122.60793
+    f2 = 1.0 + 0j
+    f2 = f2 * t3 + 10.479857
+    f2 = f2 * t3 + 53.992907
+    f2 = f2 * t3 + 170.35400
+    f2 = f2 * t3 + 348.70392
+    f2 = f2 * t3 + 457.33448
+    f2 = f2 * t3 + 352.73063
+    f2 = f2 * t3 + 122.60793
+    return f1 / f2
+
+
+@decorator_util.jit()
+def zeta_from_grid_jit(grid, amps, sigmas, axis_ratio):
+    """
+    Sum the complex deflection angles of a set of Gaussians (see `MassProfileMGE.zeta_from_grid`) at every (y,x)
+    coordinate of a grid, looping over coordinates and Gaussians in one pass.
+
+    The Faddeeva approximation gives errors for y < 0, thus coordinates where y < 0 are evaluated at -y and their
+    result conjugated. The loop over coordinates is parallelized if `parallel=True` in the numba section of the
+    general config.
+    """
+    zeta = np.zeros(grid.shape[0], dtype=np.complex128)
+
+    q2 = axis_ratio ** 2.0
+
+    scale_factor = axis_ratio / np.sqrt(2.0 * (1.0 - q2))
+
+    for j in numba.prange(grid.shape[0]):
+
+        xs = grid[j, 1] * scale_factor
+        ys = np.abs(grid[j, 0]) * scale_factor
+
+        expv = -(xs ** 2.0) * (1.0 - q2) - ys ** 2.0 * (1.0 / q2 - 1.0)
+
+        zeta_j = 0.0 + 0.0j
+
+        for i in range(sigmas.shape[0]):
+
+            z = (xs + 1j * ys) / sigmas[i]
+            zq = (axis_ratio * xs + 1j * ys / axis_ratio) / sigmas[i]
+
+            zeta_j += (amps[i] * sigmas[i]) * (
+                -1j
+                * (
+                    w_f_approx_jit(z)
+                    - np.exp(expv / sigmas[i] ** 2.0) * w_f_approx_jit(zq)
+                )
+            )
+
+        if grid[j, 0] < 0.0:
+            zeta_j = np.conj(zeta_j)
+
+        zeta[j] = zeta_j
+
+    return zeta
+
+
 def psi_from(grid, axis_ratio, core_radius):
     """
     Returns the $\Psi$ term in expressions for the calculation of the deflection of an elliptical isothermal mass
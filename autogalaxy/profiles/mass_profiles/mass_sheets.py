@@ -39,7 +39,7 @@ class MassSheet(geometry_profiles.SphericalProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         grid_radii = self.grid_to_grid_radii(grid=grid)
         return self.grid_to_grid_cartesian(grid=grid, radius=self.kappa * grid_radii)
@@ -89,7 +89,7 @@ class ExternalShear(geometry_profiles.EllipticalProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1,9 +1,13 @@
-from autogalaxy.profiles.mass_profiles.mass_profiles import psi_from
+import numba
 import numpy as np
+from autoarray import decorator_util
 from autoarray.structures import grids
+from autogalaxy import exc
+from autogalaxy.profiles import geometry_profiles
+from autogalaxy.profiles import light_profiles as lp
 from autogalaxy.profiles import mass_profiles as mp
 
-from pyquad import quad_grid
+from autogalaxy.util import quad_util
 from scipy.special import wofz
 import typing
 import copy
@@ -84,7 +88,7 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -112,7 +116,7 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid_via_integrator(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -131,7 +135,7 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
+                * quad_util.quad_grid_from(
                     self.deflection_func,
                     0.0,
                     1.0,
@@ -160,8 +164,6 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -176,6 +178,27 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
     def convergence_func(self, grid_radius):
         return self.mass_to_light_ratio * self.image_from_grid_radii(grid_radius)
 
+    def mass_angular_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the angular mass of the Gaussian mass profile within circles of many radii, which is computed
+        analytically as the mass_to_light_ratio times the luminosity of the Gaussian within each circle.
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the angular mass within, which is returned in the same shape.
+        """
+        sigma_squared = self.sigma ** 2 / self.axis_ratio
+
+        return (
+            -2.0
+            * np.pi
+            * self.mass_to_light_ratio
+            * self.intensity
+            * sigma_squared
+            * np.expm1(-0.5 * np.square(np.asarray(radii, dtype="float64")) / sigma_squared)
+        )
+
     def image_from_grid_radii(self, grid_radii):
         """Calculate the intensity of the Gaussian light profile on a grid of radial coordinates.
 
@@ -250,8 +273,6 @@ class AbstractEllipticalSersic(
         self.sersic_index = sersic_index
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -268,7 +289,7 @@ class AbstractEllipticalSersic(
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def convergence_from_grid_via_gaussians(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -289,7 +310,7 @@ class AbstractEllipticalSersic(
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         return self._deflections_from_grid_via_gaussians(
             grid=grid, sigmas_factor=np.sqrt(self.axis_ratio)
@@ -365,7 +386,7 @@ class AbstractEllipticalSersic(
 class EllipticalSersic(AbstractEllipticalSersic, MassProfileMGE):
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid_via_integrator(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -384,7 +405,7 @@ class EllipticalSersic(AbstractEllipticalSersic, MassProfileMGE):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
+                * quad_util.quad_grid_from(
                     self.deflection_func,
                     0.0,
                     1.0,
@@ -421,6 +442,25 @@ class EllipticalSersic(AbstractEllipticalSersic, MassProfileMGE):
             * (((eta_u / effective_radius) ** (1.0 / sersic_index)) - 1)
         ) / ((1 - (1 - axis_ratio ** 2) * u) ** (npow + 0.5))
 
+    def mass_angular_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the angular mass of the Sersic mass profile within circles of many radii, which is computed
+        analytically as the mass_to_light_ratio times the luminosity of the Sersic profile within each circle (see
+        `light_profiles.sersic_luminosity_within_circles_from`).
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The radii of the circles to compute the angular mass within, which is returned in the same shape.
+        """
+        return self.mass_to_light_ratio * lp.sersic_luminosity_within_circles_from(
+            radii=radii,
+            intensity=self.intensity,
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+        )
+
 
 class SphericalSersic(EllipticalSersic):
     def __init__(
@@ -641,8 +681,6 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
         self.mass_to_light_gradient = mass_to_light_gradient
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -656,7 +694,7 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_via_integrator_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -675,7 +713,7 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
+                * quad_util.quad_grid_from(
                     self.deflection_func,
                     0.0,
                     1.0,
@@ -903,6 +941,13 @@ class EllipticalCoreSersic(EllipticalSersic):
             ),
         )
 
+    def mass_angular_within_circles(self, radii) -> np.ndarray:
+        """
+        Returns the angular mass of the cored-Sersic mass profile within circles of many radii, which is integrated
+        numerically as the analytic form of the Sersic profile does not apply within its core.
+        """
+        return mp.EllipticalMassProfile.mass_angular_within_circles(self, radii=radii)
+
     def decompose_convergence_into_gaussians(self):
         radii_min = self.effective_radius / 50.0
         radii_max = self.effective_radius * 20.0
@@ -982,6 +1027,57 @@ class SphericalCoreSersic(EllipticalCoreSersic):
         self.gamma = gamma
 
 
+@decorator_util.jit()
+def chameleon_deflections_jit(
+    grid,
+    factor,
+    sqrt_one_minus_axis_ratio_squared,
+    axis_ratio_squared,
+    core_radius_0,
+    core_radius_1,
+):
+    """
+    Returns the deflection angles of an `EllipticalChameleon` at every (y,x) coordinate of a grid in the reference
+    frame of the profile, in the dtype of the grid (float32 or float64).
+
+    Both cored isothermal terms (and their `psi_from` terms) are computed for each coordinate in one pass, without
+    creating temporary arrays. All input scalars are passed in the dtype of the grid, such that a float32 grid is
+    evaluated in single precision throughout. The loop over coordinates is parallelized if `parallel=True` in the
+    numba section of the general config.
+    """
+    deflections = np.zeros(grid.shape, dtype=grid.dtype)
+
+    psi_core_0 = axis_ratio_squared * core_radius_0 * core_radius_0
+    psi_core_1 = axis_ratio_squared * core_radius_1 * core_radius_1
+
+    denominator_core_y0 = axis_ratio_squared * core_radius_0
+    denominator_core_y1 = axis_ratio_squared * core_radius_1
+
+    for i in numba.prange(grid.shape[0]):
+
+        y = grid[i, 0]
+        x = grid[i, 1]
+
+        psi_xy = axis_ratio_squared * x * x + y * y
+
+        psi0 = np.sqrt(psi_core_0 + psi_xy)
+        psi1 = np.sqrt(psi_core_1 + psi_xy)
+
+        y_scaled = sqrt_one_minus_axis_ratio_squared * y
+        x_scaled = sqrt_one_minus_axis_ratio_squared * x
+
+        deflections[i, 0] = factor * (
+            np.arctanh(y_scaled / (psi0 + denominator_core_y0))
+            - np.arctanh(y_scaled / (psi1 + denominator_core_y1))
+        )
+        deflections[i, 1] = factor * (
+            np.arctan(x_scaled / (psi0 + core_radius_0))
+            - np.arctan(x_scaled / (psi1 + core_radius_1))
+        )
+
+    return deflections
+
+
 class EllipticalChameleon(mp.EllipticalMassProfile, StellarProfile):
     def __init__(
         self,
@@ -1027,18 +1123,33 @@ class EllipticalChameleon(mp.EllipticalMassProfile, StellarProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
-    def deflections_from_grid(self, grid):
+    @geometry_profiles.relocate_to_radial_minimum
+    def deflections_from_grid(self, grid, precision=None):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
         Following Eq. (15) and (16), but the parameters are slightly different.
 
+        Both cored isothermal terms are evaluated in one pass over the grid by `chameleon_deflections_jit`, in the
+        precision of the grid (float32 or float64) or, if precision is input, in that precision (e.g. float32 for
+        exploratory non-linear searches).
+
         Parameters
         ----------
         grid : aa.Grid2D
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
-
+        precision : str or None
+            The precision the deflection angles are computed in, either "float64" or "float32", where `None` uses the
+            precision of the grid.
         """
+        if precision is None:
+            precision = np.result_type(np.asarray(grid).dtype, np.float32).name
+
+        if precision not in ("float32", "float64"):
+            raise exc.ProfileException(
+                "The precision of EllipticalChameleon deflections must be float32 or float64"
+            )
+
+        dtype = np.dtype(precision).type
 
         factor = (
             2.0
@@ -1056,51 +1167,20 @@ class EllipticalChameleon(mp.EllipticalMassProfile, StellarProfile):
             (4.0 * self.core_radius_1 ** 2.0) / (1.0 + self.axis_ratio) ** 2
         )
 
-        psi0 = psi_from(
-            grid=grid, axis_ratio=self.axis_ratio, core_radius=core_radius_0
-        )
-        psi1 = psi_from(
-            grid=grid, axis_ratio=self.axis_ratio, core_radius=core_radius_1
-        )
-
-        deflection_y0 = np.arctanh(
-            np.divide(
-                np.multiply(np.sqrt(1.0 - self.axis_ratio ** 2.0), grid[:, 0]),
-                np.add(psi0, self.axis_ratio ** 2.0 * core_radius_0),
-            )
-        )
-
-        deflection_x0 = np.arctan(
-            np.divide(
-                np.multiply(np.sqrt(1.0 - self.axis_ratio ** 2.0), grid[:, 1]),
-                np.add(psi0, core_radius_0),
-            )
-        )
-
-        deflection_y1 = np.arctanh(
-            np.divide(
-                np.multiply(np.sqrt(1.0 - self.axis_ratio ** 2.0), grid[:, 0]),
-                np.add(psi1, self.axis_ratio ** 2.0 * core_radius_1),
-            )
-        )
-
-        deflection_x1 = np.arctan(
-            np.divide(
-                np.multiply(np.sqrt(1.0 - self.axis_ratio ** 2.0), grid[:, 1]),
-                np.add(psi1, core_radius_1),
-            )
+        deflections = chameleon_deflections_jit(
+            grid=np.asarray(grid, dtype=dtype),
+            factor=dtype(factor),
+            sqrt_one_minus_axis_ratio_squared=dtype(
+                np.sqrt(1.0 - self.axis_ratio ** 2.0)
+            ),
+            axis_ratio_squared=dtype(self.axis_ratio ** 2.0),
+            core_radius_0=dtype(core_radius_0),
+            core_radius_1=dtype(core_radius_1),
         )
 
-        deflection_y = np.subtract(deflection_y0, deflection_y1)
-        deflection_x = np.subtract(deflection_x0, deflection_x1)
-
-        return self.rotate_grid_from_profile(
-            np.multiply(factor, np.vstack((deflection_y, deflection_x)).T)
-        )
+        return self.rotate_grid_from_profile(deflections)
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
         Parameters
@@ -1128,30 +1208,26 @@ class EllipticalChameleon(mp.EllipticalMassProfile, StellarProfile):
 
         axis_ratio_factor = (1.0 + self.axis_ratio) ** 2.0
 
-        return np.multiply(
-            self.intensity / (1 + self.axis_ratio),
-            np.add(
-                np.divide(
-                    1.0,
-                    np.sqrt(
-                        np.add(
-                            np.square(grid_radii),
-                            (4.0 * self.core_radius_0 ** 2.0) / axis_ratio_factor,
-                        )
-                    ),
-                ),
-                -np.divide(
-                    1.0,
-                    np.sqrt(
-                        np.add(
-                            np.square(grid_radii),
-                            (4.0 * self.core_radius_1 ** 2.0) / axis_ratio_factor,
-                        )
-                    ),
-                ),
+        grid_radii = np.asarray(grid_radii)
+
+        if grid_radii.dtype != np.float32:
+            grid_radii = grid_radii.astype("float64")
+
+        dtype = grid_radii.dtype.type
+
+        image = lp.chameleon_image_from_grid_radii_jit(
+            grid_radii=grid_radii.reshape(-1),
+            factor=dtype(self.intensity / (1 + self.axis_ratio)),
+            core_radius_0_squared=dtype(
+                (4.0 * self.core_radius_0 ** 2.0) / axis_ratio_factor
+            ),
+            core_radius_1_squared=dtype(
+                (4.0 * self.core_radius_1 ** 2.0) / axis_ratio_factor
             ),
         )
 
+        return image.reshape(grid_radii.shape)
+
     def with_new_normalization(self, normalization):
 
         mass_profile = copy.copy(self)
@@ -1,11 +1,14 @@
+import numba
 import numpy as np
+from autoarray import decorator_util
 from autoarray.structures import arrays
 from autoarray.structures import grids, vector_fields
+from autogalaxy import exc
 from autogalaxy.profiles import geometry_profiles
 from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy.profiles.mass_profiles.mass_profiles import psi_from
 
-from pyquad import quad_grid
+from autogalaxy.util import quad_util
 from scipy import special
 import typing
 import copy
@@ -47,7 +50,7 @@ class PointMass(geometry_profiles.SphericalProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         grid_radii = self.grid_to_grid_radii(grid=grid)
         return self.grid_to_grid_cartesian(
@@ -65,6 +68,115 @@ class PointMass(geometry_profiles.SphericalProfile, mp.MassProfile):
         return mass_profile
 
 
+@decorator_util.jit()
+def broken_power_law_deflections_jit(
+    z,
+    axis_ratio,
+    kB,
+    break_radius,
+    inner_slope,
+    outer_slope,
+    dt,
+    max_terms,
+    tolerance,
+):
+    """
+    Returns the (conjugated) complex deflection angles of an `EllipticalBrokenPowerLaw` (eq. 18 and 19) at every
+    complex coordinate z = x + iy, in the dtype of z (complex64 or complex128).
+
+    Coordinates inside the break radius only require the series of eq. 26 for the inner slope at their elliptical
+    radius, and coordinates outside it the three series of eq. 19, which are summed together in one loop as two
+    of them share the same u. The series of every coordinate stops once the magnitude of each term falls below
+    tolerance times that of its sum, or after max_terms terms. The loop over coordinates is parallelized if
+    `parallel=True` in the numba section of the general config.
+    """
+    deflections = np.zeros(z.shape[0], dtype=z.dtype)
+
+    q_ = (1.0 - axis_ratio ** 2) / (axis_ratio ** 2)
+
+    for j in numba.prange(z.shape[0]):
+
+        zj = z[j]
+
+        # Elliptical radius
+        radius = np.sqrt((zj.real * axis_ratio) ** 2 + zj.imag ** 2)
+
+        # Factors common to eq. 18 and 19
+        factors = (
+            2.0 * kB * (break_radius ** 2) / (axis_ratio * zj * (2.0 - inner_slope))
+        )
+
+        # u from eq. 25
+        u_radius = 0.5 * (1.0 - np.sqrt(1.0 - q_ * (radius / zj) ** 2))
+
+        if radius <= break_radius:
+
+            a_n = 1.0
+            u_n = 1.0 + 0.0j
+            F1 = 0.0 + 0.0j
+
+            for n in range(max_terms):
+
+                term = a_n * u_n
+                F1 += term
+
+                if abs(term) < tolerance * abs(F1):
+                    break
+
+                a_n *= ((2 * n) + 4 - (2 * inner_slope)) / ((2 * n) + 4 - inner_slope)
+                u_n *= u_radius
+
+            # theta < break radius (eq. 18)
+            deflection = factors * F1 * (break_radius / radius) ** (inner_slope - 2)
+
+        else:
+
+            u_break = 0.5 * (1.0 - np.sqrt(1.0 - q_ * (break_radius / zj) ** 2))
+
+            a_inner_n = 1.0
+            a_outer_n = 1.0
+            u_radius_n = 1.0 + 0.0j
+            u_break_n = 1.0 + 0.0j
+            F2 = 0.0 + 0.0j
+            F3 = 0.0 + 0.0j
+            F4 = 0.0 + 0.0j
+
+            for n in range(max_terms):
+
+                term_2 = a_inner_n * u_break_n
+                term_3 = a_outer_n * u_radius_n
+                term_4 = a_outer_n * u_break_n
+
+                F2 += term_2
+                F3 += term_3
+                F4 += term_4
+
+                if (
+                    abs(term_2) < tolerance * abs(F2)
+                    and abs(term_3) < tolerance * abs(F3)
+                    and abs(term_4) < tolerance * abs(F4)
+                ):
+                    break
+
+                a_inner_n *= ((2 * n) + 4 - (2 * inner_slope)) / (
+                    (2 * n) + 4 - inner_slope
+                )
+                a_outer_n *= ((2 * n) + 4 - (2 * outer_slope)) / (
+                    (2 * n) + 4 - outer_slope
+                )
+                u_radius_n *= u_radius
+                u_break_n *= u_break
+
+            # theta > break radius (eq. 19)
+            deflection = factors * (
+                F2 + dt * (((break_radius / radius) ** (outer_slope - 2)) * F3 - F4)
+            )
+
+        deflections[j] = np.conj(deflection)
+
+    return deflections
+
+
 class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
     def __init__(
         self,
@@ -110,7 +222,7 @@ class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """
         Returns the dimensionless density kappa=Sigma/Sigma_c (eq. 1)
@@ -135,56 +247,37 @@ class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
-    def deflections_from_grid(self, grid, max_terms=20):
+    @geometry_profiles.relocate_to_radial_minimum
+    def deflections_from_grid(
+        self, grid, max_terms=20, tolerance=1.0e-8, precision="complex128"
+    ):
         """
         Returns the complex deflection angle from eq. 18 and 19
-        """
-        # Rotate coordinates
-        z = grid[:, 1] + 1j * grid[:, 0]
-
-        # Elliptical radius
-        R = np.hypot(z.real * self.axis_ratio, z.imag)
-
-        # Factors common to eq. 18 and 19
-        factors = (
-            2
-            * self.kB
-            * (self.break_radius ** 2)
-            / (self.axis_ratio * z * (2 - self.inner_slope))
-        )
-
-        # Hypergeometric functions
-        # (in order of appearance in eq. 18 and 19)
-        # These can also be computed with scipy.special.hyp2f1(), it's
-        # much slower can be a useful test
-        F1 = self.hyp2f1_series(
-            self.inner_slope, self.axis_ratio, R, z, max_terms=max_terms
-        )
-        F2 = self.hyp2f1_series(
-            self.inner_slope, self.axis_ratio, self.break_radius, z, max_terms=max_terms
-        )
-        F3 = self.hyp2f1_series(
-            self.outer_slope, self.axis_ratio, R, z, max_terms=max_terms
-        )
-        F4 = self.hyp2f1_series(
-            self.outer_slope, self.axis_ratio, self.break_radius, z, max_terms=max_terms
-        )
 
-        # theta < break radius (eq. 18)
-        inner_part = factors * F1 * (self.break_radius / R) ** (self.inner_slope - 2)
+        The hypergeometric series (eq. 26) are summed by `broken_power_law_deflections_jit`, which stops the series
+        of each coordinate once its terms fall below the tolerance (or after max_terms terms). The precision of the
+        series and deflection angles is set by precision, which is either "complex64" or "complex128".
+        """
+        if precision not in ("complex64", "complex128"):
+            raise exc.ProfileException(
+                "The precision of EllipticalBrokenPowerLaw deflections must be complex64 or complex128"
+            )
 
-        # theta > break radius (eq. 19)
-        outer_part = factors * (
-            F2
-            + self.dt * (((self.break_radius / R) ** (self.outer_slope - 2)) * F3 - F4)
+        # Rotate coordinates
+        z = (grid[:, 1] + 1j * grid[:, 0]).astype(precision)
+
+        deflections = broken_power_law_deflections_jit(
+            z=z,
+            axis_ratio=self.axis_ratio,
+            kB=self.kB,
+            break_radius=self.break_radius,
+            inner_slope=self.inner_slope,
+            outer_slope=self.outer_slope,
+            dt=self.dt,
+            max_terms=max_terms,
+            tolerance=tolerance,
         )
 
-        # Combine and take the conjugate
-        deflections = (
-            inner_part * (R <= self.break_radius) + outer_part * (R > self.break_radius)
-        ).conjugate()
-
         return self.rotate_grid_from_profile(
             np.multiply(1.0, np.vstack((np.imag(deflections), np.real(deflections))).T)
         )
@@ -194,6 +287,9 @@ class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
         """
         Computes eq. 26 for a radius r, slope t,
         axis ratio q, and coordinates z.
+
+        This sums a fixed number of terms over every coordinate and is kept as a reference for
+        `broken_power_law_deflections_jit`, which `deflections_from_grid` uses.
         """
 
         # u from eq. 25
@@ -249,7 +345,217 @@ class SphericalBrokenPowerLaw(EllipticalBrokenPowerLaw):
         )
 
 
+def gauss_legendre_nodes_and_weights_from(order):
+    """
+    Returns the nodes and weights of a fixed-order Gauss-Legendre quadrature mapped to the interval [0.0, 1.0].
+
+    Parameters
+    ----------
+    order : int
+        The number of nodes of the Gauss-Legendre quadrature.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+
+    return 0.5 * (nodes + 1.0), 0.5 * weights
+
+
+@decorator_util.jit()
+def cored_power_law_panel_node_from(
+    panel, node, t_core, t_break, t_nodes, t_weights
+):
+    """
+    Returns the integration variable t = sqrt(u) and quadrature weight (including the Jacobian of the mapping) of
+    one node of the three-panel quadrature used by `EllipticalCoredPowerLaw`:
+
+    - panel 0 is linear in t over [0, t_core], inside the core where the integrands are smooth.
+    - panel 1 is linear in log(t) over [t_core, t_break], where the integrands follow the power-law.
+    - panel 2 is linear in t over [t_break, 1], which resolves the (1 - (1 - q^2) u) factor at low axis ratios.
+    """
+    if panel == 0:
+        t = t_core * t_nodes[node]
+        return t, t_weights[node] * t_core
+    elif panel == 1:
+        log_t_core = np.log(t_core)
+        log_t_break = np.log(t_break)
+        t = np.exp(log_t_core + (log_t_break - log_t_core) * t_nodes[node])
+        return t, t_weights[node] * (log_t_break - log_t_core) * t
+
+    t = t_break + (1.0 - t_break) * t_nodes[node]
+    return t, t_weights[node] * (1.0 - t_break)
+
+
+@decorator_util.jit()
+def cored_power_law_panels_from(radius, core_radius):
+    """
+    Returns the values of t = sqrt(u) that bound the quadrature panels of `cored_power_law_panel_node_from` for a
+    coordinate at an input radius, where the integrands of a power-law with no core are integrated from 1.0e-8.
+    """
+    if core_radius > 0.0 and radius > 0.0:
+        t_core = min(core_radius / radius, 1.0)
+    elif core_radius > 0.0:
+        t_core = 1.0
+    else:
+        t_core = 1.0e-8
+
+    return t_core, max(t_core, 0.5)
+
+
+@decorator_util.jit()
+def cored_power_law_deflection_integrals_via_gauss_legendre_from(
+    grid, axis_ratio, slope, core_radius, t_nodes, t_weights
+):
+    """
+    Integrate `EllipticalCoredPowerLaw.deflection_func` over u for every (y,x) coordinate of a grid, returning the
+    npow=1 (y) and npow=0 (x) integrals as an array of shape [total_coordinates, 2].
+
+    The integrals are performed over t = sqrt(u) with the three-panel Gauss-Legendre quadrature of
+    `cored_power_law_panel_node_from`. For a power-law with no core the integral from 0 to t = 1.0e-8 is added
+    analytically using the leading order power-law behaviour of the integrand.
+    """
+    integrals = np.zeros((grid.shape[0], 2))
+
+    for i in range(grid.shape[0]):
+
+        y = grid[i, 0]
+        x = grid[i, 1]
+
+        radius = np.sqrt(x ** 2 + y ** 2)
+
+        if core_radius <= 0.0 and radius <= 0.0:
+            continue
+
+        t_core, t_break = cored_power_law_panels_from(
+            radius=radius, core_radius=core_radius
+        )
+
+        for panel in range(3):
+
+            if panel == 0 and core_radius <= 0.0:
+                continue
+            if panel == 1 and t_break <= t_core:
+                continue
+            if panel == 2 and t_break >= 1.0:
+                continue
+
+            for node in range(t_nodes.shape[0]):
+
+                t, weight = cored_power_law_panel_node_from(
+                    panel=panel,
+                    node=node,
+                    t_core=t_core,
+                    t_break=t_break,
+                    t_nodes=t_nodes,
+                    t_weights=t_weights,
+                )
+
+                u = t ** 2
+                factor = 1.0 - (1.0 - axis_ratio ** 2) * u
+                eta_squared = u * ((x ** 2) + (y ** 2 / factor))
+
+                integrand = (
+                    2.0
+                    * t
+                    * weight
+                    * (core_radius ** 2 + eta_squared) ** (-(slope - 1.0) / 2.0)
+                )
+
+                integrals[i, 0] += integrand / factor ** 1.5
+                integrals[i, 1] += integrand / factor ** 0.5
+
+        if core_radius <= 0.0:
+
+            head = (
+                2.0 * radius ** (1.0 - slope) * t_core ** (3.0 - slope) / (3.0 - slope)
+            )
+
+            integrals[i, 0] += head
+            integrals[i, 1] += head
+
+    return integrals
+
+
+@decorator_util.jit()
+def cored_power_law_potential_integral_via_gauss_legendre_from(
+    grid, axis_ratio, slope, core_radius, t_nodes, t_weights
+):
+    """
+    Integrate `EllipticalCoredPowerLaw.potential_func` over u for every (y,x) coordinate of a grid, using the same
+    quadrature as `cored_power_law_deflection_integrals_via_gauss_legendre_from`.
+
+    The difference of the cored terms in the integrand is computed via expm1 / log1p, to avoid a loss of precision
+    where eta is much smaller than the core radius.
+    """
+    integrals = np.zeros(grid.shape[0])
+
+    for i in range(grid.shape[0]):
+
+        y = grid[i, 0]
+        x = grid[i, 1]
+
+        radius = np.sqrt(x ** 2 + y ** 2)
+
+        if core_radius <= 0.0 and radius <= 0.0:
+            continue
+
+        t_core, t_break = cored_power_law_panels_from(
+            radius=radius, core_radius=core_radius
+        )
+
+        for panel in range(3):
+
+            if panel == 0 and core_radius <= 0.0:
+                continue
+            if panel == 1 and t_break <= t_core:
+                continue
+            if panel == 2 and t_break >= 1.0:
+                continue
+
+            for node in range(t_nodes.shape[0]):
+
+                t, weight = cored_power_law_panel_node_from(
+                    panel=panel,
+                    node=node,
+                    t_core=t_core,
+                    t_break=t_break,
+                    t_nodes=t_nodes,
+                    t_weights=t_weights,
+                )
+
+                u = t ** 2
+                factor = 1.0 - (1.0 - axis_ratio ** 2) * u
+                eta_squared = u * ((x ** 2) + (y ** 2 / factor))
+
+                if core_radius > 0.0:
+                    cored_term = core_radius ** (3.0 - slope) * np.expm1(
+                        0.5 * (3.0 - slope) * np.log1p(eta_squared / core_radius ** 2)
+                    )
+                else:
+                    cored_term = eta_squared ** (0.5 * (3.0 - slope))
+
+                integrals[i] += (
+                    2.0
+                    * t
+                    * weight
+                    * cored_term
+                    / ((3.0 - slope) * u * factor ** 0.5)
+                )
+
+        if core_radius <= 0.0:
+
+            integrals[i] += (
+                2.0
+                * radius ** (3.0 - slope)
+                * t_core ** (3.0 - slope)
+                / (3.0 - slope) ** 2
+            )
+
+    return integrals
+
+
 class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
+
+    gauss_legendre_order = 32
+
     def __init__(
         self,
         centre: typing.Tuple[float, float] = (0.0, 0.0),
@@ -293,7 +599,7 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """ Calculate the projected convergence on a grid of (y,x) arc-second coordinates.
 
@@ -318,11 +624,15 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def potential_from_grid(self, grid):
         """
         Calculate the potential on a grid of (y,x) arc-second coordinates.
 
+        The integral over u is evaluated for all coordinates at once using a fixed-order Gauss-Legendre quadrature
+        split into panels inside and outside the core (see `cored_power_law_panel_node_from`). The adaptive
+        integrator is available via `potential_from_grid_via_integrator`.
+
         Parameters
         ----------
         grid : aa.Grid2D
@@ -330,7 +640,37 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
         """
 
-        potential_grid = quad_grid(
+        t_nodes, t_weights = gauss_legendre_nodes_and_weights_from(
+            order=self.gauss_legendre_order
+        )
+
+        potential_grid = cored_power_law_potential_integral_via_gauss_legendre_from(
+            grid=np.asarray(grid),
+            axis_ratio=self.axis_ratio,
+            slope=self.slope,
+            core_radius=self.core_radius,
+            t_nodes=t_nodes,
+            t_weights=t_weights,
+        )
+
+        return self.einstein_radius_rescaled * self.axis_ratio * potential_grid
+
+    @grids.grid_like_to_structure
+    @grids.transform
+    @geometry_profiles.relocate_to_radial_minimum
+    def potential_from_grid_via_integrator(self, grid):
+        """
+        Calculate the potential on a grid of (y,x) arc-second coordinates, using an adaptive integrator at every
+        coordinate.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+
+        """
+
+        potential_grid = quad_util.quad_grid_from(
             self.potential_func,
             0.0,
             1.0,
@@ -342,11 +682,80 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
 
+        For an elliptical cored isothermal (slope = 2.0) the deflection angles are computed analytically. For other
+        slopes the integral over u is evaluated for all coordinates at once using a fixed-order Gauss-Legendre
+        quadrature split into panels inside and outside the core (see `cored_power_law_panel_node_from`). The
+        adaptive integrator is available via `deflections_from_grid_via_integrator`.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+
+        """
+
+        if self.slope == 2.0 and self.axis_ratio < 1.0:
+
+            factor = (
+                2.0
+                * self.einstein_radius_rescaled
+                * self.axis_ratio
+                / np.sqrt(1 - self.axis_ratio ** 2)
+            )
+
+            psi = psi_from(
+                grid=grid, axis_ratio=self.axis_ratio, core_radius=self.core_radius
+            )
+
+            deflection_y = np.arctanh(
+                np.divide(
+                    np.multiply(np.sqrt(1 - self.axis_ratio ** 2), grid[:, 0]),
+                    np.add(psi, self.axis_ratio ** 2 * self.core_radius),
+                )
+            )
+            deflection_x = np.arctan(
+                np.divide(
+                    np.multiply(np.sqrt(1 - self.axis_ratio ** 2), grid[:, 1]),
+                    np.add(psi, self.core_radius),
+                )
+            )
+
+            return self.rotate_grid_from_profile(
+                np.multiply(factor, np.vstack((deflection_y, deflection_x)).T)
+            )
+
+        t_nodes, t_weights = gauss_legendre_nodes_and_weights_from(
+            order=self.gauss_legendre_order
+        )
+
+        deflection_integrals = cored_power_law_deflection_integrals_via_gauss_legendre_from(
+            grid=np.asarray(grid),
+            axis_ratio=self.axis_ratio,
+            slope=self.slope,
+            core_radius=self.core_radius,
+            t_nodes=t_nodes,
+            t_weights=t_weights,
+        )
+
+        return self.rotate_grid_from_profile(
+            self.einstein_radius_rescaled
+            * self.axis_ratio
+            * np.multiply(grid, deflection_integrals)
+        )
+
+    @grids.grid_like_to_structure
+    @grids.transform
+    @geometry_profiles.relocate_to_radial_minimum
+    def deflections_from_grid_via_integrator(self, grid):
+        """
+        Calculate the deflection angles on a grid of (y,x) arc-second coordinates, using an adaptive integrator at
+        every coordinate.
+
         Parameters
         ----------
         grid : aa.Grid2D
@@ -360,7 +769,7 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
             deflection_grid = self.axis_ratio * grid[:, index]
             deflection_grid *= (
                 einstein_radius_rescaled
-                * quad_grid(
+                * quad_util.quad_grid_from(
                     self.deflection_func,
                     0.0,
                     1.0,
@@ -450,7 +859,7 @@ class SphericalCoredPowerLaw(EllipticalCoredPowerLaw):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -512,7 +921,7 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -564,10 +973,14 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
         return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
 
     def convergence_func(self, grid_radius):
-        if grid_radius > 0.0:
-            return self.einstein_radius_rescaled * grid_radius ** (-(self.slope - 1))
-        else:
-            return np.inf
+        grid_radius = np.asarray(grid_radius, dtype="float64")
+
+        with np.errstate(divide="ignore"):
+            return np.where(
+                grid_radius > 0.0,
+                self.einstein_radius_rescaled * grid_radius ** (-(self.slope - 1)),
+                np.inf,
+            )
 
     @staticmethod
     def potential_func(u, y, x, axis_ratio, slope, core_radius):
@@ -609,7 +1022,7 @@ class SphericalPowerLaw(EllipticalPowerLaw):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
 
         eta = self.grid_to_grid_radii(grid)
@@ -719,7 +1132,7 @@ class EllipticalIsothermal(EllipticalPowerLaw):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -733,20 +1146,24 @@ class EllipticalIsothermal(EllipticalPowerLaw):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
 
-        factor = (
+        dtype = np.result_type(np.asarray(grid).dtype, np.float32).type
+
+        factor = dtype(
             2.0
             * self.einstein_radius_rescaled
             * self.axis_ratio
             / np.sqrt(1 - self.axis_ratio ** 2)
         )
 
-        psi = psi_from(grid=grid, axis_ratio=self.axis_ratio, core_radius=0.0)
+        sqrt_one_minus_axis_ratio_squared = dtype(np.sqrt(1 - self.axis_ratio ** 2))
+
+        psi = psi_from(grid=grid, axis_ratio=dtype(self.axis_ratio), core_radius=0.0)
 
         deflection_y = np.arctanh(
-            np.divide(np.multiply(np.sqrt(1 - self.axis_ratio ** 2), grid[:, 0]), psi)
+            np.divide(np.multiply(sqrt_one_minus_axis_ratio_squared, grid[:, 0]), psi)
         )
         deflection_x = np.arctan(
-            np.divide(np.multiply(np.sqrt(1 - self.axis_ratio ** 2), grid[:, 1]), psi)
+            np.divide(np.multiply(sqrt_one_minus_axis_ratio_squared, grid[:, 1]), psi)
         )
         return self.rotate_grid_from_profile(
             np.multiply(factor, np.vstack((deflection_y, deflection_x)).T)
@@ -754,7 +1171,7 @@ class EllipticalIsothermal(EllipticalPowerLaw):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def shear_from_grid(self, grid):
         """
         Calculate the (gamma_y, gamma_x) shear vector field on a grid of (y,x) arc-second coordinates.
@@ -804,7 +1221,7 @@ class SphericalIsothermal(EllipticalIsothermal):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def potential_from_grid(self, grid):
         """
         Calculate the potential on a grid of (y,x) arc-second coordinates.
@@ -819,7 +1236,7 @@ class SphericalIsothermal(EllipticalIsothermal):
 
     @grids.grid_like_to_structure
     @grids.transform
-    @grids.relocate_to_radial_minimum
+    @geometry_profiles.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
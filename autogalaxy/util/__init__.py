@@ -10,3 +10,6 @@ from autoarray.util import mapper_util as mapper
 from autoarray.util import inversion_util as inversion
 from autoarray.util import transformer_util as transformer
 from ..util import cosmology_util as cosmology
+from ..util import interpolation_util as interpolation
+from ..util import quad_util as quad
+from ..util import thread_util as thread
@@ -0,0 +1,293 @@
+import numpy as np
+from autoarray.structures import grids
+from autoconf import conf
+
+
+def adaptive_interpolation_settings_from_config():
+    """
+    Returns whether the adaptive interpolation of deflection angles is used by galaxies and the settings it uses,
+    which are read from the [adaptive_interpolation] section of the general config.
+
+    If this section is missing from the config the adaptive interpolation is not used.
+    """
+    try:
+        settings = conf.instance["general"]["adaptive_interpolation"]
+
+        return (
+            settings["deflections"],
+            float(settings["tolerance"]),
+            int(settings["coarse_cells"]),
+            int(settings["maximum_level"]),
+        )
+    except Exception:
+        return False, None, None, None
+
+
+def profile_is_interpolated_from_config(profile, func_name):
+    """
+    Returns whether the function of a profile is flagged as one that should be interpolated, using the
+    'interpolate.ini' config file of the grids.
+    """
+    try:
+        return conf.instance["grids"]["interpolate"][func_name][
+            profile.__class__.__name__
+        ]
+    except Exception:
+        return False
+
+
+def deflections_from_profile_and_grid(profile, grid):
+    """
+    Returns the deflection angles of a mass profile on a grid, which are computed via
+    `deflections_via_adaptive_interpolation_from` if:
+
+    - adaptive interpolation is turned on in the [adaptive_interpolation] section of the general config.
+    - the profile's [deflections_from_grid] entry in the 'interpolate.ini' config is True.
+    - the grid is a uniform `Grid2D` (irregular and `Grid2DInterpolate` grids are evaluated as normal).
+
+    Otherwise the profile's `deflections_from_grid` method is called on the grid.
+
+    Parameters
+    ----------
+    profile : MassProfile
+        The mass profile whose deflection angles are computed.
+    grid : grid_like
+        The (y, x) coordinates in the original reference frame of the grid.
+    """
+    (
+        use_interpolation,
+        tolerance,
+        coarse_cells,
+        maximum_level,
+    ) = adaptive_interpolation_settings_from_config()
+
+    if (
+        use_interpolation
+        and isinstance(grid, grids.Grid2D)
+        and profile_is_interpolated_from_config(
+            profile=profile, func_name="deflections_from_grid"
+        )
+    ):
+
+        return deflections_via_adaptive_interpolation_from(
+            func=profile.deflections_from_grid,
+            grid=grid,
+            tolerance=tolerance,
+            coarse_cells=coarse_cells,
+            maximum_level=maximum_level,
+            centre=getattr(profile, "centre", None),
+        )
+
+    return profile.deflections_from_grid(grid=grid)
+
+
+def deflections_via_adaptive_interpolation_from(
+    func, grid, tolerance, coarse_cells=8, maximum_level=6, centre=None
+):
+    """
+    Returns the deflection angles computed by a function on a grid, where the function is evaluated on an adaptive
+    quadtree of square cells covering the grid and bilinearly interpolated to every (y,x) coordinate.
+
+    The quadtree begins as coarse_cells x coarse_cells cells spanning the grid. Every cell is evaluated at its four
+    corners, centre and edge midpoints, and is split into four if the bilinear interpolation of its corners differs
+    from the function at its centre or edge midpoints by more than the tolerance (in either deflection component),
+    or if it contains the input centre. Function evaluations are shared between neighbouring cells and batched into
+    one function call per level.
+
+    Cells are split at most maximum_level times, and never below the resolution of the grid itself. Cells which
+    would be split beyond this limit (e.g. at the cusp of a profile) are not interpolated, instead the function is
+    evaluated directly at the coordinates of the grid which they contain. If the quadtree could require more
+    evaluations of the function than there are coordinates in the grid, the function is evaluated on the grid
+    directly.
+
+    Parameters
+    ----------
+    func : func
+        The function which computes deflection angles from an ndarray of (y,x) coordinates of shape
+        [total_coordinates, 2].
+    grid : np.ndarray
+        The (y, x) coordinates the deflection angles are interpolated to.
+    tolerance : float
+        The maximum absolute error of the bilinear interpolation of a cell at its test points.
+    coarse_cells : int
+        The number of cells across each side of the initial quadtree.
+    maximum_level : int
+        The maximum number of times a cell of the quadtree is split.
+    centre : (float, float) or None
+        The (y,x) centre of the profile, whose cell is always refined to the maximum level.
+    """
+    grid = np.asarray(grid)
+
+    y_min, x_min = np.min(grid, axis=0)
+    y_max, x_max = np.max(grid, axis=0)
+
+    domain_size = max(y_max - y_min, x_max - x_min)
+
+    if grid.shape[0] < 4 or domain_size <= 0.0:
+        return np.asarray(func(grid))
+
+    maximum_level = max(
+        min(
+            maximum_level,
+            int(np.ceil(np.log2(np.sqrt(grid.shape[0]) / (2.0 * coarse_cells)))),
+        ),
+        0,
+    )
+
+    cell_size = 2 ** (maximum_level + 1)
+    fine_cells = coarse_cells * cell_size
+
+    lattice_scale = domain_size * (1.0 + 1.0e-6) / fine_cells
+    lattice_origin_y = 0.5 * (y_min + y_max) - 0.5 * fine_cells * lattice_scale
+    lattice_origin_x = 0.5 * (x_min + x_max) - 0.5 * fine_cells * lattice_scale
+
+    lattice_values = np.zeros((fine_cells + 1, fine_cells + 1, 2))
+    lattice_evaluated = np.zeros((fine_cells + 1, fine_cells + 1), dtype="bool")
+
+    def values_at_lattice_from(lattice_y, lattice_x):
+
+        missing = ~lattice_evaluated[lattice_y, lattice_x]
+
+        if np.any(missing):
+
+            missing_index = np.unique(
+                lattice_y[missing] * (fine_cells + 1) + lattice_x[missing]
+            )
+            missing_y = missing_index // (fine_cells + 1)
+            missing_x = missing_index % (fine_cells + 1)
+
+            lattice_values[missing_y, missing_x] = func(
+                np.stack(
+                    (
+                        lattice_origin_y + lattice_scale * missing_y,
+                        lattice_origin_x + lattice_scale * missing_x,
+                    ),
+                    axis=1,
+                )
+            )
+            lattice_evaluated[missing_y, missing_x] = True
+
+        return lattice_values[lattice_y, lattice_x]
+
+    cells_y, cells_x = np.meshgrid(
+        np.arange(coarse_cells) * cell_size,
+        np.arange(coarse_cells) * cell_size,
+        indexing="ij",
+    )
+    cells_y = cells_y.ravel()
+    cells_x = cells_x.ravel()
+
+    leaf_index_map = np.zeros((fine_cells, fine_cells), dtype="int")
+    leaves_y = []
+    leaves_x = []
+    leaves_size = []
+    leaves_exact = []
+
+    while cells_y.shape[0] > 0:
+
+        if np.sum(lattice_evaluated) + 9 * cells_y.shape[0] > grid.shape[0]:
+            return np.asarray(func(grid))
+
+        half = cell_size // 2
+
+        stencil = (
+            (0, 0),
+            (0, cell_size),
+            (cell_size, 0),
+            (cell_size, cell_size),
+            (0, half),
+            (half, 0),
+            (cell_size, half),
+            (half, cell_size),
+            (half, half),
+        )
+
+        values = np.split(
+            values_at_lattice_from(
+                np.concatenate([cells_y + dy for dy, dx in stencil]),
+                np.concatenate([cells_x + dx for dy, dx in stencil]),
+            ),
+            len(stencil),
+        )
+
+        interpolated = [
+            0.5 * (values[0] + values[1]),
+            0.5 * (values[0] + values[2]),
+            0.5 * (values[2] + values[3]),
+            0.5 * (values[1] + values[3]),
+            0.25 * (values[0] + values[1] + values[2] + values[3]),
+        ]
+
+        error = np.max(
+            [
+                np.max(np.abs(values[4 + index] - interpolated[index]), axis=1)
+                for index in range(5)
+            ],
+            axis=0,
+        )
+
+        refine = error > tolerance
+
+        if centre is not None:
+            refine |= (
+                (lattice_origin_y + lattice_scale * cells_y <= centre[0])
+                & (centre[0] <= lattice_origin_y + lattice_scale * (cells_y + cell_size))
+                & (lattice_origin_x + lattice_scale * cells_x <= centre[1])
+                & (centre[1] <= lattice_origin_x + lattice_scale * (cells_x + cell_size))
+            )
+
+        exact = refine & (cell_size == 2)
+
+        for leaf_y, leaf_x, leaf_exact in zip(
+            cells_y[~refine | exact], cells_x[~refine | exact], exact[~refine | exact]
+        ):
+            leaf_index_map[
+                leaf_y : leaf_y + cell_size, leaf_x : leaf_x + cell_size
+            ] = len(leaves_y)
+            leaves_y.append(leaf_y)
+            leaves_x.append(leaf_x)
+            leaves_size.append(cell_size)
+            leaves_exact.append(leaf_exact)
+
+        if cell_size == 2:
+            break
+
+        cells_y = np.concatenate([cells_y[refine] + dy for dy in (0, 0, half, half)])
+        cells_x = np.concatenate([cells_x[refine] + dx for dx in (0, half, 0, half)])
+        cell_size = half
+
+    leaves_y = np.asarray(leaves_y)
+    leaves_x = np.asarray(leaves_x)
+    leaves_size = np.asarray(leaves_size)
+    leaves_exact = np.asarray(leaves_exact)
+
+    grid_lattice_y = (grid[:, 0] - lattice_origin_y) / lattice_scale
+    grid_lattice_x = (grid[:, 1] - lattice_origin_x) / lattice_scale
+
+    leaves = leaf_index_map[
+        np.clip(grid_lattice_y.astype("int"), 0, fine_cells - 1),
+        np.clip(grid_lattice_x.astype("int"), 0, fine_cells - 1),
+    ]
+
+    leaf_y = leaves_y[leaves]
+    leaf_x = leaves_x[leaves]
+    leaf_size = leaves_size[leaves]
+
+    weight_y = ((grid_lattice_y - leaf_y) / leaf_size)[:, None]
+    weight_x = ((grid_lattice_x - leaf_x) / leaf_size)[:, None]
+
+    deflections = (
+        (1.0 - weight_y) * (1.0 - weight_x) * lattice_values[leaf_y, leaf_x]
+        + (1.0 - weight_y) * weight_x * lattice_values[leaf_y, leaf_x + leaf_size]
+        + weight_y * (1.0 - weight_x) * lattice_values[leaf_y + leaf_size, leaf_x]
+        + weight_y
+        * weight_x
+        * lattice_values[leaf_y + leaf_size, leaf_x + leaf_size]
+    )
+
+    exact = leaves_exact[leaves]
+
+    if np.any(exact):
+        deflections[exact] = func(grid[exact])
+
+    return deflections
@@ -0,0 +1,159 @@
+import numpy as np
+from pyquad import quad_grid
+from scipy.integrate import quad
+
+from autogalaxy.util import thread_util
+
+"""
+The number of threads `quad_grid_from` splits the coordinates of a grid over, which is read from the [quad_grid]
+section of the general config.
+"""
+threads = thread_util.ConfigThreads(section="quad_grid")
+
+
+def num_threads_from_config():
+    """
+    Returns the number of threads `quad_grid_from` splits the coordinates of a grid over, using the [quad_grid]
+    section of the general config (or the `quad_grid_threads` context manager, if one is active).
+
+    If parallel=False 1 thread is used, such that `pyquad.quad_grid` is called with parallel=False (pyquad otherwise
+    defaults to 8 threads), and num_threads=0 uses every core of the machine.
+    """
+    return threads.num_threads_from_config()
+
+
+def quad_grid_threads(num_threads):
+    """
+    Context manager which evaluates every `quad_grid_from` call within it using the input number of threads,
+    irrespective of the general config, for example:
+
+    with quad_grid_threads(num_threads=32):
+        deflections = nfw.deflections_from_grid_via_integrator(grid=grid)
+
+    Parameters
+    ----------
+    num_threads : int
+        The number of threads the coordinates of a grid are split over, where 0 uses every core of the machine.
+    """
+    return threads.threads(num_threads=num_threads)
+
+
+def quad_grid_from(func, a, b, grid, args=(), **kwargs):
+    """
+    Integrate a function from a to b at every (y,x) coordinate of a grid using `pyquad.quad_grid`, returning the
+    same (integrals, errors) tuple.
+
+    If more than one thread is requested (see `num_threads_from_config`) the coordinates are split into chunks
+    which are integrated by pyquad's native thread pool. The threads read the input grid in place, so it is not
+    copied or pickled per worker, and the integrals are written into one output array in the order of the grid.
+    Otherwise pyquad is called with parallel=False, so the coordinates are integrated serially.
+
+    Parameters
+    ----------
+    func : func
+        The integrand, with signature func(u, y, x, *args).
+    a : float
+        The lower limit of the integral.
+    b : float
+        The upper limit of the integral.
+    grid : np.ndarray
+        The (y,x) coordinates the integral is evaluated at, in an array of shape [total_coordinates, 2].
+    args : tuple
+        The additional arguments passed to the integrand.
+    """
+    num_threads = num_threads_from_config()
+
+    if num_threads > 1:
+        return quad_grid(
+            func, a, b, grid, args=args, parallel=True, num_threads=num_threads, **kwargs
+        )
+
+    return quad_grid(func, a, b, grid, args=args, parallel=False, **kwargs)
+
+
+def integral_within_circles_from(func, radii, points=10, maximum_log_step=0.5):
+    """
+    Returns the integral of 2 * pi * r * func(r) from r=0 to every input radius (e.g. the luminosity or mass of a
+    profile within circles of these radii), where func is the intensity or convergence of the profile at a radius.
+
+    The integral is computed once for all radii as a cumulative integral over the sorted radii, instead of
+    integrating from zero to every radius separately:
+
+    - The integral from zero to the smallest radius is computed using `scipy.integrate.quad`.
+    - The integral between every pair of consecutive radii is computed in ln(radius), where most profiles are
+      smooth, using Gauss-Legendre quadrature over segments no wider than maximum_log_step in ln(radius). Every
+      quadrature point is evaluated in a single call of func on an ndarray of radii.
+
+    The cumulative sums of these integrals give the integral within every radius, without interpolation.
+
+    Parameters
+    ----------
+    func : func
+        The function of radius integrated, which must accept an ndarray of radii when more than one radius is input.
+    radii : np.ndarray
+        The radii of the circles the integral is computed within, which is returned in the same shape.
+    points : int
+        The number of Gauss-Legendre quadrature points of every segment.
+    maximum_log_step : float
+        The maximum width of a segment in ln(radius).
+    """
+    radii = np.asarray(radii, dtype="float64")
+
+    unique_radii, inverse = np.unique(radii, return_inverse=True)
+
+    integrals = np.zeros(unique_radii.shape[0])
+
+    positive = unique_radii > 0.0
+
+    if np.any(positive):
+
+        log_radii = np.log(unique_radii[positive])
+
+        integrals_positive = np.full(
+            log_radii.shape[0],
+            quad(
+                func=lambda x: 2.0 * np.pi * x * func(x),
+                a=0.0,
+                b=unique_radii[positive][0],
+            )[0],
+        )
+
+        if log_radii.shape[0] > 1:
+
+            segments = np.maximum(
+                np.ceil(np.diff(log_radii) / maximum_log_step).astype("int"), 1
+            )
+
+            segment_widths = np.repeat(np.diff(log_radii) / segments, segments)
+            segment_lowers = np.repeat(log_radii[:-1], segments) + segment_widths * (
+                np.arange(segment_widths.shape[0])
+                - np.repeat(np.cumsum(segments) - segments, segments)
+            )
+
+            nodes, weights = np.polynomial.legendre.leggauss(points)
+
+            log_radii_nodes = (
+                segment_lowers[:, None] + 0.5 * segment_widths[:, None] * (nodes + 1.0)
+            ).ravel()
+
+            radii_nodes = np.exp(log_radii_nodes)
+
+            integrands = (
+                2.0 * np.pi * radii_nodes ** 2 * func(radii_nodes)
+            ) * np.broadcast_to(weights, (segment_widths.shape[0], points)).ravel()
+
+            segment_integrals = 0.5 * segment_widths * np.sum(
+                integrands.reshape(-1, points), axis=1
+            )
+
+            integrals_positive[1:] += np.cumsum(
+                np.bincount(
+                    np.repeat(np.arange(segments.shape[0]), segments),
+                    weights=segment_integrals,
+                    minlength=segments.shape[0],
+                )
+            )
+
+        integrals[positive] = integrals_positive
+
+    return integrals[inverse].reshape(radii.shape)
@@ -0,0 +1,67 @@
+import configparser
+import os
+from contextlib import contextmanager
+
+from autoconf import conf
+
+
+class ConfigThreads:
+    def __init__(self, section):
+        """
+        The number of threads a calculation is split over, which is read from a section of the general config with
+        the entries `parallel` and `num_threads` and can be overridden by the `threads` context manager.
+
+        Parameters
+        ----------
+        section : str
+            The section of the general config the number of threads is read from (e.g. quad_grid).
+        """
+        self.section = section
+
+        """
+        The number of threads set by the `threads` context manager, which takes precedence over the general config
+        when it is not None.
+        """
+        self.num_threads_override = None
+
+    def num_threads_from_config(self):
+        """
+        Returns the number of threads, using the section of the general config (or the `threads` context manager,
+        if one is active).
+
+        If parallel=False or the section is not in the config 1 thread is used, and num_threads=0 uses every core of
+        the machine.
+        """
+        if self.num_threads_override is not None:
+            num_threads = self.num_threads_override
+        else:
+            try:
+                if not conf.instance["general"][self.section]["parallel"]:
+                    return 1
+                num_threads = conf.instance["general"][self.section]["num_threads"]
+            except (KeyError, configparser.Error):
+                return 1
+
+        if num_threads == 0:
+            return os.cpu_count() or 1
+
+        return max(int(num_threads), 1)
+
+    @contextmanager
+    def threads(self, num_threads):
+        """
+        Context manager which uses the input number of threads for every calculation within it, irrespective of the
+        general config.
+
+        Parameters
+        ----------
+        num_threads : int
+            The number of threads, where 0 uses every core of the machine.
+        """
+        num_threads_previous = self.num_threads_override
+        self.num_threads_override = num_threads
+
+        try:
+            yield
+        finally:
+            self.num_threads_override = num_threads_previous
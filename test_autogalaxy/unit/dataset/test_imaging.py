@@ -3,7 +3,9 @@ from astropy.io import fits
 import os
 from os import path
 import numpy as np
+import pytest
 import autogalaxy as ag
+from autogalaxy import exc
 
 
 def create_fits(fits_path, array):
@@ -108,6 +110,71 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.slim == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__grid_iterate_adaptive__settings_create_adaptive_grid(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = ag.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            settings=ag.SettingsMaskedImaging(
+                grid_class=ag.Grid2DIterateAdaptive,
+                fractional_accuracy=0.99,
+                sub_steps=[2, 4],
+            ),
+        )
+
+        assert isinstance(masked_imaging_7x7.grid, ag.Grid2DIterateAdaptive)
+        assert masked_imaging_7x7.grid.fractional_accuracy == 0.99
+        assert masked_imaging_7x7.grid.sub_steps == [2, 4]
+        assert (
+            masked_imaging_7x7.grid == ag.Grid2D.from_mask(mask=sub_mask_7x7.mask_sub_1)
+        ).all()
+
+    def test__pixel_integration__settings_create_pixel_integration_grids(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = ag.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            settings=ag.SettingsMaskedImaging(
+                sub_size=1, psf_shape_2d=(3, 3), pixel_integration=True
+            ),
+        )
+
+        assert isinstance(masked_imaging_7x7.grid, ag.Grid2DPixelIntegration)
+        assert isinstance(
+            masked_imaging_7x7.blurring_grid, ag.Grid2DPixelIntegration
+        )
+        assert (
+            masked_imaging_7x7.grid == ag.Grid2D.from_mask(mask=sub_mask_7x7.mask_sub_1)
+        ).all()
+
+    def test__precision__float32_settings_create_float32_grids(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = ag.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            settings=ag.SettingsMaskedImaging(
+                sub_size=2, psf_shape_2d=(3, 3), precision="float32"
+            ),
+        )
+
+        assert isinstance(masked_imaging_7x7.grid, ag.Grid2D)
+        assert masked_imaging_7x7.grid.dtype == np.float32
+        assert masked_imaging_7x7.blurring_grid.dtype == np.float32
+        assert masked_imaging_7x7.image.dtype == np.float64
+        assert masked_imaging_7x7.grid == pytest.approx(
+            ag.Grid2D.from_mask(mask=sub_mask_7x7), 1.0e-6
+        )
+        assert masked_imaging_7x7.settings.grid_sub_size_tag.endswith("_float32")
+
+        with pytest.raises(exc.DatasetException):
+            ag.SettingsMaskedImaging(precision="float16")
+
     def test__modified_image_and_noise_map(
         self, image_7x7, noise_map_7x7, imaging_7x7, sub_mask_7x7
     ):
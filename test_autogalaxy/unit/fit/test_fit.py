@@ -762,6 +762,46 @@ class TestFitImaging:
                 == fit.unmasked_blurred_image_of_galaxies[1]
             ).all()
 
+        def test___images_of_galaxies_computed_once_and_shared_by_blurred_image_and_galaxy_images(
+            self, masked_imaging_7x7
+        ):
+            g0 = ag.Galaxy(
+                redshift=0.5, light_profile=ag.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            g1 = ag.Galaxy(
+                redshift=1.0,
+                light_profile=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=2.0),
+            )
+
+            plane = ag.Plane(redshift=0.75, galaxies=[g0, g1])
+
+            fit = ag.FitImaging(masked_imaging=masked_imaging_7x7, plane=plane)
+
+            blurred_image = plane.blurred_image_from_grid_and_convolver(
+                grid=masked_imaging_7x7.grid,
+                convolver=masked_imaging_7x7.convolver,
+                blurring_grid=masked_imaging_7x7.blurring_grid,
+            )
+
+            assert (fit.blurred_image == blurred_image).all()
+
+            blurred_images_of_galaxies = fit.blurred_images_of_galaxies
+
+            assert fit.blurred_images_of_galaxies is blurred_images_of_galaxies
+            assert fit.galaxy_model_image_dict[g0] is blurred_images_of_galaxies[0]
+            assert fit.galaxy_model_image_dict[g1] is blurred_images_of_galaxies[1]
+            assert fit.model_images_of_galaxies[0] is blurred_images_of_galaxies[0]
+
+            assert (
+                blurred_images_of_galaxies[1]
+                == g1.blurred_image_from_grid_and_convolver(
+                    grid=masked_imaging_7x7.grid,
+                    convolver=masked_imaging_7x7.convolver,
+                    blurring_grid=masked_imaging_7x7.blurring_grid,
+                )
+            ).all()
+
     class TestCompareToManualInversionOnly:
         def test___all_quantities__no_hyper_methods(self, masked_imaging_7x7):
             # Ensures the inversion grid is used, as this would cause the test to fail.
@@ -1399,6 +1439,72 @@ class TestFitImaging:
             assert fit.subtracted_images_of_galaxies[1].slim[0] == -3.0
             assert fit.subtracted_images_of_galaxies[2].slim[0] == 0.0
 
+    class TestPrecision:
+        def test__float32_grids__log_likelihood_same_as_float64_to_within_tolerance(self):
+
+            grid = ag.Grid2D.uniform(shape_native=(40, 40), pixel_scales=0.1, sub_size=2)
+
+            psf = ag.Kernel2D.from_gaussian(
+                shape_native=(5, 5), sigma=0.1, pixel_scales=0.1
+            )
+
+            galaxy = ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.EllipticalSersic(
+                    elliptical_comps=(0.1, 0.05),
+                    intensity=1.0,
+                    effective_radius=0.6,
+                    sersic_index=3.0,
+                ),
+                disk=ag.lp.EllipticalExponential(
+                    elliptical_comps=(0.2, -0.1), intensity=0.5, effective_radius=1.2
+                ),
+                core=ag.lp.EllipticalChameleon(
+                    intensity=0.2, core_radius_0=0.05, core_radius_1=0.2
+                ),
+            )
+
+            simulator = ag.SimulatorImaging(
+                exposure_time=300.0,
+                psf=psf,
+                background_sky_level=0.1,
+                add_poisson_noise=True,
+                noise_seed=1,
+            )
+
+            imaging = simulator.from_plane_and_grid(
+                plane=ag.Plane(galaxies=[galaxy]), grid=grid
+            )
+
+            mask = ag.Mask2D.circular(
+                shape_native=imaging.shape_native,
+                pixel_scales=0.1,
+                radius=1.8,
+                sub_size=2,
+            )
+
+            galaxy.bulge.intensity = 1.05
+
+            fits = [
+                ag.FitImaging(
+                    masked_imaging=ag.MaskedImaging(
+                        imaging=imaging,
+                        mask=mask,
+                        settings=ag.SettingsMaskedImaging(
+                            sub_size=2, precision=precision
+                        ),
+                    ),
+                    plane=ag.Plane(galaxies=[galaxy]),
+                )
+                for precision in ["float64", "float32"]
+            ]
+
+            assert fits[1].chi_squared_map.dtype == np.float64
+            assert fits[1].model_image == pytest.approx(fits[0].model_image, 1.0e-5)
+            assert fits[1].log_likelihood == pytest.approx(
+                fits[0].log_likelihood, 1.0e-6
+            )
+
 
 class TestFitInterferometer:
     class TestLikelihood:
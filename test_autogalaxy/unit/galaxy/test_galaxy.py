@@ -123,6 +123,15 @@ class TestLightProfiles:
 
             assert lp_0_luminosity + lp_1_luminosity == gal_luminosity
 
+            gal_luminosities = gal_x2_lp.luminosity_within_circles(
+                radii=np.array([0.5, 1.0])
+            )
+
+            assert gal_luminosities[0] == pytest.approx(gal_luminosity, 1.0e-6)
+            assert gal_luminosities[1] == pytest.approx(
+                gal_x2_lp.luminosity_within_circle(radius=1.0), 1.0e-6
+            )
+
         def test__no_light_profile__returns_none(self):
             gal_no_lp = ag.Galaxy(redshift=0.5, mass=ag.mp.SphericalIsothermal())
 
@@ -638,6 +647,15 @@ class TestMassProfiles:
 
             assert mp_0_mass + mp_1_mass == gal_mass
 
+            gal_masses = gal_x2_mp.mass_angular_within_circles(
+                radii=np.array([0.5, 1.0])
+            )
+
+            assert gal_masses[0] == pytest.approx(gal_mass, 1.0e-6)
+            assert gal_masses[1] == pytest.approx(
+                gal_x2_mp.mass_angular_within_circle(radius=1.0), 1.0e-6
+            )
+
         def test__no_mass_profile__returns_none(self):
             gal_no_mp = ag.Galaxy(redshift=0.5, light=ag.lp.SphericalSersic())
 
@@ -752,6 +770,32 @@ class TestMassProfiles:
                 1.0e-4,
             )
 
+        def test__stellar_fraction_at_radii__same_as_stellar_fraction_at_radius(
+            self, dmp_0, dmp_1, smp_0, smp_1
+        ):
+
+            galaxy = ag.Galaxy(
+                redshift=0.5,
+                stellar_0=smp_0,
+                stellar_1=smp_1,
+                dark_0=dmp_0,
+                dark_mass_1=dmp_1,
+            )
+
+            stellar_fractions = galaxy.stellar_fraction_at_radii(
+                radii=np.array([0.5, 1.0, 2.0])
+            )
+
+            assert stellar_fractions == pytest.approx(
+                np.array(
+                    [
+                        galaxy.stellar_fraction_at_radius(radius=radius)
+                        for radius in [0.5, 1.0, 2.0]
+                    ]
+                ),
+                1.0e-6,
+            )
+
     class TestDark:
         def test__dark_profiles__is_list_of_dark_profiles(self):
             galaxy = ag.Galaxy(redshift=0.5)
@@ -1154,6 +1198,37 @@ class TestHyperGalaxy:
 
 
 class TestBooleanProperties:
+    def test__profile_registry__reused_until_profile_attribute_is_set(self):
+
+        light_profile = ag.lp.EllipticalSersic()
+        mass_profile = ag.mp.SphericalIsothermal()
+
+        galaxy = ag.Galaxy(redshift=0.5, light_0=light_profile)
+
+        profile_registry = galaxy.profile_registry
+
+        assert galaxy.light_profiles == [light_profile]
+        assert galaxy.has_mass_profile is False
+
+        galaxy.hyper_galaxy_image = np.ones(9)
+
+        assert galaxy.profile_registry is profile_registry
+
+        galaxy.mass_0 = mass_profile
+
+        assert galaxy.profile_registry is not profile_registry
+        assert galaxy.mass_profiles == [mass_profile]
+        assert galaxy.has_mass_profile is True
+
+        galaxy.light_0 = None
+
+        assert galaxy.light_profiles == []
+        assert galaxy.has_light_profile is False
+
+        del galaxy.mass_0
+
+        assert galaxy.mass_profiles == []
+
     def test_has_profile(self):
         assert ag.Galaxy(redshift=0.5).has_profile is False
         assert (
@@ -1416,6 +1491,44 @@ class TestDecorators:
 
         assert image[4] == image_sub_8[4]
 
+    def test__grid_iterate_adaptive_in__centre_pixels_use_highest_sub_size(self):
+
+        mask = ag.Mask2D.unmasked(shape_native=(9, 9), pixel_scales=(1.0, 1.0))
+
+        grid = ag.Grid2DIterateAdaptive.from_mask(
+            mask=mask, fractional_accuracy=0.99, sub_steps=[2, 4, 8]
+        )
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            light=ag.lp.EllipticalSersic(
+                centre=(0.08, 0.08), intensity=1.0, effective_radius=2.0
+            ),
+        )
+
+        image = galaxy.image_from_grid(grid=grid)
+
+        mask_sub_2 = mask.mask_new_sub_size_from_mask(mask=mask, sub_size=2)
+        grid_sub_2 = ag.Grid2D.from_mask(mask=mask_sub_2)
+        image_sub_2 = galaxy.image_from_grid(grid=grid_sub_2).slim_binned
+
+        assert image[0] == image_sub_2[0]
+
+        mask_sub_8 = mask.mask_new_sub_size_from_mask(mask=mask, sub_size=8)
+        grid_sub_8 = ag.Grid2D.from_mask(mask=mask_sub_8)
+        image_sub_8 = galaxy.image_from_grid(grid=grid_sub_8).slim_binned
+
+        assert image[40] == image_sub_8[40]
+        assert image[30] == image_sub_8[30]
+
+        grid_iterate = ag.Grid2DIterate.from_mask(
+            mask=mask, fractional_accuracy=0.99, sub_steps=[2, 4, 8]
+        )
+
+        image_iterate = galaxy.image_from_grid(grid=grid_iterate)
+
+        assert image == pytest.approx(image_iterate, 1.0e-2)
+
     def test__grid_iterate_in__iterates_grid_result_correctly(self, gal_x1_mp):
 
         mask = ag.Mask2D.manual(
@@ -1553,3 +1666,40 @@ class TestDecorators:
         deflections = galaxy.deflections_from_grid(grid=grid_interp)
 
         assert (deflections == deflections_no_interp + deflections_interp).all()
+
+    def test__array_in__same_as_grid_function_and_returns_ndarray(self):
+
+        grid = np.array([[1.0, 0.5], [-0.3, 0.2], [0.1, 0.1]])
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0),
+            light_1=ag.lp.EllipticalGaussian(centre=(0.1, 0.1), intensity=1.0),
+            mass=ag.mp.EllipticalIsothermal(
+                centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), einstein_radius=1.0
+            ),
+            shear=ag.mp.ExternalShear(elliptical_comps=(0.1, 0.2)),
+        )
+
+        image = galaxy.image_from_array(array=grid)
+        convergence = galaxy.convergence_from_array(array=grid)
+        potential = galaxy.potential_from_array(array=grid)
+        deflections = galaxy.deflections_from_array(array=grid)
+
+        assert type(image) is np.ndarray
+        assert type(deflections) is np.ndarray
+        assert image == pytest.approx(galaxy.image_from_grid(grid=grid), 1.0e-12)
+        assert convergence == pytest.approx(
+            galaxy.convergence_from_grid(grid=grid), 1.0e-12
+        )
+        assert potential == pytest.approx(
+            galaxy.potential_from_grid(grid=grid), 1.0e-12
+        )
+        assert deflections == pytest.approx(
+            galaxy.deflections_from_grid(grid=grid), 1.0e-12
+        )
+
+        galaxy = ag.Galaxy(redshift=0.5)
+
+        assert (galaxy.image_from_array(array=grid) == np.zeros(3)).all()
+        assert (galaxy.deflections_from_array(array=grid) == np.zeros((3, 2))).all()
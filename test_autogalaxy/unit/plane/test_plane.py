@@ -55,6 +55,38 @@ def caustics_via_magnification_from_plane_and_grid(plane, grid):
 
 class TestAbstractPlane:
     class TestProperties:
+        def test__galaxy_registry__reused_until_galaxies_change(self):
+
+            g0 = ag.Galaxy(redshift=0.5, light_profile=ag.lp.EllipticalSersic())
+            g1 = ag.Galaxy(redshift=0.5, mass_profile=ag.mp.SphericalIsothermal())
+
+            plane = ag.Plane(galaxies=[g0, g1], redshift=None)
+
+            galaxy_registry = plane.galaxy_registry
+
+            assert plane.galaxies_with_light_profile == [g0]
+            assert plane.galaxies_with_mass_profile == [g1]
+            assert plane.galaxy_registry is galaxy_registry
+
+            g0.mass_profile = ag.mp.SphericalIsothermal()
+
+            assert plane.galaxy_registry is not galaxy_registry
+            assert plane.galaxies_with_mass_profile == [g0, g1]
+            assert plane.mass_profiles == [g0.mass_profile, g1.mass_profile]
+
+            assert plane.has_pixelization is False
+
+            g1.pixelization = ag.pix.Rectangular()
+            g1.regularization = ag.reg.Constant()
+
+            assert plane.has_pixelization is True
+            assert plane.galaxies_with_pixelization == [g1]
+
+            plane.galaxies.append(ag.Galaxy(redshift=0.5))
+
+            assert plane.galaxies_with_light_profile == [g0]
+            assert len(plane.galaxy_registry["light"]) == 1
+
         def test__point_source_dict(self, ps_0, ps_1):
 
             plane = ag.Plane(galaxies=[ag.Galaxy(redshift=0.5)], redshift=None)
@@ -897,6 +929,25 @@ class TestAbstractPlaneProfiles:
                 np.array([[2.0 * 0.707, -2.0 * 0.707], [2.0, 0.0]]), 1e-3
             )
 
+        def test__add_deflections_from_grid__adds_into_input_buffer_in_place(
+            self, sub_grid_7x7, gal_x1_mp, gal_x2_mp
+        ):
+            plane = ag.Plane(galaxies=[gal_x1_mp, gal_x2_mp], redshift=None)
+
+            deflections = np.ones((sub_grid_7x7.shape[0], 2))
+
+            result = plane.add_deflections_from_grid(
+                grid=sub_grid_7x7, deflections=deflections
+            )
+
+            assert result is deflections
+            assert deflections == pytest.approx(
+                1.0
+                + gal_x1_mp.deflections_from_grid(grid=sub_grid_7x7)
+                + gal_x2_mp.deflections_from_grid(grid=sub_grid_7x7),
+                1.0e-8,
+            )
+
         def test__plane_has_no_galaxies__deflections_are_zeros_size_of_ungalaxyed_grid(
             self, sub_grid_7x7
         ):
@@ -2,6 +2,7 @@ import os
 
 from autoconf import conf
 import autogalaxy as ag
+from autogalaxy import exc
 import numpy as np
 import pytest
 from astropy import cosmology as cosmo
@@ -374,6 +375,21 @@ class TestAbstractNFW:
 
 
 class TestGeneralizedNFW:
+    def test__mass_angular_within_circle__scalar_radii_of_integrand(self):
+
+        gnfw = ag.mp.EllipticalGeneralizedNFW(
+            centre=(0.0, 0.0),
+            elliptical_comps=(0.1, 0.05),
+            kappa_s=0.1,
+            inner_slope=1.5,
+            scale_radius=2.0,
+        )
+
+        assert gnfw.convergence_func(grid_radius=1.0).shape == ()
+        assert gnfw.mass_angular_within_circle(radius=1.0) == pytest.approx(
+            1.2712356, 1.0e-4
+        )
+
     def test__convergence_correct_values(self):
 
         gnfw = ag.mp.SphericalGeneralizedNFW(
@@ -589,6 +605,144 @@ class TestGeneralizedNFW:
         assert deflections[0, 0] == pytest.approx(-5.99032, 1e-3)
         assert deflections[0, 1] == pytest.approx(-4.02541, 1e-3)
 
+    def test__gauss_legendre_integration_mode__close_to_quad_values(self):
+
+        gnfw = ag.mp.EllipticalGeneralizedNFW(
+            centre=(1.0, 1.0),
+            kappa_s=5.0,
+            elliptical_comps=ag.convert.elliptical_comps_from(
+                axis_ratio=0.5, phi=100.0
+            ),
+            inner_slope=1.0,
+            scale_radius=10.0,
+        )
+
+        potential = gnfw.potential_from_grid(
+            grid=np.array([[2.0, 2.0]]), integration_mode="gauss_legendre"
+        )
+
+        assert potential == pytest.approx(2.4718, 1e-4)
+
+        gnfw = ag.mp.EllipticalGeneralizedNFW(
+            centre=(0.3, 0.2),
+            kappa_s=2.5,
+            elliptical_comps=ag.convert.elliptical_comps_from(
+                axis_ratio=0.5, phi=100.0
+            ),
+            inner_slope=1.5,
+            scale_radius=4.0,
+        )
+
+        deflections = gnfw.deflections_from_grid_via_integrator(
+            grid=np.array([[0.1875, 0.1625]]), integration_mode="gauss_legendre"
+        )
+
+        assert deflections[0, 0] == pytest.approx(-5.99032, 1e-3)
+        assert deflections[0, 1] == pytest.approx(-4.02541, 1e-3)
+
+        grid = np.array([[0.1875, 0.1625], [1.0, 2.0], [-0.5, 0.01], [3.0, -2.0]])
+
+        for inner_slope in [0.5, 1.0, 1.9]:
+
+            gnfw.inner_slope = inner_slope
+
+            potential_quad = gnfw.potential_from_grid(grid=grid)
+            potential_gauss_legendre = gnfw.potential_from_grid(
+                grid=grid, integration_mode="gauss_legendre"
+            )
+
+            assert potential_gauss_legendre == pytest.approx(potential_quad, 1e-4)
+
+            deflections_quad = gnfw.deflections_from_grid_via_integrator(grid=grid)
+            deflections_gauss_legendre = gnfw.deflections_from_grid_via_integrator(
+                grid=grid, integration_mode="gauss_legendre"
+            )
+
+            assert deflections_gauss_legendre == pytest.approx(deflections_quad, 1e-3)
+
+        with pytest.raises(exc.ProfileException):
+            gnfw.potential_from_grid(grid=grid, integration_mode="trapezium")
+
+    def test__tabulated_integrals__cached_and_master_table_close_to_quad_values(self):
+
+        tabulated_integral_0 = ag.mp.dark_mass_profiles.gnfw_tabulated_integral_from(
+            integral="potential",
+            minimum_log_eta=-4.0,
+            maximum_log_eta=0.5,
+            tabulate_bins=1000,
+            scale_radius=2.0,
+            inner_slope=1.2,
+        )
+        tabulated_integral_1 = ag.mp.dark_mass_profiles.gnfw_tabulated_integral_from(
+            integral="potential",
+            minimum_log_eta=-4.0,
+            maximum_log_eta=0.5,
+            tabulate_bins=1000,
+            scale_radius=2.0,
+            inner_slope=1.2,
+        )
+
+        assert tabulated_integral_0 is tabulated_integral_1
+        assert tabulated_integral_0.flags.writeable is False
+
+        gnfw = ag.mp.EllipticalGeneralizedNFW(
+            centre=(0.3, 0.2),
+            kappa_s=2.5,
+            elliptical_comps=ag.convert.elliptical_comps_from(
+                axis_ratio=0.5, phi=100.0
+            ),
+            inner_slope=1.5,
+            scale_radius=4.0,
+        )
+
+        grid = np.array([[0.1875, 0.1625], [1.0, 2.0], [-0.5, 0.01], [3.0, -2.0]])
+
+        for inner_slope in [0.5, 1.0, 1.9]:
+
+            gnfw.inner_slope = inner_slope
+
+            potential_quad = gnfw.potential_from_grid(
+                grid=grid, integration_mode="gauss_legendre"
+            )
+            potential_master_table = gnfw.potential_from_grid(
+                grid=grid, integration_mode="gauss_legendre", tabulate_mode="master_table"
+            )
+
+            assert potential_master_table == pytest.approx(potential_quad, 1e-4)
+
+            deflections_quad = gnfw.deflections_from_grid_via_integrator(
+                grid=grid, integration_mode="gauss_legendre"
+            )
+            deflections_master_table = gnfw.deflections_from_grid_via_integrator(
+                grid=grid, integration_mode="gauss_legendre", tabulate_mode="master_table"
+            )
+
+            assert deflections_master_table == pytest.approx(deflections_quad, 1e-3)
+
+        with pytest.raises(exc.ProfileException):
+            gnfw.potential_from_grid(grid=grid, tabulate_mode="spline")
+
+    def test__convergence_func__tabulated_close_to_integrator_values(self):
+
+        gnfw = ag.mp.SphericalGeneralizedNFW(
+            centre=(0.0, 0.0), kappa_s=1.5, inner_slope=1.5, scale_radius=2.0
+        )
+
+        grid_radius = np.array([1.0e-7, 1.0e-3, 0.1, 1.0, 2.5, 30.0, 1.0e5])
+
+        for inner_slope in [0.5, 1.0, 1.9]:
+
+            gnfw.inner_slope = inner_slope
+
+            convergence = gnfw.convergence_func(grid_radius=grid_radius)
+            convergence_via_integrator = gnfw.convergence_func_via_integrator(
+                grid_radius=grid_radius
+            )
+
+            assert convergence == pytest.approx(convergence_via_integrator, 1e-5)
+
+        assert grid_radius[0] == 1.0e-7
+
     def test__convergence__change_geometry(self):
 
         gnfw_0 = ag.mp.SphericalGeneralizedNFW(centre=(0.0, 0.0))
@@ -50,6 +50,44 @@ class TestMassWithin:
 
         assert mass_grid == pytest.approx(mass, 0.02)
 
+    def test__mass_angular_within_circles__same_as_mass_angular_within_circle_of_every_radius(self):
+
+        radii = np.array([0.05, 1.0, 0.3, 2.5, 1.0])
+
+        for mass_profile in [
+            ag.mp.EllipticalSersic(
+                elliptical_comps=(0.1, 0.2),
+                intensity=2.0,
+                effective_radius=0.8,
+                sersic_index=3.0,
+                mass_to_light_ratio=2.0,
+            ),
+            ag.mp.EllipticalGaussian(
+                elliptical_comps=(0.1, 0.2),
+                intensity=2.0,
+                sigma=0.5,
+                mass_to_light_ratio=2.0,
+            ),
+            ag.mp.EllipticalChameleon(intensity=1.0),
+            ag.mp.EllipticalPowerLaw(einstein_radius=1.2, slope=2.3),
+            ag.mp.EllipticalGeneralizedNFW(
+                kappa_s=0.1, scale_radius=5.0, inner_slope=1.5
+            ),
+        ]:
+
+            masses = mass_profile.mass_angular_within_circles(radii=radii)
+
+            assert masses.shape == (5,)
+            assert masses == pytest.approx(
+                np.array(
+                    [
+                        mass_profile.mass_angular_within_circle(radius=radius)
+                        for radius in radii
+                    ]
+                ),
+                1.0e-6,
+            )
+
 
 class TestRadiusAverageConvergenceOne:
     def test__radius_of_average_convergence(self):
@@ -653,3 +691,212 @@ class TestDecorators:
             grid_interp=grid_interp
         )
         assert (deflections_interpolate == interpolated_grid).all()
+
+    def test__array_in__same_as_grid_function_and_returns_ndarray(self):
+
+        grid = np.array([[1.0, 0.5], [-0.3, 0.2], [0.1, 0.1]])
+
+        for mass_profile in (
+            ag.mp.EllipticalIsothermal(
+                centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), einstein_radius=1.0
+            ),
+            ag.mp.SphericalIsothermal(centre=(0.1, 0.1), einstein_radius=1.0),
+            ag.mp.ExternalShear(elliptical_comps=(0.1, 0.2)),
+            ag.mp.EllipticalNFW(
+                centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), kappa_s=0.1
+            ),
+            ag.mp.EllipticalSersic(centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2)),
+        ):
+
+            convergence = mass_profile.convergence_from_array(array=grid)
+            deflections = mass_profile.deflections_from_array(array=grid)
+
+            assert type(convergence) is np.ndarray
+            assert type(deflections) is np.ndarray
+            assert convergence == pytest.approx(
+                mass_profile.convergence_from_grid(grid=grid), 1.0e-12
+            )
+            assert deflections == pytest.approx(
+                mass_profile.deflections_from_grid(grid=grid), 1.0e-12
+            )
+
+        mass_profile = ag.mp.EllipticalIsothermal(
+            centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), einstein_radius=1.0
+        )
+
+        potential = mass_profile.potential_from_array(array=grid)
+
+        assert type(potential) is np.ndarray
+        assert potential == pytest.approx(
+            mass_profile.potential_from_grid(grid=grid), 1.0e-12
+        )
+
+
+class TestMassProfileMGE:
+    def test__w_f_approx_jit__same_as_w_f_approx(self):
+
+        z = np.array(
+            [
+                0.1 + 0.1j,
+                1.5 + 0.01j,
+                3.0 + 0.2j,
+                5.0 + 1e-8j,
+                5.0 + 2.0j,
+                7.0 + 3.0j,
+                12.0 + 5.0j,
+                150.0 + 100.0j,
+                2.0 - 1.0j,
+            ]
+        )
+
+        w_f = ag.mp.mass_profiles.w_f_approx(z=z.copy())
+
+        for i in range(z.shape[0]):
+            assert ag.mp.mass_profiles.w_f_approx_jit(z[i]) == pytest.approx(
+                w_f[i], 1e-12
+            )
+
+    def test__zeta_from_grid__same_as_summing_w_f_approx_per_gaussian(self):
+
+        grid = np.array([[1.0, 0.5], [-1.0, 0.5], [0.1, -2.0], [-3.0, -0.2]])
+        amps = np.array([0.5, 1.0, 2.0])
+        sigmas = np.array([0.3, 1.0, 3.0])
+        axis_ratio = 0.6
+
+        zeta = ag.mp.mass_profiles.MassProfileMGE.zeta_from_grid(
+            grid=grid, amps=amps, sigmas=sigmas, axis_ratio=axis_ratio
+        )
+
+        scale_factor = axis_ratio / np.sqrt(2.0 * (1.0 - axis_ratio ** 2))
+
+        xs = grid[:, 1] * scale_factor
+        ys = np.abs(grid[:, 0]) * scale_factor
+        expv = -(xs ** 2) * (1.0 - axis_ratio ** 2) - ys ** 2 * (
+            1.0 / axis_ratio ** 2 - 1.0
+        )
+
+        zeta_manual = np.zeros(grid.shape[0], dtype="complex128")
+
+        for amp, sigma in zip(amps, sigmas):
+            z = (xs + 1j * ys) / sigma
+            zq = (axis_ratio * xs + 1j * ys / axis_ratio) / sigma
+            zeta_manual += (amp * sigma) * (
+                -1j
+                * (
+                    ag.mp.mass_profiles.w_f_approx(z)
+                    - np.exp(expv / sigma ** 2) * ag.mp.mass_profiles.w_f_approx(zq)
+                )
+            )
+
+        zeta_manual[grid[:, 0] < 0.0] = np.conj(zeta_manual[grid[:, 0] < 0.0])
+
+        assert zeta == pytest.approx(zeta_manual, 1e-12)
+
+    def test__decompose_convergence_into_gaussians_via_cache__cached_per_parameters(self):
+
+        sersic = ag.mp.EllipticalSersic(
+            elliptical_comps=(0.1, 0.2),
+            intensity=2.0,
+            effective_radius=0.8,
+            sersic_index=2.5,
+            mass_to_light_ratio=1.0,
+        )
+
+        amps_0, sigmas_0 = sersic._decompose_convergence_into_gaussians_via_cache()
+        amps_1, sigmas_1 = sersic._decompose_convergence_into_gaussians_via_cache()
+
+        assert amps_0 is amps_1
+        assert sigmas_0 is sigmas_1
+        assert amps_0.flags.writeable is False
+
+        amps, sigmas = sersic.decompose_convergence_into_gaussians()
+
+        assert amps_0 == pytest.approx(amps, 1e-12)
+        assert sigmas_0 == pytest.approx(sigmas, 1e-12)
+
+        sersic_normalized = sersic.with_new_normalization(normalization=2.0)
+
+        (
+            amps_normalized,
+            sigmas_normalized,
+        ) = sersic_normalized._decompose_convergence_into_gaussians_via_cache()
+
+        assert amps_normalized == pytest.approx(2.0 * amps_0, 1e-12)
+        assert sigmas_normalized == pytest.approx(sigmas_0, 1e-12)
+        assert sersic._decompose_convergence_into_gaussians_via_cache()[0] is amps_0
+
+    def test__decompose_convergence_into_gaussians_via_cache__keyed_on_every_constructor_argument(self):
+
+        sersic_0 = ag.mp.EllipticalSersicRadialGradient(
+            elliptical_comps=[0.1, 0.2],
+            intensity=2.0,
+            effective_radius=0.8,
+            sersic_index=2.5,
+            mass_to_light_gradient=np.array(0.5),
+        )
+        sersic_1 = ag.mp.EllipticalSersicRadialGradient(
+            elliptical_comps=[0.1, 0.2],
+            intensity=2.0,
+            effective_radius=0.8,
+            sersic_index=2.5,
+            mass_to_light_gradient=np.array(1.0),
+        )
+
+        amps_0, sigmas_0 = sersic_0._decompose_convergence_into_gaussians_via_cache()
+        amps_1, sigmas_1 = sersic_1._decompose_convergence_into_gaussians_via_cache()
+
+        assert amps_0 is not amps_1
+        assert amps_1 == pytest.approx(
+            sersic_1.decompose_convergence_into_gaussians()[0], 1e-12
+        )
+        assert amps_1 != pytest.approx(amps_0, 1e-4)
+
+        sersic_1.elliptical_comps = [0.1, 0.3]
+
+        assert ag.mp.mass_profiles.mge_parameters_key_from(
+            profile=sersic_1
+        ) != ag.mp.mass_profiles.mge_parameters_key_from(profile=sersic_0)
+
+    def test__decompose_convergence_into_gaussians_via_cache__unkeyable_parameter__not_cached(self):
+
+        sersic = ag.mp.EllipticalSersic(intensity=2.0)
+
+        sersic.centre = (0.0, np.array([0.0]))
+
+        assert ag.mp.mass_profiles.mge_parameters_key_from(profile=sersic) is not None
+
+        sersic.centre = {"y": 0.0, "x": 0.0}
+
+        assert ag.mp.mass_profiles.mge_parameters_key_from(profile=sersic) is None
+
+        amps_0, sigmas_0 = sersic._decompose_convergence_into_gaussians_via_cache()
+        amps_1, sigmas_1 = sersic._decompose_convergence_into_gaussians_via_cache()
+
+        assert amps_0 is not amps_1
+        assert amps_0 == pytest.approx(amps_1, 1e-12)
+
+    def test__decompose_convergence_into_gaussians_via_cache__mcr_profiles_not_storing_every_argument(self):
+
+        grid = np.array([[0.5, 0.5]])
+
+        truncated_nfw = ag.mp.SphericalTruncatedNFWMCRChallenge()
+
+        assert truncated_nfw.convergence_from_grid_via_gaussians(
+            grid=grid
+        ) == pytest.approx(0.0014600552, 1.0e-4)
+
+        truncated_nfw = ag.mp.SphericalTruncatedNFWMCRDuffy()
+
+        assert truncated_nfw.convergence_from_grid_via_gaussians(
+            grid=grid
+        ) == pytest.approx(0.0010672062, 1.0e-4)
+        assert (
+            truncated_nfw._decompose_convergence_into_gaussians_via_cache()[0]
+            is truncated_nfw._decompose_convergence_into_gaussians_via_cache()[0]
+        )
+
+        truncated_nfw = ag.mp.SphericalTruncatedNFWMCRLudlow()
+
+        assert truncated_nfw.convergence_from_grid_via_gaussians(
+            grid=grid
+        ) == pytest.approx(0.0010345833, 1.0e-4)
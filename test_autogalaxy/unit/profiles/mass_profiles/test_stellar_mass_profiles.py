@@ -1530,6 +1530,22 @@ class TestCoreSersic:
 
 
 class TestChameleon:
+    def test__mass_angular_within_circle__scalar_radii_of_integrand(self):
+
+        chameleon = ag.mp.EllipticalChameleon(
+            centre=(0.0, 0.0),
+            elliptical_comps=(0.1, 0.05),
+            intensity=1.0,
+            core_radius_0=0.1,
+            core_radius_1=0.3,
+            mass_to_light_ratio=2.0,
+        )
+
+        assert chameleon.image_from_grid_radii(grid_radii=1.0).shape == ()
+        assert chameleon.mass_angular_within_circle(radius=1.0) == pytest.approx(
+            1.2180487, 1.0e-4
+        )
+
     def test__convergence_correct_values(self):
 
         chameleon = ag.mp.EllipticalChameleon(
@@ -1571,6 +1587,18 @@ class TestChameleon:
         assert deflections[0, 0] == pytest.approx(2.12608, 1e-3)
         assert deflections[0, 1] == pytest.approx(1.55252, 1e-3)
 
+        deflections_float32 = chameleon.deflections_from_grid(
+            grid=np.array([[0.1625, 0.1625]]), precision="float32"
+        )
+
+        assert deflections_float32[0, 0] == pytest.approx(2.12608, 1e-3)
+        assert deflections_float32[0, 1] == pytest.approx(1.55252, 1e-3)
+
+        with pytest.raises(ag.exc.ProfileException):
+            chameleon.deflections_from_grid(
+                grid=np.array([[0.1625, 0.1625]]), precision="float16"
+            )
+
     def test__convergence__change_geometry(self):
         chameleon_0 = ag.mp.EllipticalChameleon(
             centre=(0.0, 0.0), intensity=3.0, core_radius_0=0.2, core_radius_1=0.4
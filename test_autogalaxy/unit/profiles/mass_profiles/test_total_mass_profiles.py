@@ -449,6 +449,70 @@ class TestBrokenPowerLaw:
 
         assert deflections.shape_native == (2, 2)
 
+    def test__deflections__same_as_fixed_term_series(self):
+
+        broken_power_law = ag.mp.EllipticalBrokenPowerLaw(
+            centre=(0, 0),
+            elliptical_comps=(0.2, 0.1),
+            einstein_radius=1.0,
+            inner_slope=1.5,
+            outer_slope=2.5,
+            break_radius=0.3,
+        )
+
+        grid = np.array([[0.05, 0.1], [-0.2, 0.1], [0.5, 1.0], [-1.5, -0.3]])
+
+        z = grid[:, 1] + 1j * grid[:, 0]
+        radius = np.hypot(z.real * broken_power_law.axis_ratio, z.imag)
+
+        series = broken_power_law.hyp2f1_series(
+            broken_power_law.inner_slope, broken_power_law.axis_ratio, radius, z
+        )
+
+        deflections = ag.mp.total_mass_profiles.broken_power_law_deflections_jit(
+            z=z,
+            axis_ratio=broken_power_law.axis_ratio,
+            kB=broken_power_law.kB,
+            break_radius=broken_power_law.break_radius,
+            inner_slope=broken_power_law.inner_slope,
+            outer_slope=broken_power_law.outer_slope,
+            dt=broken_power_law.dt,
+            max_terms=20,
+            tolerance=1.0e-8,
+        )
+
+        factors = (
+            2
+            * broken_power_law.kB
+            * (broken_power_law.break_radius ** 2)
+            / (broken_power_law.axis_ratio * z * (2 - broken_power_law.inner_slope))
+        )
+
+        inner_part = (
+            factors
+            * series
+            * (broken_power_law.break_radius / radius)
+            ** (broken_power_law.inner_slope - 2)
+        ).conjugate()
+
+        assert deflections[0:2] == pytest.approx(inner_part[0:2], 1.0e-5)
+
+        deflections = broken_power_law.deflections_from_grid(grid=grid)
+
+        deflections_complex64 = broken_power_law.deflections_from_grid(
+            grid=grid, precision="complex64"
+        )
+
+        deflections_fixed_terms = broken_power_law.deflections_from_grid(
+            grid=grid, tolerance=0.0
+        )
+
+        assert deflections == pytest.approx(deflections_fixed_terms, 1.0e-6)
+        assert deflections_complex64 == pytest.approx(deflections, 1.0e-5)
+
+        with pytest.raises(ag.exc.ProfileException):
+            broken_power_law.deflections_from_grid(grid=grid, precision="float64")
+
 
 class TestCoredPowerLaw:
     def test__convergence_correct_values(self):
@@ -579,6 +643,42 @@ class TestCoredPowerLaw:
         assert deflections[0, 0] == pytest.approx(0.01111, 1e-3)
         assert deflections[0, 1] == pytest.approx(0.11403, 1e-3)
 
+    def test__deflections_and_potential__same_as_integrator(self):
+
+        grid = np.array([[0.1625, 0.1625], [1.0, -2.0], [-0.3, 0.05], [2.5, 1.5]])
+
+        for slope, core_radius, axis_ratio in [
+            (1.5, 0.2, 0.8),
+            (2.0, 0.1, 0.5),
+            (2.0, 0.1, 1.0),
+            (2.4, 0.5, 0.3),
+            (2.8, 0.3, 0.7),
+        ]:
+
+            cored_power_law = ag.mp.EllipticalCoredPowerLaw(
+                centre=(0.2, -0.2),
+                elliptical_comps=ag.convert.elliptical_comps_from(
+                    axis_ratio=axis_ratio, phi=30.0
+                ),
+                einstein_radius=1.2,
+                slope=slope,
+                core_radius=core_radius,
+            )
+
+            deflections = cored_power_law.deflections_from_grid(grid=grid)
+            deflections_via_integrator = cored_power_law.deflections_from_grid_via_integrator(
+                grid=grid
+            )
+
+            assert deflections == pytest.approx(deflections_via_integrator, 1e-6)
+
+            potential = cored_power_law.potential_from_grid(grid=grid)
+            potential_via_integrator = cored_power_law.potential_from_grid_via_integrator(
+                grid=grid
+            )
+
+            assert potential == pytest.approx(potential_via_integrator, 1e-6)
+
     def test__convergence__change_geometry(self):
         cored_power_law_0 = ag.mp.SphericalCoredPowerLaw(centre=(0.0, 0.0))
         cored_power_law_1 = ag.mp.SphericalCoredPowerLaw(centre=(1.0, 1.0))
@@ -1378,6 +1478,23 @@ class TestIsothermal:
         assert deflections[0, 0] == pytest.approx(0.79421, 1e-3)
         assert deflections[0, 1] == pytest.approx(0.50734, 1e-3)
 
+    def test__deflections__float32_grid__computed_in_float32(self):
+
+        isothermal = ag.mp.EllipticalIsothermal(
+            centre=(0.1, 0.0), elliptical_comps=(0.1, 0.333333), einstein_radius=1.0
+        )
+
+        grid = ag.Grid2D.uniform(shape_native=(4, 4), pixel_scales=0.3, sub_size=1)
+
+        deflections_float32 = isothermal.deflections_from_grid(
+            grid=grid.astype("float32")
+        )
+
+        assert deflections_float32.dtype == np.float32
+        assert deflections_float32 == pytest.approx(
+            isothermal.deflections_from_grid(grid=grid), 1.0e-4
+        )
+
     def test__shear__correct_values(self):
 
         isothermal = ag.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0)
@@ -337,6 +337,118 @@ class TestEllipticalProfile:
 
             assert eccentric_radius == pytest.approx(1.58113, 1e-3)
 
+    class TestTransformedGridAndRadii:
+        def test__same_as_trigonometric_transform_and_radii_equations(self):
+
+            elliptical_profile = geometry_profiles.EllipticalProfile.from_axis_ratio_and_phi(
+                centre=(0.3, -0.2), axis_ratio=0.6, phi=37.0
+            )
+
+            grid = np.array([[1.0, 1.0], [-2.0, 0.5], [0.3, 4.0], [-1.5, -3.2]])
+
+            shifted = grid - np.array([0.3, -0.2])
+            radius = np.sqrt(np.sum(shifted ** 2.0, 1))
+            theta = np.arctan2(shifted[:, 0], shifted[:, 1]) - np.radians(37.0)
+            transformed_grid = np.vstack(
+                (radius * np.sin(theta), radius * np.cos(theta))
+            ).T
+            elliptical_radii = np.sqrt(
+                transformed_grid[:, 1] ** 2 + (transformed_grid[:, 0] / 0.6) ** 2
+            )
+
+            (
+                grid_transformed,
+                grid_elliptical_radii,
+                grid_eccentric_radii,
+            ) = elliptical_profile.transformed_grid_and_radii_from(grid=grid)
+
+            assert grid_transformed == pytest.approx(transformed_grid, 1.0e-8)
+            assert grid_elliptical_radii == pytest.approx(elliptical_radii, 1.0e-8)
+            assert grid_eccentric_radii == pytest.approx(
+                np.sqrt(0.6) * elliptical_radii, 1.0e-8
+            )
+
+            assert elliptical_profile.transform_grid_to_reference_frame(
+                grid=grid
+            ) == pytest.approx(transformed_grid, 1.0e-8)
+
+            grid_elliptical_radii = elliptical_profile.grid_to_elliptical_radii(
+                grid=grid_transformed
+            )
+
+            assert grid_elliptical_radii == pytest.approx(elliptical_radii, 1.0e-8)
+
+        def test__coordinates_within_radial_minimum__moved_to_radial_minimum(self):
+
+            elliptical_profile = geometry_profiles.EllipticalProfile.from_axis_ratio_and_phi(
+                centre=(1.0, 1.0), axis_ratio=0.5, phi=0.0
+            )
+
+            (
+                grid_transformed,
+                grid_elliptical_radii,
+                grid_eccentric_radii,
+            ) = elliptical_profile.transformed_grid_and_radii_from(
+                grid=np.array([[1.0, 1.0], [1.00001, 1.0]])
+            )
+
+            assert grid_transformed == pytest.approx(
+                np.array([[0.0001, 0.0001], [0.0001, 0.0]]), 1.0e-8
+            )
+            assert grid_elliptical_radii == pytest.approx(
+                np.array([np.sqrt(0.0001 ** 2 + 0.0002 ** 2), 0.0002]), 1.0e-8
+            )
+
+
+    class TestTransformCache:
+        def test__aligned_profiles_share_transformed_grid_and_radii_within_block(
+            self,
+        ):
+
+            grid = np.array([[1.0, 1.0], [-2.0, 0.5], [0.3, 4.0]])
+
+            profile_0 = geometry_profiles.EllipticalProfile(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2)
+            )
+            profile_1 = geometry_profiles.EllipticalProfile(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2)
+            )
+            profile_2 = geometry_profiles.EllipticalProfile(
+                centre=(0.1, 0.2), elliptical_comps=(0.2, 0.2)
+            )
+
+            transformed_grid_0 = profile_0.transform_grid_to_reference_frame(grid=grid)
+            transformed_grid_1 = profile_1.transform_grid_to_reference_frame(grid=grid)
+
+            assert transformed_grid_0 is not transformed_grid_1
+
+            with geometry_profiles.transform_cache:
+
+                transformed_grid_0 = profile_0.transform_grid_to_reference_frame(
+                    grid=grid
+                )
+                transformed_grid_1 = profile_1.transform_grid_to_reference_frame(
+                    grid=grid
+                )
+                transformed_grid_2 = profile_2.transform_grid_to_reference_frame(
+                    grid=grid
+                )
+
+                assert transformed_grid_0 is transformed_grid_1
+                assert transformed_grid_0 is not transformed_grid_2
+                assert (
+                    transformed_grid_2
+                    == profile_2._transform_grid_to_reference_frame(grid=grid)
+                ).all()
+
+                radii_0 = profile_0.transformed_grid_and_radii_from(grid=grid)
+                radii_1 = profile_1.transformed_grid_and_radii_from(grid=grid)
+
+                assert radii_0 is radii_1
+
+            assert geometry_profiles.transform_cache.result_dict == {}
+            assert geometry_profiles.transform_cache.grid_dict == {}
+
 
 class TestSphericalProfile:
     class TestCoordinatesMovement:
@@ -7,6 +7,7 @@ import pytest
 import scipy.special
 
 import autogalaxy as ag
+from autogalaxy import exc
 from autogalaxy.mock import mock
 
 grid = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [2.0, 4.0]])
@@ -171,6 +172,76 @@ class TestGaussian:
 
         assert image.shape_native == (2, 2)
 
+    def test__image_from_grid_via_pixel_integration__correct_values(self):
+
+        mask = ag.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0)
+
+        grid = ag.Grid2D.from_mask(mask=mask)
+
+        gaussian = ag.lp.SphericalGaussian(intensity=2.0, sigma=0.5)
+
+        image = gaussian.image_from_grid_via_pixel_integration(grid=grid)
+
+        assert image.shape_native == (3, 3)
+        assert image[4] == pytest.approx(
+            2.0 * 2.0 * np.pi * 0.25 * math.erf(1.0 / np.sqrt(2.0)) ** 2, 1.0e-8
+        )
+        assert image[5] == pytest.approx(
+            2.0
+            * 2.0
+            * np.pi
+            * 0.25
+            * math.erf(1.0 / np.sqrt(2.0))
+            * 0.5
+            * (math.erf(3.0 / np.sqrt(2.0)) - math.erf(1.0 / np.sqrt(2.0))),
+            1.0e-8,
+        )
+
+        gaussian = ag.lp.EllipticalGaussian(
+            centre=(0.1, -0.2), elliptical_comps=(0.2, -0.3), intensity=2.0, sigma=0.5
+        )
+
+        image = gaussian.image_from_grid_via_pixel_integration(grid=grid)
+
+        image_sub_64 = gaussian.image_from_grid(
+            grid=ag.Grid2D.uniform(shape_native=(3, 3), pixel_scales=1.0, sub_size=64)
+        ).slim_binned
+
+        assert image == pytest.approx(image_sub_64, 1.0e-3)
+        assert np.sum(image) == pytest.approx(np.sum(image_sub_64), 1.0e-4)
+
+        grid = ag.Grid2D.from_mask(
+            mask=ag.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0, sub_size=2)
+        )
+
+        image_sub_2 = gaussian.image_from_grid_via_pixel_integration(grid=grid)
+
+        assert image_sub_2.slim_binned == pytest.approx(image, 1.0e-8)
+
+    def test__image_from_grid__grid_pixel_integration_uses_pixel_integration(self):
+
+        mask = ag.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0)
+
+        grid = ag.Grid2DPixelIntegration.from_mask(mask=mask)
+
+        gaussian = ag.lp.EllipticalGaussian(
+            centre=(0.1, -0.2), elliptical_comps=(0.2, -0.3), intensity=2.0, sigma=0.5
+        )
+
+        image = gaussian.image_from_grid(grid=grid)
+
+        assert image == pytest.approx(
+            gaussian.image_from_grid_via_pixel_integration(
+                grid=ag.Grid2D.from_mask(mask=mask)
+            ),
+            1.0e-8,
+        )
+
+        with pytest.raises(exc.ProfileException):
+            gaussian.image_from_grid_via_pixel_integration(
+                grid=ag.Grid2DIrregular([(1.0, 1.0)])
+            )
+
 
 class TestSersic:
     def test__image_from_grid_radii__correct_value(self):
@@ -197,6 +268,33 @@ class TestSersic:
 
         assert image == pytest.approx(4.90657319276, 1e-3)
 
+    def test__image_from_grid_radii__same_as_power_expression(self):
+
+        grid_radii = np.array([1.0e-6, 0.1, 0.6, 1.5, 10.0])
+
+        for sersic in [
+            ag.lp.EllipticalSersic(intensity=3.0, effective_radius=2.0, sersic_index=2.5),
+            ag.lp.EllipticalExponential(intensity=1.0, effective_radius=0.5),
+            ag.lp.EllipticalDevVaucouleurs(intensity=2.0, effective_radius=1.5),
+        ]:
+
+            image = sersic.image_from_grid_radii(grid_radii=grid_radii)
+
+            image_power = sersic.intensity * np.exp(
+                -sersic.sersic_constant
+                * (
+                    (grid_radii / sersic.effective_radius)
+                    ** (1.0 / sersic.sersic_index)
+                    - 1.0
+                )
+            )
+
+            assert image == pytest.approx(image_power, 1.0e-10)
+
+        assert ag.lp.sersic_constant_from(sersic_index=2.5) == pytest.approx(
+            4.670911, 1.0e-4
+        )
+
     def test__image_from_grid__correct_values_for_input_parameters(self):
         sersic = ag.lp.EllipticalSersic(
             elliptical_comps=(0.0, 0.333333),
@@ -708,6 +806,37 @@ class TestLuminosityWithinCircle:
 
         assert luminosity_grid == pytest.approx(luminosity_integral, 0.02)
 
+    def test__luminosity_within_circles__same_as_luminosity_within_circle_of_every_radius(self):
+
+        radii = np.array([0.05, 1.0, 0.3, 2.5, 1.0])
+
+        for light_profile in [
+            ag.lp.EllipticalSersic(
+                elliptical_comps=(0.1, 0.2),
+                intensity=2.0,
+                effective_radius=0.8,
+                sersic_index=3.0,
+            ),
+            ag.lp.EllipticalGaussian(
+                elliptical_comps=(0.2, 0.0), intensity=1.0, sigma=0.4
+            ),
+            ag.lp.EllipticalCoreSersic(intensity=1.0, effective_radius=0.7),
+            ag.lp.EllipticalChameleon(intensity=1.0),
+        ]:
+
+            luminosities = light_profile.luminosity_within_circles(radii=radii)
+
+            assert luminosities.shape == (5,)
+            assert luminosities == pytest.approx(
+                np.array(
+                    [
+                        light_profile.luminosity_within_circle(radius=radius)
+                        for radius in radii
+                    ]
+                ),
+                1.0e-6,
+            )
+
 
 class TestDecorators:
     def test__grid_iterate_in__iterates_grid_correctly(self):
@@ -815,6 +944,30 @@ class TestDecorators:
         )
         assert (image_interpolate == interpolated_array).all()
 
+    def test__array_in__same_as_grid_function_and_returns_ndarray(self):
+
+        grid = np.array([[1.0, 0.5], [-0.3, 0.2], [0.1, 0.1]])
+
+        for light_profile in (
+            ag.lp.EllipticalGaussian(
+                centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), intensity=1.0
+            ),
+            ag.lp.EllipticalSersic(
+                centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), intensity=1.0
+            ),
+            ag.lp.SphericalExponential(centre=(0.1, 0.1), intensity=1.0),
+            ag.lp.EllipticalChameleon(
+                centre=(0.1, 0.1), elliptical_comps=(0.1, 0.2), intensity=1.0
+            ),
+        ):
+
+            image = light_profile.image_from_array(array=grid)
+
+            assert type(image) is np.ndarray
+            assert image == pytest.approx(
+                light_profile.image_from_grid(grid=grid), 1.0e-12
+            )
+
 
 class TestRegression:
     def test__centre_of_profile_in_right_place(self):
@@ -848,6 +1001,142 @@ class TestRegression:
         assert max_indexes == (1, 4)
 
 
+class TestImageFromGridViaBatch:
+    def test__same_as_summed_images_of_profiles(self):
+
+        light_profiles = [
+            ag.lp.EllipticalGaussian(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.05), intensity=1.0, sigma=0.5
+            ),
+            ag.lp.EllipticalSersic(
+                centre=(0.0, 0.1),
+                elliptical_comps=(0.2, -0.1),
+                intensity=2.0,
+                effective_radius=0.8,
+                sersic_index=3.0,
+            ),
+            ag.lp.SphericalExponential(centre=(0.0, 0.0), intensity=0.5),
+            ag.lp.EllipticalCoreSersic(
+                centre=(0.2, 0.0), elliptical_comps=(-0.1, 0.1), intensity=0.3
+            ),
+            ag.lp.EllipticalChameleon(
+                centre=(-0.1, 0.0), elliptical_comps=(0.1, 0.1), intensity=0.3
+            ),
+            mock.MockLightProfile(value=1.0, size=5),
+        ]
+
+        grid = np.array(
+            [[0.1, 0.2], [1.0, 1.0], [-0.5, 0.3], [2.0, -1.5], [0.0, 0.0]]
+        )
+
+        image = ag.lp.image_from_grid_via_batch(
+            light_profiles=light_profiles, grid=grid
+        )
+
+        image_summed = sum(
+            [light_profile.image_from_grid(grid=grid) for light_profile in light_profiles]
+        )
+
+        assert image == pytest.approx(image_summed, 1.0e-10)
+
+        buffer = np.ones(grid.shape[0])
+
+        ag.lp.image_from_grid_via_batch(
+            light_profiles=light_profiles, grid=grid, image=buffer
+        )
+
+        assert buffer == pytest.approx(image_summed + 1.0, 1.0e-10)
+
+    def test__chameleon_components_sharing_geometry__same_as_summed_images_of_profiles(self):
+
+        light_profiles = [
+            ag.lp.EllipticalChameleon(
+                centre=(0.1, 0.0),
+                elliptical_comps=(0.1, 0.1),
+                intensity=intensity,
+                core_radius_0=core_radius_0,
+                core_radius_1=core_radius_0 + 0.1,
+            )
+            for intensity, core_radius_0 in [(0.3, 0.01), (0.2, 0.1), (0.1, 0.5)]
+        ] + [ag.lp.EllipticalSersic(centre=(0.1, 0.0), elliptical_comps=(0.1, 0.1))]
+
+        grid = np.array([[0.1, 0.2], [1.0, 1.0], [-0.5, 0.3], [0.1, 0.0]])
+
+        image = ag.lp.image_from_grid_via_batch(
+            light_profiles=light_profiles, grid=grid
+        )
+
+        image_summed = sum(
+            [light_profile.image_from_grid(grid=grid) for light_profile in light_profiles]
+        )
+
+        assert image == pytest.approx(image_summed, 1.0e-10)
+
+    def test__float32_grid__image_computed_in_float32(self):
+
+        light_profiles = [
+            ag.lp.EllipticalSersic(centre=(0.0, 0.1), elliptical_comps=(0.2, -0.1)),
+            ag.lp.EllipticalCoreSersic(centre=(0.2, 0.0), intensity=0.3),
+            ag.lp.EllipticalChameleon(centre=(-0.1, 0.0), intensity=0.3),
+            ag.lp.EllipticalGaussian(intensity=1.0, sigma=0.5),
+        ]
+
+        grid = ag.Grid2D.uniform(shape_native=(4, 4), pixel_scales=0.3, sub_size=1)
+
+        image = ag.lp.image_from_grid_via_batch(
+            light_profiles=light_profiles, grid=grid
+        )
+
+        image_float32 = ag.lp.image_from_grid_via_batch(
+            light_profiles=light_profiles, grid=grid.astype("float32")
+        )
+
+        assert image_float32.dtype == np.float32
+        assert image_float32 == pytest.approx(image, 1.0e-4)
+
+        for light_profile in light_profiles:
+
+            image_float32 = light_profile.image_from_grid(grid=grid.astype("float32"))
+
+            assert image_float32.dtype == np.float32
+            assert image_float32 == pytest.approx(
+                light_profile.image_from_grid(grid=grid), 1.0e-4
+            )
+
+    def test__profiles_which_override_their_image_are_not_batched(self):
+
+        class EllipticalSersicDoubled(ag.lp.EllipticalSersic):
+            def image_from_grid_radii(self, grid_radii):
+                return 2.0 * super().image_from_grid_radii(grid_radii=grid_radii)
+
+        assert ag.lp.batch_parameters_from(light_profile=EllipticalSersicDoubled()) is None
+        assert ag.lp.batch_parameters_from(light_profile=ag.lp.EllipticalSersic())[0] == (
+            ag.lp.batch_sersic
+        )
+
+    def test__profiles_without_radial_minimum_in_config__not_batched(self, monkeypatch):
+
+        class EllipticalSersicNotInConfig(ag.lp.EllipticalSersic):
+            pass
+
+        assert (
+            ag.lp.batch_parameters_from(light_profile=EllipticalSersicNotInConfig())
+            is None
+        )
+
+        def radial_minimum_from(cls):
+            raise ValueError()
+
+        monkeypatch.setattr(
+            ag.lp.geometry_profiles.radial_minimum_config,
+            "radial_minimum_from",
+            radial_minimum_from,
+        )
+
+        with pytest.raises(ValueError):
+            ag.lp.batch_parameters_from(light_profile=ag.lp.EllipticalSersic())
+
+
 class TestGrids:
     def test__grid_to_eccentric_radius(self):
         elliptical = ag.lp.EllipticalSersic(elliptical_comps=(0.0, 0.333333))
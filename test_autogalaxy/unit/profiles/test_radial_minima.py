@@ -3,6 +3,7 @@ from __future__ import division, print_function
 from os import path
 from autoconf import conf
 import autogalaxy as ag
+from autogalaxy.profiles import geometry_profiles
 
 import numpy as np
 import pytest
@@ -506,3 +507,40 @@ class TestExternalShear:
         deflections_1 = shear.deflections_from_grid(grid=[[1e-8, 0.0]])
         deflections_0 = shear.deflections_from_grid(grid=[[1e-9, 0.0]])
         assert deflections_0 == pytest.approx(deflections_1, 1.0e-4)
+
+
+class TestRadialMinimumConfig:
+    def test__radial_minimum_cached_per_class_and_reloaded_with_new_config(self):
+
+        radial_minimum_config = geometry_profiles.RadialMinimumConfig()
+
+        assert (
+            radial_minimum_config.radial_minimum_from(cls=ag.lp.EllipticalGaussian)
+            == 0.0001
+        )
+        assert radial_minimum_config.radial_minimum_dict == {
+            ag.lp.EllipticalGaussian: 0.0001
+        }
+
+        radial_minimum_config.radial_minimum_dict[ag.lp.EllipticalGaussian] = 2.0
+
+        assert (
+            radial_minimum_config.radial_minimum_from(cls=ag.lp.EllipticalGaussian)
+            == 2.0
+        )
+
+        radial_minimum_config.reload()
+
+        assert (
+            radial_minimum_config.radial_minimum_from(cls=ag.lp.EllipticalGaussian)
+            == 0.0001
+        )
+
+        conf.instance.push(
+            new_path=path.join("{}".format(directory), "files", "config")
+        )
+
+        assert (
+            radial_minimum_config.radial_minimum_from(cls=ag.lp.EllipticalGaussian)
+            == 1.0
+        )
@@ -0,0 +1,75 @@
+import autogalaxy as ag
+import numpy as np
+import pytest
+
+from autogalaxy.util import interpolation_util
+
+
+def test__deflections_via_adaptive_interpolation_from__error_within_tolerance():
+
+    nfw = ag.mp.EllipticalNFW(
+        centre=(0.1, 0.2), elliptical_comps=(0.1, 0.05), kappa_s=0.1, scale_radius=5.0
+    )
+
+    grid = ag.Grid2D.uniform(shape_native=(50, 50), pixel_scales=0.1, sub_size=4)
+
+    deflections = nfw.deflections_from_grid(grid=grid)
+
+    calls = []
+
+    def func(grid):
+        calls.append(grid.shape[0])
+        return nfw.deflections_from_grid(grid=grid)
+
+    deflections_interpolated = ag.util.interpolation.deflections_via_adaptive_interpolation_from(
+        func=func, grid=grid, tolerance=1.0e-3, centre=nfw.centre
+    )
+
+    assert np.max(np.abs(deflections_interpolated - deflections)) < 1.0e-3
+    assert sum(calls) < grid.shape[0]
+
+
+def test__deflections_via_adaptive_interpolation_from__small_grid_evaluated_directly():
+
+    sis = ag.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+    grid = np.array([[1.0, 1.0], [0.5, -0.5]])
+
+    deflections_interpolated = ag.util.interpolation.deflections_via_adaptive_interpolation_from(
+        func=sis.deflections_from_grid, grid=grid, tolerance=1.0e-4
+    )
+
+    assert deflections_interpolated == pytest.approx(
+        sis.deflections_from_grid(grid=grid), 1.0e-8
+    )
+
+
+def test__galaxy_deflections__uses_adaptive_interpolation_for_flagged_profiles(
+    monkeypatch
+):
+
+    grid = ag.Grid2D.uniform(shape_native=(40, 40), pixel_scales=0.1, sub_size=2)
+
+    sis = ag.mp.SphericalIsothermal(centre=(0.05, 0.05), einstein_radius=1.0)
+    galaxy = ag.Galaxy(redshift=0.5, mass=sis)
+
+    deflections = galaxy.deflections_from_grid(grid=grid)
+
+    monkeypatch.setattr(
+        interpolation_util,
+        "adaptive_interpolation_settings_from_config",
+        lambda: (True, 1.0e-4, 8, 6),
+    )
+
+    calls = []
+
+    def deflections_from_grid(grid):
+        calls.append(grid.shape[0])
+        return ag.mp.SphericalIsothermal.deflections_from_grid(sis, grid=grid)
+
+    monkeypatch.setattr(sis, "deflections_from_grid", deflections_from_grid)
+
+    deflections_interpolated = galaxy.deflections_from_grid(grid=grid)
+
+    assert len(calls) > 1
+    assert np.max(np.abs(deflections_interpolated - deflections)) < 1.0e-4
@@ -0,0 +1,59 @@
+import autogalaxy as ag
+import numpy as np
+import pytest
+
+
+def test__num_threads_from_config__uses_config_and_context_manager():
+
+    assert ag.util.quad.num_threads_from_config() == 1
+
+    with ag.util.quad.quad_grid_threads(num_threads=4):
+
+        assert ag.util.quad.num_threads_from_config() == 4
+
+        with ag.util.quad.quad_grid_threads(num_threads=2):
+            assert ag.util.quad.num_threads_from_config() == 2
+
+        assert ag.util.quad.num_threads_from_config() == 4
+
+    assert ag.util.quad.num_threads_from_config() == 1
+
+
+def test__quad_grid_from__one_thread_calls_pyquad_serially(monkeypatch):
+
+    kwargs_of_calls = []
+
+    def mock_quad_grid(func, a, b, grid, **kwargs):
+        kwargs_of_calls.append(kwargs)
+
+    monkeypatch.setattr(ag.util.quad, "quad_grid", mock_quad_grid)
+
+    grid = np.array([[0.1, 0.2]])
+
+    with ag.util.quad.quad_grid_threads(num_threads=1):
+        ag.util.quad.quad_grid_from(func=None, a=0.0, b=1.0, grid=grid)
+
+    with ag.util.quad.quad_grid_threads(num_threads=3):
+        ag.util.quad.quad_grid_from(func=None, a=0.0, b=1.0, grid=grid)
+
+    assert kwargs_of_calls[0]["parallel"] is False
+    assert "num_threads" not in kwargs_of_calls[0]
+    assert kwargs_of_calls[1]["parallel"] is True
+    assert kwargs_of_calls[1]["num_threads"] == 3
+
+
+def test__quad_grid_from__threaded_same_as_serial():
+
+    nfw = ag.mp.EllipticalNFW(
+        centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), kappa_s=0.2, scale_radius=2.0
+    )
+
+    grid = np.array([[0.1, 0.2], [1.0, -1.5], [-0.5, 0.3], [2.0, 2.5], [-1.0, -0.1]])
+
+    with ag.util.quad.quad_grid_threads(num_threads=1):
+        deflections = nfw.deflections_from_grid_via_integrator(grid=grid)
+
+    with ag.util.quad.quad_grid_threads(num_threads=3):
+        deflections_threaded = nfw.deflections_from_grid_via_integrator(grid=grid)
+
+    assert deflections_threaded == pytest.approx(deflections, 1e-8)
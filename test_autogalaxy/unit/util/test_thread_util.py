@@ -0,0 +1,14 @@
+import autogalaxy as ag
+
+
+def test__num_threads_from_config__section_not_in_config__uses_one_thread():
+
+    threads = ag.util.thread.ConfigThreads(section="not_a_section")
+
+    assert threads.num_threads_from_config() == 1
+
+    with threads.threads(num_threads=3):
+
+        assert threads.num_threads_from_config() == 3
+
+    assert threads.num_threads_from_config() == 1